@@ -9,11 +9,11 @@ from src.config.content import (
     METHODOLOGY_TEXT,
     SUPPORT_TEXT,
 )
-from src.ui.calculator import calculator_mode
-from src.ui.company import company_mode
-from src.ui.expert import expert_mode
-from src.ui.expert_company import expert_company_mode
-from src.ui.token_estimator import token_estimator
+from src.ui.assets import FOOTER_LOGO_PATH, load_image, render_static_assets
+
+# Mode modules are imported on first use: expert_company pulls in st_aggrid and
+# openpyxl, expert pulls in plotly.express and token_estimator pulls in tiktoken, none of
+# which the default Calculator page needs.
 
 
 def _initialize_navigation_state() -> None:
@@ -69,14 +69,22 @@ def _render_calculator() -> None:
 
     if mode == "calculator":
         if st.session_state.is_expert:
+            from src.ui.expert import expert_mode
+
             expert_mode()
         else:
+            from src.ui.calculator import calculator_mode
+
             calculator_mode()
 
     elif mode == "company":
         if st.session_state.is_expert:
+            from src.ui.expert_company import expert_company_mode
+
             expert_company_mode()
         else:
+            from src.ui.company import company_mode
+
             company_mode()
 
 
@@ -96,9 +104,19 @@ def _methodology_page() -> None:
 def _token_estimator_page() -> None:
     with st.container(key="reading_page"):
         st.title("Token estimator")
+        from src.ui.token_estimator import token_estimator
+
         token_estimator()
 
 
+def _leaderboard_page() -> None:
+    with st.container(key="reading_page"):
+        st.title("Leaderboard")
+        from src.ui.leaderboard import leaderboard
+
+        leaderboard()
+
+
 def _support_page() -> None:
     with st.container(key="reading_page"):
         st.title("Support us")
@@ -141,7 +159,7 @@ def _render_footer() -> None:
 
         with brand:
             with st.container(key="footer_brand"):
-                st.image("assets/logo.png", width=400)
+                st.image(load_image(FOOTER_LOGO_PATH), width=400)
 
         with about:
             with st.container(key="footer_about"):
@@ -176,15 +194,14 @@ def main():
         initial_sidebar_state="collapsed",
     )
 
-    with open("src/ui/style.css") as css:
-        st.markdown(f"<style>{css.read()}</style>", unsafe_allow_html=True)
-
+    render_static_assets()
     _initialize_navigation_state()
-    st.logo(
-        "assets/ecologits-logo.png",
-        size="small",
-        link="https://ecologits.ai/",
-    )
+
+    # Precompute the default calculator scenarios once per process, in the
+    # background, before any page renders
+    from src.ui.calculator import start_scenario_matrix
+
+    start_scenario_matrix()
 
     page = st.navigation(
         [
@@ -196,6 +213,7 @@ def main():
                 title="Token estimator",
                 url_path="token-estimator",
             ),
+            st.Page(_leaderboard_page, title="Leaderboard", url_path="leaderboard"),
             st.Page(
                 _support_page,
                 title="Support us",
@@ -0,0 +1,279 @@
+"""Headless command line interface.
+
+Usage:
+    python -m src.cli batch usage.csv --output impacts.parquet --summary summary.xlsx
+"""
+
+import argparse
+import logging
+import sys
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.config.constants import TIME_HORIZONS
+from src.core.batch import (
+    COL_IMPACTS_AVAILABLE,
+    COL_NUM_USERS,
+    COL_OUTPUT_TOKENS,
+    IMPACT_COLUMNS,
+    compute_output_tokens,
+    compute_usage_impacts,
+    normalize_locations,
+    summarize_usage_impacts,
+)
+from src.core.executor import CoefficientsExecutor
+from src.core.export import XlsxStreamWriter
+from src.repositories.models import ModelCatalog, load_models
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+SUPPORTED_FORMATS = (".csv", ".parquet", ".xlsx")
+
+
+def _check_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported file format '{suffix}' for {path}, "
+            f"expected one of {', '.join(SUPPORTED_FORMATS)}"
+        )
+    return suffix
+
+
+def iter_usage_chunks(path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Read usage rows in chunks indexed by their 0-based position in the file.
+
+    CSV and Parquet files are streamed; XLSX files are read at once and split.
+    """
+    suffix = _check_format(path)
+    if suffix == ".csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+        return
+
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        start = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+        return
+
+    df = pd.read_excel(path)
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def _parquet_table(chunk: pd.DataFrame):
+    """Convert a result chunk to an Arrow table whose schema only depends on its columns.
+
+    Result columns get fixed types; every other column, e.g. free-text notes, is
+    written as strings, so an all-null or differently inferred column in a later
+    chunk cannot change the schema mid-file.
+    """
+    import pyarrow as pa
+
+    types = {
+        COL_NUM_USERS: pa.int64(),
+        COL_OUTPUT_TOKENS: pa.int64(),
+        COL_IMPACTS_AVAILABLE: pa.bool_(),
+        **dict.fromkeys(IMPACT_COLUMNS, pa.float64()),
+    }
+    arrays = {}
+    for name in chunk.columns:
+        values = chunk[name]
+        type_ = types.get(name, pa.string())
+        if pa.types.is_string(type_):
+            values = values.astype("string")
+        elif pa.types.is_integer(type_):
+            values = pd.to_numeric(values)
+        arrays[str(name)] = pa.array(values, type=type_, from_pandas=True)
+    return pa.table(arrays)
+
+
+class ResultWriter:
+    """Append result chunks to a CSV, Parquet or XLSX file.
+
+    Chunks are streamed as they arrive; XLSX files are saved on close.
+    """
+
+    def __init__(self, path: Path, sheet_name: str = "Impacts"):
+        self.path = path
+        self.sheet_name = sheet_name
+        self._format = _check_format(path)
+        self._rows = 0
+        # pyarrow.parquet.ParquetWriter, pyarrow being imported on first use
+        self._parquet_writer: Any = None
+        self._xlsx_writer: XlsxStreamWriter | None = None
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self._format == ".csv":
+            first = self._rows == 0
+            chunk.to_csv(self.path, mode="w" if first else "a", header=first, index=False)
+        elif self._format == ".parquet":
+            import pyarrow.parquet as pq
+
+            table = _parquet_table(chunk)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            if self._xlsx_writer is None:
+                self._xlsx_writer = XlsxStreamWriter()
+            self._xlsx_writer.append(self.sheet_name, chunk)
+        self._rows += len(chunk)
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if self._format == ".xlsx":
+            if self._xlsx_writer is None:
+                self._xlsx_writer = XlsxStreamWriter()
+                self._xlsx_writer.append(self.sheet_name, pd.DataFrame())
+            self._xlsx_writer.save(self.path)
+
+    def __enter__(self) -> "ResultWriter":
+        """Return the writer itself."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the writer, saving XLSX files."""
+        self.close()
+
+
+def check_usage_rows(path: Path, chunk_size: int) -> None:
+    """Check the usage type, intensity and number of users of every row of a file.
+
+    Raises:
+        ValueError: For the first chunk with invalid rows, reported by 1-based index.
+    """
+    for chunk in iter_usage_chunks(path, chunk_size):
+        compute_output_tokens(chunk)
+
+
+def run_batch(
+    input_path: Path,
+    output_path: Path | None,
+    summary_path: Path | None,
+    time_horizon_label: str = "Monthly",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    catalog: ModelCatalog | None = None,
+) -> pd.DataFrame:
+    """Compute impacts of every usage row of a file and write the results.
+
+    Args:
+        input_path: CSV, Parquet or XLSX file with the expert company grid columns.
+        output_path: Optional file receiving per-row results.
+        summary_path: Optional file receiving results aggregated by provider,
+            model and usage location.
+        time_horizon_label: Key of `TIME_HORIZONS` the impacts are computed over.
+        chunk_size: Number of rows read and computed at once.
+        catalog: Model catalog, defaults to the full ecologits repository.
+
+    Returns:
+        The aggregated summary.
+
+    Raises:
+        ValueError: If a row has an unknown usage type or intensity, or an
+            invalid number of users; nothing is written then.
+    """
+    if catalog is None:
+        catalog = ModelCatalog.from_dataframe(load_models(filter_main=False))
+    time_horizon_days = TIME_HORIZONS[time_horizon_label]
+    # Fail before writing anything rather than leave partial results behind
+    check_usage_rows(input_path, chunk_size)
+
+    writer = ResultWriter(output_path) if output_path is not None else None
+    executor = CoefficientsExecutor()
+    partial_summaries = []
+    n_rows = n_unavailable = 0
+    try:
+        for chunk in iter_usage_chunks(input_path, chunk_size):
+            chunk = normalize_locations(chunk)
+            impacts = compute_usage_impacts(catalog, chunk, time_horizon_days, executor=executor)
+            results = impacts.to_frame(chunk)
+            if writer is not None:
+                writer.write(results)
+            partial_summaries.append(summarize_usage_impacts(results))
+            n_rows += len(results)
+            n_unavailable += int((~results[COL_IMPACTS_AVAILABLE]).sum())
+    finally:
+        if writer is not None:
+            writer.close()
+
+    summary = (
+        summarize_usage_impacts(pd.concat(partial_summaries, ignore_index=True))
+        if partial_summaries
+        else pd.DataFrame()
+    )
+    if summary_path is not None:
+        sheet_name = f"{time_horizon_label} Summary"
+        with ResultWriter(summary_path, sheet_name=sheet_name) as summary_writer:
+            summary_writer.write(summary)
+
+    logger.info(
+        "Computed impacts for %d rows (%d unavailable): %d distinct model/zone fits",
+        n_rows,
+        n_unavailable,
+        executor.fitted_items,
+    )
+    return summary
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch = subparsers.add_parser(
+        "batch",
+        help="Compute impacts for a file of usage rows.",
+        description=(
+            "Compute impacts for a CSV/Parquet/XLSX file with the expert company grid "
+            "columns (Provider, Model, Usage Type, Usage Intensity, Number of Users, "
+            "Usage Location). Impacts are in kWh, kgCO2eq, kgSbeq, MJ and L."
+        ),
+    )
+    batch.add_argument("input", type=Path, help="Usage rows (.csv, .parquet or .xlsx).")
+    batch.add_argument("-o", "--output", type=Path, help="Per-row results file.")
+    batch.add_argument("-s", "--summary", type=Path, help="Aggregated results file.")
+    batch.add_argument(
+        "--time-horizon",
+        choices=list(TIME_HORIZONS),
+        default="Monthly",
+        help="Time horizon of the usage (default: Monthly).",
+    )
+    batch.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Rows processed at once (default: {DEFAULT_CHUNK_SIZE}).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    if args.output is None and args.summary is None:
+        print("Nothing to do: pass --output and/or --summary.", file=sys.stderr)
+        return 2
+
+    try:
+        run_batch(args.input, args.output, args.summary, args.time_horizon, args.chunk_size)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,471 @@
+"""Vectorized impact computation for company usage rows.
+
+Rows use the columns of the expert company grid. Impacts of all rows sharing a
+(model, electricity mix zone) pair are evaluated from the same cached
+`ImpactCoefficients`, so ecologits is called once per pair rather than per row.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.config.constants import COUNTRY_CODES, PROMPTS, USAGE_INTENSITY
+from src.core.coefficients import ImpactCoefficients, get_impact_coefficients
+from src.core.executor import CoefficientsExecutor, WorkItem
+from src.core.formatting import CRITERIA, DEFAULT_UNITS, STATS, format_impacts_batch
+from src.repositories.models import ModelCatalog, get_raw_model_names
+
+COL_PROVIDER = "Provider"
+COL_MODEL = "Model"
+COL_USAGE_TYPE = "Usage Type"
+COL_USAGE_INTENSITY = "Usage Intensity"
+COL_NUM_USERS = "Number of Users"
+COL_LOCATION = "Usage Location"
+
+USAGE_COLUMNS = [
+    COL_PROVIDER,
+    COL_MODEL,
+    COL_USAGE_TYPE,
+    COL_USAGE_INTENSITY,
+    COL_NUM_USERS,
+    COL_LOCATION,
+]
+GROUP_COLUMNS = [COL_PROVIDER, COL_MODEL, COL_LOCATION]
+
+COL_OUTPUT_TOKENS = "Output Tokens"
+COL_IMPACTS_AVAILABLE = "Impacts Available"
+
+# Columns of `validate_usage` reports
+COL_ROW = "Row"
+COL_COLUMN = "Column"
+COL_VALUE = "Value"
+COL_PROBLEM = "Problem"
+
+DEFAULT_LOCATION = COUNTRY_CODES[0][0]  # "🌎 World"
+DEFAULT_ZONE = "WOR"
+
+# Usage locations may be given as grid labels ("🇫🇷 France") or alpha-3 codes ("FRA")
+_LOCATION_TO_ZONE = {**dict(COUNTRY_CODES), **{code: code for _, code in COUNTRY_CODES}}
+_PROMPT_OUTPUT_TOKENS = {p.label: p.output_tokens for p in PROMPTS}
+
+# Lookup tables of the token planner: label/key position -> tokens/count
+TOKEN_KINDS = ("output_tokens", "input_tokens", "cached_tokens")
+_PROMPT_INDEX = pd.Index([p.label for p in PROMPTS])
+_PROMPT_TOKENS = np.array([[getattr(p, kind) for kind in TOKEN_KINDS] for p in PROMPTS])
+_INTENSITY_INDEX = pd.Index(list(USAGE_INTENSITY))
+_INTENSITY_COUNTS = np.array(list(USAGE_INTENSITY.values()))
+
+# Maximum number of offending rows quoted in validation errors
+_MAX_REPORTED_ROWS = 10
+
+# ecologits evaluations per coefficient fit: at zero and at the reference token count
+FIT_ECOLOGITS_CALLS = 2
+
+
+def impact_column(criterion: str, stat: str = "mean") -> str:
+    """Return the result column holding a criterion statistic, e.g. "energy_min_kWh"."""
+    name = criterion if stat == "mean" else f"{criterion}_{stat}"
+    return f"{name}_{DEFAULT_UNITS[criterion]}"
+
+
+IMPACT_COLUMNS = [impact_column(criterion, stat) for criterion in CRITERIA for stat in STATS]
+
+
+@dataclass(frozen=True)
+class UsagePlan:
+    """Usage rows collapsed into distinct (provider, model, zone) work items.
+
+    Attributes:
+        groups: Raw (provider, model, zone) work item -> indices of its rows.
+        n_rows: Number of planned rows, including rows with unknown models.
+    """
+
+    groups: dict[WorkItem, np.ndarray]
+    n_rows: int
+
+    @classmethod
+    def concat(cls, plans: Iterable["UsagePlan"]) -> "UsagePlan":
+        """Merge plans of consecutive row batches into the plan of all their rows."""
+        parts: dict[WorkItem, list[np.ndarray]] = {}
+        offset = 0
+        for plan in plans:
+            for item, indices in plan.groups.items():
+                parts.setdefault(item, []).append(indices + offset)
+            offset += plan.n_rows
+        return cls(
+            groups={item: np.concatenate(indices) for item, indices in parts.items()},
+            n_rows=offset,
+        )
+
+    @property
+    def n_resolved_rows(self) -> int:
+        """Number of rows whose model is in the catalog."""
+        return sum(len(indices) for indices in self.groups.values())
+
+    @property
+    def ecologits_calls(self) -> int:
+        """Number of ecologits evaluations needed to fit every group (before caching)."""
+        return FIT_ECOLOGITS_CALLS * len(self.groups)
+
+    @property
+    def avoided_calls(self) -> int:
+        """Number of ecologits evaluations saved over one call per row; negative for tiny inputs."""
+        return self.n_resolved_rows - self.ecologits_calls
+
+
+@dataclass(frozen=True)
+class UsageImpacts:
+    """Impacts of a batch of usage rows.
+
+    Attributes:
+        output_tokens: Output tokens of each row over the time horizon.
+        values: Raw magnitudes of shape (rows, len(CRITERIA), len(STATS)) in the
+            default ecologits units, NaN where impacts are not available.
+        ranges: Whether each row reports min/max ranges.
+        available: Whether impacts could be computed for each row.
+        plan: Work items the rows were collapsed into.
+    """
+
+    output_tokens: np.ndarray
+    values: np.ndarray
+    ranges: np.ndarray
+    available: np.ndarray
+    plan: UsagePlan
+
+    def to_frame(self, usage: pd.DataFrame) -> pd.DataFrame:
+        """Return `usage` with output tokens, availability and impact columns appended."""
+        result = usage.reset_index(drop=True).copy()
+        if COL_LOCATION not in result:
+            result[COL_LOCATION] = DEFAULT_LOCATION
+        result[COL_OUTPUT_TOKENS] = self.output_tokens
+        result[COL_IMPACTS_AVAILABLE] = self.available
+        flat = self.values.reshape(len(self.values), -1)
+        for k, column in enumerate(IMPACT_COLUMNS):
+            result[column] = flat[:, k]
+        return result
+
+
+def _invalid_rows_error(message: str, usage: pd.DataFrame, mask: np.ndarray) -> ValueError:
+    rows = (usage.index[mask] + 1).tolist()
+    shown = ", ".join(str(r) for r in rows[:_MAX_REPORTED_ROWS])
+    more = f" and {len(rows) - _MAX_REPORTED_ROWS} more" if len(rows) > _MAX_REPORTED_ROWS else ""
+    return ValueError(f"{message} in row(s) {shown}{more}")
+
+
+@dataclass(frozen=True)
+class TokenPlan:
+    """Token counts of usage rows.
+
+    Attributes:
+        tokens: Counts of shape (rows, len(TOKEN_KINDS)), zero for invalid rows.
+        unknown_usage_type: Rows whose usage type is not a `PROMPTS` label.
+        unknown_intensity: Rows whose intensity is not a `USAGE_INTENSITY` key.
+        invalid_users: Rows whose number of users is not a non-negative integer.
+    """
+
+    tokens: np.ndarray
+    unknown_usage_type: np.ndarray
+    unknown_intensity: np.ndarray
+    invalid_users: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Rows whose token counts could be computed."""
+        valid: np.ndarray = ~(self.unknown_usage_type | self.unknown_intensity | self.invalid_users)
+        return valid
+
+    @property
+    def output_tokens(self) -> np.ndarray:
+        return self.tokens[:, TOKEN_KINDS.index("output_tokens")]
+
+    @property
+    def total_tokens(self) -> np.ndarray:
+        totals: np.ndarray = self.tokens.sum(axis=1)
+        return totals
+
+    def row_tokens(self, index: int) -> dict[str, int]:
+        """Return the token counts of one row, keyed by kind and "total_tokens"."""
+        counts = self.tokens[index].tolist()
+        return {**dict(zip(TOKEN_KINDS, counts, strict=True)), "total_tokens": sum(counts)}
+
+
+def plan_tokens(usage: pd.DataFrame, time_horizon_days: int = 1) -> TokenPlan:
+    """Compute the tokens of every usage row over the time horizon in one pass.
+
+    Usage types and intensities are looked up by position in precomputed tables;
+    invalid rows are flagged instead of raising.
+
+    Args:
+        usage: Rows with at least the usage type, intensity and number of users columns.
+        time_horizon_days: Number of working days in the time horizon.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+    missing = [c for c in (COL_USAGE_TYPE, COL_USAGE_INTENSITY, COL_NUM_USERS) if c not in usage]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+    prompt_index = _PROMPT_INDEX.get_indexer(usage[COL_USAGE_TYPE])
+    intensity_index = _INTENSITY_INDEX.get_indexer(usage[COL_USAGE_INTENSITY])
+    num_users = pd.to_numeric(usage[COL_NUM_USERS], errors="coerce").to_numpy(dtype=np.float64)
+
+    unknown_usage_type = prompt_index < 0
+    unknown_intensity = intensity_index < 0
+    invalid_users = ~np.isfinite(num_users) | (num_users < 0) | (num_users != np.floor(num_users))
+    valid = ~(unknown_usage_type | unknown_intensity | invalid_users)
+
+    multiplier = np.where(
+        valid, _INTENSITY_COUNTS[intensity_index] * np.nan_to_num(num_users), 0
+    ).astype(np.int64)
+    tokens = _PROMPT_TOKENS[prompt_index] * (multiplier * time_horizon_days)[:, np.newaxis]
+    return TokenPlan(
+        tokens=tokens,
+        unknown_usage_type=unknown_usage_type,
+        unknown_intensity=unknown_intensity,
+        invalid_users=invalid_users,
+    )
+
+
+def compute_output_tokens(usage: pd.DataFrame, time_horizon_days: int = 1) -> np.ndarray:
+    """Compute output tokens of every usage row over the time horizon.
+
+    Args:
+        usage: Rows with at least the usage type, intensity and number of users columns.
+        time_horizon_days: Number of working days in the time horizon.
+
+    Returns:
+        Integer token counts, one per row.
+
+    Raises:
+        ValueError: If a row has an unknown usage type or intensity, or an
+            invalid number of users. Rows are reported by 1-based index label.
+    """
+    plan = plan_tokens(usage, time_horizon_days)
+    for message, mask in (
+        ("Unknown usage type", plan.unknown_usage_type),
+        ("Unknown usage intensity", plan.unknown_intensity),
+        ("Invalid number of users", plan.invalid_users),
+    ):
+        if mask.any():
+            raise _invalid_rows_error(message, usage, mask)
+    return plan.output_tokens
+
+
+def _is_blank(values: pd.Series) -> np.ndarray:
+    blank: np.ndarray = (values.isna() | (values.astype(str).str.strip() == "")).to_numpy()
+    return blank
+
+
+def validate_usage(catalog: ModelCatalog, usage: pd.DataFrame) -> pd.DataFrame:
+    """Check every cell of usage rows against the catalog and the grid choices.
+
+    Each column is checked at once: providers and (provider, model) pairs against
+    the catalog, usage types against `PROMPTS`, intensities against
+    `USAGE_INTENSITY`, locations against `COUNTRY_CODES` labels or codes (a blank
+    location means the world mix) and numbers of users with the `plan_tokens`
+    rule, whole numbers of at least 0.
+
+    Returns:
+        One row per invalid cell with its 1-based row label, column, value and
+        problem; empty when the rows are valid.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+    missing = [c for c in USAGE_COLUMNS if c != COL_LOCATION and c not in usage]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+    providers = usage[COL_PROVIDER]
+    known_pairs = pd.MultiIndex.from_tuples(list(catalog.raw_names), names=["p", "m"])
+    pairs = pd.MultiIndex.from_arrays([providers, usage[COL_MODEL]], names=["p", "m"])
+    known_provider = providers.isin(list(catalog.provider_models)).to_numpy()
+
+    checks = [
+        (COL_PROVIDER, ~known_provider, "Unknown provider"),
+        (COL_MODEL, known_provider & ~pairs.isin(known_pairs), "Unknown model for provider"),
+        (
+            COL_USAGE_TYPE,
+            ~usage[COL_USAGE_TYPE].isin(list(_PROMPT_OUTPUT_TOKENS)),
+            "Unknown usage type",
+        ),
+        (
+            COL_USAGE_INTENSITY,
+            ~usage[COL_USAGE_INTENSITY].isin(list(USAGE_INTENSITY)),
+            "Unknown usage intensity",
+        ),
+        (COL_NUM_USERS, plan_tokens(usage).invalid_users, "Expected a whole number of at least 0"),
+    ]
+    if COL_LOCATION in usage:
+        locations = usage[COL_LOCATION]
+        unknown = ~locations.isin(list(_LOCATION_TO_ZONE)).to_numpy() & ~_is_blank(locations)
+        checks.append((COL_LOCATION, unknown, "Unknown usage location"))
+
+    reports = []
+    for column, invalid, problem in checks:
+        invalid = np.asarray(invalid, dtype=bool)
+        blank = _is_blank(usage[column]) if column != COL_LOCATION else np.zeros_like(invalid)
+        reports.append(
+            pd.DataFrame(
+                {
+                    COL_ROW: usage.index[invalid] + 1,
+                    COL_COLUMN: column,
+                    COL_VALUE: usage[column][invalid].astype(object).to_numpy(),
+                    COL_PROBLEM: np.where(blank[invalid], "Missing value", problem),
+                }
+            )
+        )
+    return (
+        pd.concat(reports, ignore_index=True)
+        .sort_values([COL_ROW], kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def normalize_locations(usage: pd.DataFrame) -> pd.DataFrame:
+    """Return `usage` with locations as grid labels, blank or missing ones set to the world."""
+    labels = {code: label for label, code in COUNTRY_CODES}
+    result = usage.copy()
+    if COL_LOCATION not in result:
+        result[COL_LOCATION] = DEFAULT_LOCATION
+    locations = result[COL_LOCATION].where(~_is_blank(result[COL_LOCATION]), DEFAULT_LOCATION)
+    result[COL_LOCATION] = locations.replace(labels)
+    return result
+
+
+def location_zones(usage: pd.DataFrame) -> np.ndarray:
+    """Return the electricity mix zone of every row, defaulting to the world mix."""
+    if COL_LOCATION not in usage:
+        return np.full(len(usage), DEFAULT_ZONE, dtype=object)
+    locations = usage[COL_LOCATION].map(_LOCATION_TO_ZONE)
+    zones: np.ndarray = locations.fillna(DEFAULT_ZONE).to_numpy(dtype=object)
+    return zones
+
+
+def plan_usage_impacts(catalog: ModelCatalog, usage: pd.DataFrame) -> UsagePlan:
+    """Collapse usage rows into distinct (provider, model, zone) work items.
+
+    Rows differing only in usage type, intensity or number of users share a work
+    item. Rows whose model is not in the catalog are left out of every group.
+    """
+    keys = pd.DataFrame(
+        {
+            "provider": usage[COL_PROVIDER].to_numpy(),
+            "model": usage[COL_MODEL].to_numpy(),
+            "zone": location_zones(usage),
+        }
+    )
+    groups: dict[WorkItem, list[np.ndarray]] = {}
+    by_key = keys.groupby(["provider", "model", "zone"], sort=False, dropna=False).indices
+    for (provider, model, zone), indices in by_key.items():
+        raw_names = get_raw_model_names(catalog, provider, model)
+        if raw_names is not None:
+            groups.setdefault((*raw_names, zone), []).append(indices)
+
+    return UsagePlan(
+        groups={item: np.sort(np.concatenate(parts)) for item, parts in groups.items()},
+        n_rows=len(usage),
+    )
+
+
+def evaluate_plan(
+    plan: UsagePlan,
+    coefficients_by_item: dict[WorkItem, ImpactCoefficients | None],
+    output_tokens: np.ndarray,
+) -> UsageImpacts:
+    """Evaluate the impacts of every planned row from its group's coefficients.
+
+    Args:
+        plan: Plan of the usage rows.
+        coefficients_by_item: Fitted coefficients of each work item of the plan,
+            None for work items ecologits cannot evaluate.
+        output_tokens: Output tokens of each row.
+    """
+    output_tokens = np.asarray(output_tokens)
+    values = np.full((plan.n_rows, len(CRITERIA), len(STATS)), np.nan)
+    ranges = np.zeros(plan.n_rows, dtype=bool)
+    available = np.zeros(plan.n_rows, dtype=bool)
+
+    for item, indices in plan.groups.items():
+        coefficients = coefficients_by_item.get(item)
+        if coefficients is None:
+            continue
+        values[indices] = coefficients.evaluate(output_tokens[indices])
+        ranges[indices] = coefficients.ranges
+        available[indices] = True
+
+    return UsageImpacts(
+        output_tokens=output_tokens,
+        values=values,
+        ranges=ranges,
+        available=available,
+        plan=plan,
+    )
+
+
+def fetch_coefficients(
+    plan: UsagePlan, executor: CoefficientsExecutor | None = None
+) -> dict[WorkItem, ImpactCoefficients | None]:
+    """Fit the coefficients of every work item of a plan, on `executor` if given."""
+    if executor is not None:
+        return executor.fetch(plan.groups)
+    return {item: get_impact_coefficients(*item) for item in plan.groups}
+
+
+def compute_usage_impacts(
+    catalog: ModelCatalog,
+    usage: pd.DataFrame,
+    time_horizon_days: int = 1,
+    executor: CoefficientsExecutor | None = None,
+) -> UsageImpacts:
+    """Compute impacts of usage rows, fitting each (model, zone) pair once.
+
+    Args:
+        catalog: Model catalog used to resolve provider and model names.
+        usage: Rows with the expert company grid columns.
+        time_horizon_days: Number of working days in the time horizon.
+        executor: Optional executor memoizing coefficients; they come from the
+            `get_impact_coefficients` cache by default.
+
+    Returns:
+        Per-row output tokens and impacts over the time horizon.
+    """
+    output_tokens = compute_output_tokens(usage, time_horizon_days)
+    plan = plan_usage_impacts(catalog, usage)
+    return evaluate_plan(plan, fetch_coefficients(plan, executor), output_tokens)
+
+
+def summarize_usage_impacts(results: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate per-row results by provider, model and usage location.
+
+    Impacts are summed over rows where they are available and left NaN for
+    groups without any.
+    """
+    columns = [COL_OUTPUT_TOKENS, *IMPACT_COLUMNS]
+    return results.groupby(GROUP_COLUMNS, as_index=False, sort=False, dropna=False)[columns].sum(
+        min_count=1
+    )
+
+
+def format_impact_columns(summary: pd.DataFrame) -> pd.DataFrame:
+    """Format the mean impacts of a summary as "<value> <unit>" text, one column per criterion.
+
+    Every value is scaled to its own display unit with the `format_impacts` thresholds,
+    in one pass per criterion. Missing impacts stay missing.
+    """
+    scaled = format_impacts_batch(
+        {c: summary[impact_column(c)].to_numpy(dtype=np.float64) for c in CRITERIA}
+    )
+    columns = {}
+    for criterion in CRITERIA:
+        text = np.char.add(
+            np.char.add(np.char.mod("%.3g", scaled[criterion]), " "),
+            scaled[f"{criterion}_unit"].astype(str),
+        )
+        # An object Series keeps None placeholders, which pandas would turn into NaN
+        column = pd.Series(text, index=summary.index, dtype=object)
+        columns[criterion] = column.where(~np.isnan(scaled[criterion]), None)
+    return pd.DataFrame(columns, index=summary.index)
@@ -0,0 +1,123 @@
+"""Bounded in-process cache with optional expiry and usage counters."""
+
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a `TTLCache` since its creation or last clear.
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups that computed their value, including expired entries.
+        evictions: Least recently used entries dropped to stay within `maxsize`.
+        expirations: Entries found older than `ttl` and recomputed.
+        size: Entries currently stored.
+        maxsize: Maximum number of entries.
+        ttl: Entry lifetime in seconds, None if entries never expire.
+        tag: Label of the cached data, e.g. the version it was computed with.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+    ttl: float | None
+    tag: str
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache[V]:
+    """Thread-safe LRU cache whose entries optionally expire after `ttl` seconds.
+
+    Values are computed outside the lock. Concurrent misses on the same key wait
+    for the first one to compute it instead of computing it again.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        tag: str = "",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl or None
+        self.tag = tag
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._pending: dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], V]) -> V:
+        """Return the cached value of `key`, computing and storing it on a miss."""
+        while True:
+            now = self._clock()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    stored_at, value = entry
+                    if self.ttl is None or now - stored_at < self.ttl:
+                        self._entries.move_to_end(key)
+                        self._hits += 1
+                        return value
+                    del self._entries[key]
+                    self._expirations += 1
+                pending = self._pending.get(key)
+                if pending is None:
+                    pending = self._pending[key] = threading.Event()
+                    self._misses += 1
+                    break
+            # Another thread is computing this key; look it up again once done
+            pending.wait()
+
+        try:
+            value = compute()
+            with self._lock:
+                self._entries[key] = (self._clock(), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+        return value
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                ttl=self.ttl,
+                tag=self.tag,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries currently stored, expired ones included."""
+        return len(self._entries)
@@ -0,0 +1,132 @@
+"""Per-token impact coefficients for a (model, electricity mix zone) pair.
+
+With an unbounded request latency, every impact computed by ecologits for an LLM
+request is an affine function of the output token count: the generation latency
+is `tokens / tps + ttft`, and both energy and embodied impacts are proportional
+to it. Two ecologits evaluations are therefore enough to recover the exact
+impacts for any token count.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from ecologits.impacts.modeling import GWP, PE, WCF, ADPe, Energy
+from ecologits.tracers.utils import ImpactsOutput
+from ecologits.utils.range_value import RangeValue
+
+from src.core.formatting import CRITERIA, STATS
+from src.core.impact_calculator import cached_llm_impacts
+
+# Token count of the second sample used to fit the slope
+REFERENCE_TOKEN_COUNT = 1_000_000
+
+COEFFICIENTS_CACHE_SIZE = 1024
+
+_IMPACT_TYPES = {
+    "energy": Energy,
+    "gwp": GWP,
+    "adpe": ADPe,
+    "pe": PE,
+    "wcf": WCF,
+}
+
+
+def impacts_to_array(impacts: ImpactsOutput) -> np.ndarray:
+    """Return the (mean, min, max) magnitudes of each criterion as a (5, 3) array.
+
+    Scalar values are repeated for min and max.
+    """
+    values = np.empty((len(CRITERIA), len(STATS)), dtype=np.float64)
+    for i, criterion in enumerate(CRITERIA):
+        value = getattr(impacts, criterion).value
+        if isinstance(value, RangeValue):
+            values[i] = (value.mean, value.min, value.max)
+        else:
+            values[i] = value
+    return values
+
+
+@dataclass(frozen=True)
+class ImpactCoefficients:
+    """Affine model `impacts = slope * output_token_count + intercept`.
+
+    Attributes:
+        slope: Impacts per output token, shape (len(CRITERIA), len(STATS)).
+        intercept: Impacts of a request generating no token (time to first token).
+        ranges: Whether ecologits reports min/max ranges for this model.
+        warnings: Model and electricity mix warnings reported by ecologits.
+    """
+
+    slope: np.ndarray
+    intercept: np.ndarray
+    ranges: bool
+    warnings: tuple = ()
+
+    def evaluate(self, output_token_count) -> np.ndarray:
+        """Evaluate impacts for a scalar or an array of output token counts.
+
+        Args:
+            output_token_count: Token count(s), any array-like shape `S`.
+
+        Returns:
+            Impact magnitudes of shape `S + (len(CRITERIA), len(STATS))`, in the
+            default ecologits units (kWh, kgCO2eq, kgSbeq, MJ, L).
+        """
+        tokens = np.asarray(output_token_count, dtype=np.float64)
+        values: np.ndarray = tokens[..., None, None] * self.slope + self.intercept
+        return values
+
+    def impacts_at(self, output_token_count: int) -> ImpactsOutput:
+        """Build the ecologits output for a single token count."""
+        values = self.evaluate(output_token_count)
+        fields: dict = {}
+        for i, criterion in enumerate(CRITERIA):
+            _, low, high = values[i]
+            # max() guards against rounding flipping bounds of a degenerate range
+            value = RangeValue(min=low, max=max(low, high)) if self.ranges else float(low)
+            fields[criterion] = _IMPACT_TYPES[criterion](value=value)
+        return ImpactsOutput(**fields, warnings=list(self.warnings) or None)
+
+
+def fit_impact_coefficients(
+    at_zero: ImpactsOutput,
+    at_reference: ImpactsOutput,
+    reference_token_count: int = REFERENCE_TOKEN_COUNT,
+) -> ImpactCoefficients:
+    """Fit coefficients from impacts computed at zero and at a reference token count."""
+    intercept = impacts_to_array(at_zero)
+    slope = (impacts_to_array(at_reference) - intercept) / reference_token_count
+    # Coefficients are shared through caches, so guard them against in-place edits
+    intercept.setflags(write=False)
+    slope.setflags(write=False)
+    return ImpactCoefficients(
+        slope=slope,
+        intercept=intercept,
+        ranges=at_reference.energy is not None
+        and isinstance(at_reference.energy.value, RangeValue),
+        warnings=tuple(at_reference.warnings or ()),
+    )
+
+
+@lru_cache(maxsize=COEFFICIENTS_CACHE_SIZE)
+def get_impact_coefficients(
+    provider: str,
+    model_name: str,
+    electricity_mix_zone: str,
+) -> ImpactCoefficients | None:
+    """Return the impact coefficients of a model in a zone, or None on ecologits errors.
+
+    Args:
+        provider: Raw ecologits provider name.
+        model_name: Raw ecologits model name.
+        electricity_mix_zone: ISO 3166-1 alpha-3 code of the electricity mix zone.
+    """
+    at_zero = cached_llm_impacts(provider, model_name, electricity_mix_zone, 0)
+    at_reference = cached_llm_impacts(
+        provider, model_name, electricity_mix_zone, REFERENCE_TOKEN_COUNT
+    )
+    if at_zero.has_errors or at_reference.has_errors:
+        return None
+    return fit_impact_coefficients(at_zero, at_reference)
@@ -150,3 +150,39 @@ def format_wue_eq_drops(wcf: Quantity) -> Quantity:
 def format_wue_eq_pints(wcf: Quantity) -> Quantity:
     wue_eq = wcf.to("L")
     return wue_eq / BEER_PINT
+
+
+# Impact criterion and formatter of each equivalent type
+EQUIVALENT_FORMATTERS = {
+    EquivalentType.EV: ("energy", format_energy_eq_electric_vehicle),
+    EquivalentType.SPORT: ("energy", format_energy_eq_physical_activity),
+    EquivalentType.EPROD: ("energy", format_energy_eq_electricity_production),
+    EquivalentType.ECONS: ("energy", format_energy_eq_electricity_consumption_ireland),
+    EquivalentType.STREAMING: ("gwp", format_gwp_eq_streaming),
+    EquivalentType.PLANE: ("gwp", format_gwp_eq_airplane_paris_nyc),
+    EquivalentType.THERMIC_VEHICLE: ("gwp", format_gwp_eq_vehicle),
+    EquivalentType.NVIDIA: ("adpe", format_adpe_eq_nvidia),
+    EquivalentType.IPHONE: ("adpe", format_adpe_eq_iphone),
+    EquivalentType.POOL: ("wcf", format_wue_eq_pools),
+    EquivalentType.DROP: ("wcf", format_wue_eq_drops),
+    EquivalentType.PINTS: ("wcf", format_wue_eq_pints),
+}
+
+
+def compute_equivalent(impacts, equivalent_type: EquivalentType):
+    """Compute one equivalent of formatted impacts, as returned by its formatter."""
+    criterion, formatter = EQUIVALENT_FORMATTERS[equivalent_type]
+    return formatter(getattr(impacts, criterion))
+
+
+def compute_equivalents(impacts, modes=("at_scale", "unit")) -> dict[EquivalentType, object]:
+    """Compute every equivalent displayed in the given `EQ_KPIS` modes."""
+    types = dict.fromkeys(
+        value
+        for mode in modes
+        for value in EQ_KPIS[mode].values()
+        if isinstance(value, EquivalentType)
+    )
+    return {
+        equivalent_type: compute_equivalent(impacts, equivalent_type) for equivalent_type in types
+    }
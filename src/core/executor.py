@@ -0,0 +1,62 @@
+"""Memoized fitting of impact coefficients.
+
+Each distinct (provider, model, zone) work item costs two ecologits evaluations;
+everything downstream is cheap array arithmetic on the fitted coefficients. A fit
+takes about a millisecond, less than sending it to a worker process and back, so
+work items are fitted serially in the calling process.
+"""
+
+import threading
+
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from src.core.coefficients import (
+    COEFFICIENTS_CACHE_SIZE,
+    ImpactCoefficients,
+    get_impact_coefficients,
+)
+
+# (provider, model_name, electricity_mix_zone), with raw ecologits names
+WorkItem = tuple[str, str, str]
+
+
+class CoefficientsExecutor:
+    """Fit impact coefficients for work items, memoizing the results.
+
+    The `max_results` most recently used results are kept, so a work item is
+    fitted once however many inputs it appears in. An executor may be shared
+    between threads.
+    """
+
+    def __init__(self, max_results: int = COEFFICIENTS_CACHE_SIZE):
+        self.max_results = max_results
+        self._results: OrderedDict[WorkItem, ImpactCoefficients | None] = OrderedDict()
+        self._results_lock = threading.Lock()
+        self._fitted = 0
+
+    def fetch(self, items: Iterable[WorkItem]) -> dict[WorkItem, ImpactCoefficients | None]:
+        """Return coefficients of the distinct work items, fitting only unseen ones."""
+        items = list(dict.fromkeys(items))
+        results = {}
+        with self._results_lock:
+            for item in items:
+                if item in self._results:
+                    self._results.move_to_end(item)
+                    results[item] = self._results[item]
+        new_items = [item for item in items if item not in results]
+        results.update((item, get_impact_coefficients(*item)) for item in new_items)
+
+        with self._results_lock:
+            self._fitted += len(new_items)
+            for item in new_items:
+                self._results[item] = results[item]
+                self._results.move_to_end(item)
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+        return {item: results[item] for item in items}
+
+    @property
+    def fitted_items(self) -> int:
+        """Number of work items fitted so far, counting refits of evicted items."""
+        return self._fitted
@@ -0,0 +1,80 @@
+"""Export of result tables to Excel, CSV and Parquet files.
+
+Excel workbooks use openpyxl's write-only mode: rows are streamed to the sheet XML
+as they are appended instead of being built into a cell object model first, so
+memory stays bounded by the source table. openpyxl and pyarrow are imported on
+first use.
+"""
+
+import io
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import BinaryIO
+
+import pandas as pd
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Format label -> (file suffix, MIME type)
+EXPORT_FORMATS = {
+    "Excel": (".xlsx", XLSX_MIME),
+    "CSV": (".csv", "text/csv"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+# Maximum length of an Excel sheet title
+_MAX_SHEET_TITLE = 31
+
+
+def _cell(value: object) -> object:
+    """Return an openpyxl cell value, with missing values as empty cells."""
+    return None if pd.isna(value) else value
+
+
+class XlsxStreamWriter:
+    """Append DataFrame chunks to the sheets of a write-only workbook.
+
+    The header of a sheet is written with its first chunk; later chunks must
+    have the same columns.
+    """
+
+    def __init__(self):
+        from openpyxl import Workbook
+
+        self._workbook = Workbook(write_only=True)
+        self._sheets = {}
+
+    def append(self, sheet_name: str, chunk: pd.DataFrame) -> None:
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None:
+            sheet = self._workbook.create_sheet(sheet_name[:_MAX_SHEET_TITLE])
+            self._sheets[sheet_name] = sheet
+            sheet.append([str(column) for column in chunk.columns])
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append([_cell(value) for value in row])
+
+    def save(self, target: Path | BinaryIO) -> None:
+        """Write the workbook; it cannot be appended to afterwards."""
+        self._workbook.save(target)
+
+
+def to_xlsx(sheets: Mapping[str, pd.DataFrame]) -> bytes:
+    """Return a workbook with one sheet per table, streamed row by row."""
+    writer = XlsxStreamWriter()
+    for sheet_name, table in sheets.items():
+        writer.append(sheet_name, table)
+    buffer = io.BytesIO()
+    writer.save(buffer)
+    return buffer.getvalue()
+
+
+def to_csv(table: pd.DataFrame) -> bytes:
+    text: str = table.to_csv(index=False)
+    return text.encode("utf-8")
+
+
+def to_parquet(table: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    table.to_parquet(buffer, index=False)
+    return buffer.getvalue()
@@ -1,4 +1,8 @@
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
+from functools import cache
+
+import numpy as np
 
 from ecologits.impacts.modeling import (
     GWP,
@@ -16,7 +20,7 @@ from pint import Quantity
 from src.core.units import q
 
 
-@dataclass
+@dataclass(slots=True)
 class QImpacts:
     energy: Quantity
     gwp: Quantity
@@ -36,6 +40,11 @@ class QImpacts:
     wcf_max: Quantity | None = None
 
 
+# Axes of raw impact arrays: (..., criterion, statistic)
+CRITERIA = ("energy", "gwp", "adpe", "pe", "wcf")
+STATS = ("mean", "min", "max")
+
+
 # Thresholds for automatic unit scaling
 THRESHOLDS: dict[str, list[tuple[Quantity, str]]] = {
     "energy": [
@@ -83,39 +92,144 @@ def auto_scale(value: Quantity, thresholds: list[tuple[Quantity, str]]) -> Quant
     return value
 
 
+# Default ecologits unit of each criterion, i.e. the unit of raw impact magnitudes
+DEFAULT_UNITS = {
+    "energy": Energy(value=0.0).unit,
+    "gwp": GWP(value=0.0).unit,
+    "adpe": ADPe(value=0.0).unit,
+    "pe": PE(value=0.0).unit,
+    "wcf": WCF(value=0.0).unit,
+}
+
+
+@dataclass(frozen=True)
+class ScaleTable:
+    """Thresholds of a criterion compiled to plain magnitudes in its default unit.
+
+    Index 0 of `units` and `factors` is the default unit itself, index `i + 1`
+    is the target unit of the `i`-th threshold.
+    """
+
+    limits: tuple[float, ...]
+    units: tuple[str, ...]
+    factors: tuple[float, ...]
+
+
+def compile_thresholds(thresholds: list[tuple[Quantity, str]], base_unit: str) -> ScaleTable:
+    limits = tuple(float(limit.to(base_unit).magnitude) for limit, _ in thresholds)
+    units = (base_unit, *(unit for _, unit in thresholds))
+    factors = tuple(float(q(1.0, base_unit).to(unit).magnitude) for unit in units)
+    return ScaleTable(limits=limits, units=units, factors=factors)
+
+
+SCALE_TABLES: dict[str, ScaleTable] = {
+    criterion: compile_thresholds(THRESHOLDS[criterion], DEFAULT_UNITS[criterion])
+    for criterion in THRESHOLDS
+}
+
+
+def _scale_indices(table: ScaleTable, values: np.ndarray) -> np.ndarray:
+    """Return, for each value, the index in `table.units` that `auto_scale` would pick."""
+    indices = np.zeros(values.shape, dtype=np.intp)
+    for i, limit in enumerate(table.limits):
+        indices = np.where(values < limit, i + 1, indices)
+    return indices
+
+
+def format_impacts_batch(magnitudes: Mapping[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Scale arrays of raw impact magnitudes without building pint quantities.
+
+    Vectorized equivalent of `format_impacts`: the unit of each element is chosen
+    from its mean value with the same `THRESHOLDS`, and min/max are expressed in
+    that same unit.
+
+    Args:
+        magnitudes: Raw magnitudes in the default ecologits units, keyed by
+            `QImpacts` field name ("energy", "energy_min", "energy_max", "gwp", ...).
+            Min/max keys are optional; every array must have the same shape.
+
+    Returns:
+        Scaled magnitudes under the same keys, plus a "<criterion>_unit" array of
+        unit labels for every criterion present.
+    """
+    result: dict[str, np.ndarray] = {}
+    for criterion, table in SCALE_TABLES.items():
+        if criterion not in magnitudes:
+            continue
+        mean = np.asarray(magnitudes[criterion], dtype=np.float64)
+        indices = _scale_indices(table, mean)
+        factors = np.asarray(table.factors)[indices]
+        result[criterion] = mean * factors
+        result[f"{criterion}_unit"] = np.asarray(table.units, dtype=object)[indices]
+        for bound in ("min", "max"):
+            key = f"{criterion}_{bound}"
+            if key in magnitudes:
+                result[key] = np.asarray(magnitudes[key], dtype=np.float64) * factors
+    return result
+
+
+@cache
+def _conversion_factor(from_unit: str, to_unit: str) -> float:
+    return float(q(1.0, from_unit).to(to_unit).magnitude)
+
+
+def scale_magnitude(criterion: str, value: float, unit: str | None = None) -> tuple[float, str]:
+    """Pint-free equivalent of `auto_scale` on the compiled `THRESHOLDS` of a criterion.
+
+    Args:
+        criterion: One of the `THRESHOLDS` keys ("energy", "gwp", "adpe", "pe", "wcf").
+        value: Magnitude to scale.
+        unit: Unit of `value`, defaults to the ecologits unit of the criterion.
+
+    Returns:
+        The scaled magnitude and its unit. As with `auto_scale`, the value keeps
+        its original unit when it is not below any threshold.
+    """
+    table = SCALE_TABLES[criterion]
+    base_value = value
+    if unit is not None and unit != table.units[0]:
+        base_value = value * _conversion_factor(unit, table.units[0])
+
+    index = 0
+    for i, limit in enumerate(table.limits):
+        if base_value < limit:
+            index = i + 1
+
+    if index == 0:
+        return value, unit or table.units[0]
+    return base_value * table.factors[index], table.units[index]
+
+
+def _format_value(criterion: str, value: float, unit: str | None) -> Quantity:
+    magnitude, scaled_unit = scale_magnitude(criterion, value, unit)
+    return q(magnitude, scaled_unit)
+
+
 def format_energy(energy_value: float, energy_unit: str | None = None) -> Quantity:
-    if energy_unit is None:
-        energy_unit = Energy(value=0.0).unit
-    val = q(energy_value, energy_unit)
-    return auto_scale(val, THRESHOLDS["energy"])
+    return _format_value("energy", energy_value, energy_unit)
 
 
 def format_gwp(gwp_value: float, gwp_unit: str | None = None) -> Quantity:
-    if gwp_unit is None:
-        gwp_unit = GWP(value=0.0).unit
-    val = q(gwp_value, gwp_unit)
-    return auto_scale(val, THRESHOLDS["gwp"])
+    return _format_value("gwp", gwp_value, gwp_unit)
 
 
 def format_adpe(adpe_value: float, adpe_unit: str | None = None) -> Quantity:
-    if adpe_unit is None:
-        adpe_unit = ADPe(value=0.0).unit
-    val = q(adpe_value, adpe_unit)
-    return auto_scale(val, THRESHOLDS["adpe"])
+    return _format_value("adpe", adpe_value, adpe_unit)
 
 
 def format_pe(pe_value: float, pe_unit: str | None = None) -> Quantity:
-    if pe_unit is None:
-        pe_unit = PE(value=0.0).unit
-    val = q(pe_value, pe_unit)
-    return auto_scale(val, THRESHOLDS["pe"])
+    return _format_value("pe", pe_value, pe_unit)
 
 
 def format_wcf(wcf_value: float, wcf_unit: str | None = None) -> Quantity:
-    if wcf_unit is None:
-        wcf_unit = WCF(value=0.0).unit
-    val = q(wcf_value, wcf_unit)
-    return auto_scale(val, THRESHOLDS["wcf"])
+    return _format_value("wcf", wcf_value, wcf_unit)
+
+
+def _format_range(criterion: str, value) -> tuple[Quantity, Quantity, Quantity]:
+    """Format a range value: the unit is chosen from the mean and shared by min and max."""
+    magnitude, unit = scale_magnitude(criterion, value.mean)
+    factor = _conversion_factor(DEFAULT_UNITS[criterion], unit)
+    return q(magnitude, unit), q(value.min * factor, unit), q(value.max * factor, unit)
 
 
 def format_impacts(impacts: Impacts | ImpactsOutput) -> tuple[QImpacts, Usage, Embodied]:
@@ -133,31 +247,214 @@ def format_impacts(impacts: Impacts | ImpactsOutput) -> tuple[QImpacts, Usage, E
         )
 
     else:
-        energy = format_energy(impacts.energy.value.mean)
-        gwp = format_gwp(impacts.gwp.value.mean)
-        adpe = format_adpe(impacts.adpe.value.mean)
-        pe = format_pe(impacts.pe.value.mean)
-        wcf = format_wcf(impacts.wcf.value.mean)
+        energy, energy_min, energy_max = _format_range("energy", impacts.energy.value)
+        gwp, gwp_min, gwp_max = _format_range("gwp", impacts.gwp.value)
+        adpe, adpe_min, adpe_max = _format_range("adpe", impacts.adpe.value)
+        pe, pe_min, pe_max = _format_range("pe", impacts.pe.value)
+        wcf, wcf_min, wcf_max = _format_range("wcf", impacts.wcf.value)
 
         return (
             QImpacts(
                 energy=energy,
-                energy_min=format_energy(impacts.energy.value.min).to(energy.units),
-                energy_max=format_energy(impacts.energy.value.max).to(energy.units),
+                energy_min=energy_min,
+                energy_max=energy_max,
                 gwp=gwp,
-                gwp_min=format_gwp(impacts.gwp.value.min).to(gwp.units),
-                gwp_max=format_gwp(impacts.gwp.value.max).to(gwp.units),
+                gwp_min=gwp_min,
+                gwp_max=gwp_max,
                 adpe=adpe,
-                adpe_min=format_adpe(impacts.adpe.value.min).to(adpe.units),
-                adpe_max=format_adpe(impacts.adpe.value.max).to(adpe.units),
+                adpe_min=adpe_min,
+                adpe_max=adpe_max,
                 pe=pe,
-                pe_min=format_pe(impacts.pe.value.min).to(pe.units),
-                pe_max=format_pe(impacts.pe.value.max).to(pe.units),
+                pe_min=pe_min,
+                pe_max=pe_max,
                 wcf=wcf,
-                wcf_min=format_wcf(impacts.wcf.value.min).to(wcf.units),
-                wcf_max=format_wcf(impacts.wcf.value.max).to(wcf.units),
+                wcf_min=wcf_min,
+                wcf_max=wcf_max,
                 ranges=True,
             ),
             impacts.usage,
             impacts.embodied,
         )
+
+
+def qimpacts_from_array(values: np.ndarray, ranges: bool = True) -> QImpacts:
+    """Build scaled `QImpacts` from raw magnitudes of shape (len(CRITERIA), len(STATS)).
+
+    Magnitudes are in the default ecologits units; the unit of each criterion is
+    chosen from its mean and shared by min and max, as in `format_impacts`.
+    """
+    fields: dict[str, Quantity] = {}
+    for i, criterion in enumerate(CRITERIA):
+        mean, low, high = (float(v) for v in values[i])
+        magnitude, unit = scale_magnitude(criterion, mean)
+        fields[criterion] = q(magnitude, unit)
+        if ranges:
+            factor = _conversion_factor(DEFAULT_UNITS[criterion], unit)
+            fields[f"{criterion}_min"] = q(low * factor, unit)
+            fields[f"{criterion}_max"] = q(high * factor, unit)
+    return QImpacts(**fields, ranges=ranges)
+
+
+class _ImpactField:
+    """Descriptor exposing one `QImpacts` field of a `QImpactsRow`."""
+
+    def __init__(self, criterion: str, stat: str = "mean"):
+        self.criterion = CRITERIA.index(criterion)
+        self.stat = STATS.index(stat)
+
+    def __get__(self, row: "QImpactsRow", owner=None) -> Quantity | None:
+        return row._quantity(self.criterion, self.stat)
+
+
+class QImpactsRow:
+    """Read-only view of one row of a `QImpactsTable` with the `QImpacts` API.
+
+    Quantities are built and scaled on access, following `format_impacts`.
+    """
+
+    __slots__ = ("_index", "_table")
+
+    energy = _ImpactField("energy")
+    gwp = _ImpactField("gwp")
+    adpe = _ImpactField("adpe")
+    pe = _ImpactField("pe")
+    wcf = _ImpactField("wcf")
+    energy_min = _ImpactField("energy", "min")
+    energy_max = _ImpactField("energy", "max")
+    gwp_min = _ImpactField("gwp", "min")
+    gwp_max = _ImpactField("gwp", "max")
+    adpe_min = _ImpactField("adpe", "min")
+    adpe_max = _ImpactField("adpe", "max")
+    pe_min = _ImpactField("pe", "min")
+    pe_max = _ImpactField("pe", "max")
+    wcf_min = _ImpactField("wcf", "min")
+    wcf_max = _ImpactField("wcf", "max")
+
+    def __init__(self, table: "QImpactsTable", index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def ranges(self) -> bool:
+        return bool(self._table.ranges[self._index])
+
+    def _quantity(self, criterion: int, stat: int) -> Quantity | None:
+        if stat != 0 and not self.ranges:
+            return None
+        name = CRITERIA[criterion]
+        values = self._table.values[self._index, criterion]
+        magnitude, unit = scale_magnitude(name, float(values[0]))
+        if stat != 0:
+            magnitude = float(values[stat]) * _conversion_factor(DEFAULT_UNITS[name], unit)
+        return q(magnitude, unit)
+
+    def to_qimpacts(self) -> QImpacts:
+        return qimpacts_from_array(self._table.values[self._index], self.ranges)
+
+
+class QImpactsTable:
+    """Columnar storage of impacts for many rows.
+
+    Magnitudes are stored in a single float64 array of shape
+    (rows, len(CRITERIA), len(STATS)) in the default ecologits unit of each
+    criterion, instead of sixteen pint quantities per row. Rows without ranges
+    repeat their mean as min and max.
+    """
+
+    __slots__ = ("_ranges", "_size", "_values")
+
+    def __init__(self, capacity: int = 16):
+        self._values = np.empty((max(capacity, 1), len(CRITERIA), len(STATS)), dtype=np.float64)
+        self._ranges = np.zeros(max(capacity, 1), dtype=bool)
+        self._size = 0
+
+    @classmethod
+    def from_arrays(cls, values: np.ndarray, ranges) -> "QImpactsTable":
+        """Build a table from raw magnitudes of shape (rows, 5, 3) and a ranges flag."""
+        values = np.asarray(values, dtype=np.float64)
+        table = cls(capacity=len(values))
+        table.extend(values, ranges)
+        return table
+
+    @classmethod
+    def from_qimpacts(cls, impacts: Iterable[QImpacts]) -> "QImpactsTable":
+        impacts = list(impacts)
+        table = cls(capacity=len(impacts))
+        for impact in impacts:
+            values = np.empty((len(CRITERIA), len(STATS)), dtype=np.float64)
+            for i, criterion in enumerate(CRITERIA):
+                for j, stat in enumerate(STATS):
+                    name = criterion if stat == "mean" else f"{criterion}_{stat}"
+                    quantity = getattr(impact, name)
+                    if quantity is None or not impact.ranges:
+                        quantity = getattr(impact, criterion)
+                    factor = _conversion_factor(str(quantity.units), DEFAULT_UNITS[criterion])
+                    values[i, j] = quantity.magnitude * factor
+            table.append(values, impact.ranges)
+        return table
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self._ranges):
+            return
+        capacity = max(size, 2 * len(self._ranges))
+        values = np.empty((capacity, len(CRITERIA), len(STATS)), dtype=np.float64)
+        values[: self._size] = self._values[: self._size]
+        ranges = np.zeros(capacity, dtype=bool)
+        ranges[: self._size] = self._ranges[: self._size]
+        self._values, self._ranges = values, ranges
+
+    def append(self, values: np.ndarray, ranges: bool) -> None:
+        """Append one row of raw magnitudes of shape (5, 3)."""
+        self._reserve(self._size + 1)
+        self._values[self._size] = values
+        self._ranges[self._size] = ranges
+        self._size += 1
+
+    def extend(self, values: np.ndarray, ranges) -> None:
+        """Append rows of raw magnitudes of shape (rows, 5, 3)."""
+        count = len(values)
+        self._reserve(self._size + count)
+        self._values[self._size : self._size + count] = values
+        self._ranges[self._size : self._size + count] = ranges
+        self._size += count
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[: self._size]
+
+    @property
+    def ranges(self) -> np.ndarray:
+        return self._ranges[: self._size]
+
+    def total(self, rows=None) -> QImpacts:
+        """Sum mean, min and max of every criterion in one vectorized pass.
+
+        Args:
+            rows: Optional row indices or boolean mask to restrict the sum to.
+
+        Returns:
+            Scaled `QImpacts` with ranges. Rows without ranges contribute their
+            mean to both bounds.
+        """
+        values = self.values if rows is None else self.values[rows]
+        return qimpacts_from_array(values.sum(axis=0), ranges=True)
+
+    @property
+    def nbytes(self) -> int:
+        return self._values.nbytes + self._ranges.nbytes
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._size
+
+    def __getitem__(self, index: int) -> QImpactsRow:
+        """Return a lazy `QImpacts`-like view of a row."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("QImpactsTable index out of range")
+        return QImpactsRow(self, index)
+
+    def __iter__(self) -> Iterator[QImpactsRow]:
+        """Iterate over lazy row views."""
+        return (QImpactsRow(self, i) for i in range(self._size))
@@ -1,13 +1,133 @@
+import os
+
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+
 from ecologits.estimations.video import video_impacts
-from ecologits.tracers.utils import ImpactsOutput, llm_impacts
+from ecologits.tracers.utils import PROVIDER_CONFIG_MAP, ImpactsOutput, llm_impacts
 
 from src.config.scenarios import Scenario
+from src.core.cache import CacheStats, TTLCache
+
+# Upper bound on distinct (provider, model, zone, tokens) entries kept in memory
+LLM_IMPACTS_CACHE_SIZE = 4096
+
+SCENARIO_CACHE_SIZE_ENV = "ECOLOGITS_CALCULATOR_SCENARIO_CACHE_SIZE"
+SCENARIO_CACHE_TTL_ENV = "ECOLOGITS_CALCULATOR_SCENARIO_CACHE_TTL"
+
+# Default upper bound on distinct (scenario, provider, model) entries kept in memory
+SCENARIO_CACHE_SIZE = 1024
+
+# Electricity mix zone ecologits falls back on when a provider has no data center location
+DEFAULT_ELECTRICITY_MIX_ZONE = "WOR"
+
+
+def provider_electricity_mix_zone(provider: str) -> str:
+    """Return the zone `llm_impacts` uses for a provider when no zone is given.
+
+    That is the provider's data center location, or the world mix if ecologits
+    does not know it.
+    """
+    config = PROVIDER_CONFIG_MAP.get(provider)
+    if config is None or config.datacenter_location is None:
+        return DEFAULT_ELECTRICITY_MIX_ZONE
+    return config.datacenter_location
+
+
+@lru_cache(maxsize=LLM_IMPACTS_CACHE_SIZE)
+def cached_llm_impacts(
+    provider: str,
+    model_name: str,
+    electricity_mix_zone: str,
+    output_token_count: int,
+) -> ImpactsOutput:
+    """Memoized `llm_impacts` call with an unbounded request latency.
+
+    The returned object is shared between callers and must not be mutated.
+
+    Args:
+        provider: Raw ecologits provider name.
+        model_name: Raw ecologits model name.
+        electricity_mix_zone: ISO 3166-1 alpha-3 code of the electricity mix zone.
+        output_token_count: Number of generated tokens.
+
+    Returns:
+        The impacts computed by ecologits for these inputs.
+    """
+    return llm_impacts(
+        provider=provider,
+        model_name=model_name,
+        output_token_count=output_token_count,
+        request_latency=float("inf"),
+        electricity_mix_zone=electricity_mix_zone,
+    )
+
+
+def llm_impacts_cache_info():
+    """Return hit/miss/size counters of the `cached_llm_impacts` cache."""
+    return cached_llm_impacts.cache_info()
+
+
+def clear_llm_impacts_cache() -> None:
+    cached_llm_impacts.cache_clear()
+
+
+def _ecologits_version() -> str:
+    try:
+        return version("ecologits")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def new_scenario_cache[V]() -> TTLCache[V]:
+    """Create a scenario cache from the environment settings.
+
+    `ECOLOGITS_CALCULATOR_SCENARIO_CACHE_TTL` is in seconds; unset or 0 means
+    entries never expire.
+    """
+    return TTLCache(
+        maxsize=int(os.environ.get(SCENARIO_CACHE_SIZE_ENV, SCENARIO_CACHE_SIZE)),
+        ttl=float(os.environ.get(SCENARIO_CACHE_TTL_ENV, 0)),
+        tag=_ecologits_version(),
+    )
+
+
+_scenario_cache: TTLCache[ImpactsOutput] = new_scenario_cache()
+
+
+def scenario_impacts_cache_stats() -> CacheStats:
+    """Return hit/miss/eviction counters of the `compute_scenario_impacts` cache."""
+    return _scenario_cache.stats()
+
+
+def clear_scenario_impacts_cache() -> None:
+    """Drop every cached scenario impact and reload the cache settings."""
+    global _scenario_cache
+    _scenario_cache = new_scenario_cache()
 
 
 def compute_scenario_impacts(
     scenario: Scenario,
     provider: str,
     model_name: str,
+) -> ImpactsOutput:
+    """Memoized impacts of a scenario run on a model.
+
+    Results are cached process-wide and keyed on the ecologits version installed
+    when the cache was created, so results of another version are never served.
+    The returned object is shared between callers and must not be mutated.
+    """
+    cache = _scenario_cache
+    key = (cache.tag, scenario, provider, model_name)
+    return cache.get_or_compute(
+        key, lambda: _compute_scenario_impacts(scenario, provider, model_name)
+    )
+
+
+def _compute_scenario_impacts(
+    scenario: Scenario,
+    provider: str,
+    model_name: str,
 ) -> ImpactsOutput:
     if scenario.modality == "text":
         return llm_impacts(
@@ -0,0 +1,158 @@
+"""Impacts of one scenario across every model of a catalog.
+
+Text scenarios are evaluated from the cached `ImpactCoefficients` of each model,
+stacked into arrays and evaluated for all models in one NumPy pass. Video
+scenarios go through the cached `compute_scenario_impacts`, once per model.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ecologits.utils.range_value import RangeValue
+
+from src.config.scenarios import Scenario
+from src.core.coefficients import get_impact_coefficients, impacts_to_array
+from src.core.executor import CoefficientsExecutor
+from src.core.formatting import CRITERIA, SCALE_TABLES, STATS, scale_magnitude
+from src.core.impact_calculator import compute_scenario_impacts, provider_electricity_mix_zone
+from src.repositories.models import ModelCatalog
+
+# Criteria of the leaderboard table, in column order
+LEADERBOARD_CRITERIA = ("energy", "gwp", "wcf", "adpe")
+
+CRITERION_LABELS = {
+    "energy": "Energy",
+    "gwp": "GWP",
+    "adpe": "ADPe",
+    "pe": "PE",
+    "wcf": "WCF",
+}
+
+
+@dataclass(frozen=True)
+class Leaderboard:
+    """Impacts of a scenario for each model that could be evaluated.
+
+    Attributes:
+        providers: Display provider name of each model.
+        models: Display model name of each model.
+        values: Raw magnitudes of shape (models, len(CRITERIA), len(STATS)) in
+            the default ecologits units.
+        ranges: Whether ecologits reports min/max ranges for each model.
+        failed: (provider, model) display names ecologits could not evaluate.
+    """
+
+    providers: np.ndarray
+    models: np.ndarray
+    values: np.ndarray
+    ranges: np.ndarray
+    failed: tuple[tuple[str, str], ...] = ()
+
+    def column_unit(self, criterion: str) -> str:
+        """Return the display unit shared by a criterion's column, from its median."""
+        mean = self.values[:, CRITERIA.index(criterion), STATS.index("mean")]
+        _, unit = scale_magnitude(criterion, float(np.median(mean)) if len(mean) else 0.0)
+        return unit
+
+    def to_frame(self, criteria: tuple[str, ...] = LEADERBOARD_CRITERIA) -> pd.DataFrame:
+        """Return one row per model, sorted by increasing mean energy.
+
+        Each criterion gets mean, min and max columns in a single unit per column
+        (e.g. "Energy (Wh)"), so the table sorts numerically.
+        """
+        columns = {"Provider": self.providers, "Model": self.models}
+        for criterion in criteria:
+            unit = self.column_unit(criterion)
+            table = SCALE_TABLES[criterion]
+            factor = table.factors[table.units.index(unit)]
+            label = CRITERION_LABELS[criterion]
+            for stat, suffix in zip(STATS, ("", " min", " max"), strict=True):
+                values = self.values[:, CRITERIA.index(criterion), STATS.index(stat)]
+                columns[f"{label}{suffix} ({unit})"] = values * factor
+        frame = pd.DataFrame(columns)
+        energy = self.values[:, CRITERIA.index("energy"), STATS.index("mean")]
+        return frame.iloc[np.argsort(energy, kind="stable")].reset_index(drop=True)
+
+
+def _catalog_models(catalog: ModelCatalog) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Return display and raw (provider, model) names of each distinct catalog model."""
+    display_names: dict[tuple[str, str], tuple[str, str]] = {}
+    for names, raw_names in catalog.raw_names.items():
+        display_names.setdefault(raw_names, names)
+    return list(display_names.values()), list(display_names)
+
+
+def _text_values(
+    scenario: Scenario,
+    raw_models: list[tuple[str, str]],
+    executor: CoefficientsExecutor | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Same zone as the calculator, which lets ecologits pick the provider's data center
+    items = [
+        (provider, model, provider_electricity_mix_zone(provider)) for provider, model in raw_models
+    ]
+    if executor is not None:
+        coefficients_by_item = executor.fetch(items)
+    else:
+        coefficients_by_item = {item: get_impact_coefficients(*item) for item in items}
+    coefficients = [coefficients_by_item[item] for item in items]
+
+    ok = np.array([c is not None for c in coefficients], dtype=bool)
+    fitted = [c for c in coefficients if c is not None]
+    shape = (0, len(CRITERIA), len(STATS))
+    slopes = np.stack([c.slope for c in fitted]) if fitted else np.empty(shape)
+    intercepts = np.stack([c.intercept for c in fitted]) if fitted else np.empty(shape)
+    values = slopes * float(scenario.output_token_count or 0) + intercepts
+    ranges = np.array([c.ranges for c in fitted], dtype=bool)
+    return values, ranges, ok
+
+
+def _video_values(
+    scenario: Scenario, raw_models: list[tuple[str, str]]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    arrays, ranges, ok = [], [], []
+    for provider, model in raw_models:
+        impacts = compute_scenario_impacts(scenario=scenario, provider=provider, model_name=model)
+        ok.append(not impacts.has_errors)
+        if impacts.has_errors:
+            continue
+        arrays.append(impacts_to_array(impacts))
+        ranges.append(impacts.energy is not None and isinstance(impacts.energy.value, RangeValue))
+    shape = (0, len(CRITERIA), len(STATS))
+    return (
+        np.stack(arrays) if arrays else np.empty(shape),
+        np.array(ranges, dtype=bool),
+        np.array(ok, dtype=bool),
+    )
+
+
+def compute_leaderboard(
+    scenario: Scenario,
+    catalog: ModelCatalog,
+    executor: CoefficientsExecutor | None = None,
+) -> Leaderboard:
+    """Compute the impacts of a scenario for every model of a catalog.
+
+    Args:
+        scenario: Text or video scenario.
+        catalog: Models compatible with the scenario.
+        executor: Optional executor memoizing text model coefficients; they
+            come from the `get_impact_coefficients` cache by default.
+    """
+    display_models, raw_models = _catalog_models(catalog)
+    if scenario.modality == "text":
+        values, ranges, ok = _text_values(scenario, raw_models, executor)
+    else:
+        values, ranges, ok = _video_values(scenario, raw_models)
+
+    providers = np.array([provider for provider, _ in display_models], dtype=object)
+    models = np.array([model for _, model in display_models], dtype=object)
+    return Leaderboard(
+        providers=providers[ok],
+        models=models[ok],
+        values=values,
+        ranges=ranges,
+        failed=tuple(name for name, good in zip(display_models, ok, strict=True) if not good),
+    )
@@ -0,0 +1,132 @@
+"""Impacts of one LLM request across every electricity mix zone.
+
+Among the impacts computed by ecologits for a request, only the usage impacts
+depend on the electricity mix, and they do so linearly:
+
+    usage_gwp  = energy * mix_gwp      (same for adpe and pe)
+    usage_wcf  = energy / pue * (datacenter_wue + pue * mix_wue)
+
+Energy and embodied impacts are the same in every zone. A single ecologits
+evaluation is therefore enough to derive the impacts of all zones, computed in
+one NumPy pass over the stacked mix factors.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from ecologits.electricity_mix_repository import electricity_mixes
+from ecologits.impacts.modeling import Impacts
+from ecologits.utils.range_value import RangeValue
+
+from src.core.formatting import CRITERIA, SCALE_TABLES, STATS, scale_magnitude
+
+# Electricity mix factor driving the usage impact of each criterion
+MIX_FACTORS = ("gwp", "adpe", "pe", "wue")
+_CRITERION_FACTORS = {"gwp": "gwp", "adpe": "adpe", "pe": "pe", "wcf": "wue"}
+
+# Criteria that vary with the electricity mix
+LOCATION_CRITERIA = tuple(_CRITERION_FACTORS)
+
+
+@lru_cache(maxsize=1)
+def zone_mix_factors() -> tuple[np.ndarray, np.ndarray]:
+    """Return the zone codes and their mix factors of shape (zones, len(MIX_FACTORS))."""
+    mixes = electricity_mixes.list_electricity_mixes()
+    zones = np.array([mix.zone for mix in mixes], dtype=object)
+    factors = np.array(
+        [[getattr(mix, factor) for factor in MIX_FACTORS] for mix in mixes],
+        dtype=np.float64,
+    ).reshape(len(mixes), len(MIX_FACTORS))
+    factors.setflags(write=False)
+    return zones, factors
+
+
+def _stats(value) -> tuple[float, float, float]:
+    if isinstance(value, RangeValue):
+        return value.mean, value.min, value.max
+    return value, value, value
+
+
+@dataclass(frozen=True)
+class LocationSweep:
+    """Impacts of a request in each electricity mix zone.
+
+    Attributes:
+        zones: Electricity mix zone codes.
+        values: Raw magnitudes of shape (zones, len(CRITERIA), len(STATS)) in
+            the default ecologits units.
+    """
+
+    zones: np.ndarray
+    values: np.ndarray
+
+    def column_unit(self, criterion: str) -> str:
+        """Return the display unit shared by all zones, from the median of a criterion."""
+        mean = self.values[:, CRITERIA.index(criterion), STATS.index("mean")]
+        _, unit = scale_magnitude(criterion, float(np.median(mean)) if len(mean) else 0.0)
+        return unit
+
+    def to_frame(self, criterion: str) -> pd.DataFrame:
+        """Return one row per zone with the mean, min and max of a criterion.
+
+        Values are scaled to the unit of `column_unit` and rows sorted by
+        increasing mean.
+        """
+        unit = self.column_unit(criterion)
+        table = SCALE_TABLES[criterion]
+        factor = table.factors[table.units.index(unit)]
+        values = self.values[:, CRITERIA.index(criterion)] * factor
+        frame = pd.DataFrame(
+            {
+                "zone": self.zones,
+                "mean": values[:, STATS.index("mean")],
+                "min": values[:, STATS.index("min")],
+                "max": values[:, STATS.index("max")],
+                "unit": unit,
+            }
+        )
+        return frame.sort_values("mean", kind="stable").reset_index(drop=True)
+
+
+def sweep_locations(
+    impacts: Impacts,
+    datacenter_pue: float,
+    datacenter_wue: float,
+    zones: np.ndarray | None = None,
+    mix_factors: np.ndarray | None = None,
+) -> LocationSweep:
+    """Derive the impacts of a request in every zone from one ecologits evaluation.
+
+    Args:
+        impacts: Output of `compute_llm_impacts` for the request, in any zone.
+        datacenter_pue: Power Usage Effectiveness the impacts were computed with.
+        datacenter_wue: Water Usage Effectiveness the impacts were computed with.
+        zones: Zone codes to evaluate; all ecologits zones by default.
+        mix_factors: Mix factors of `zones`, shape (zones, len(MIX_FACTORS)).
+    """
+    if zones is None or mix_factors is None:
+        zones, mix_factors = zone_mix_factors()
+
+    energy = np.array(_stats(impacts.energy.value), dtype=np.float64)
+    # Zone-independent part: energy, embodied impacts and data center water
+    offset = np.zeros((len(CRITERIA), len(STATS)), dtype=np.float64)
+    offset[CRITERIA.index("energy")] = energy
+    for criterion in ("gwp", "adpe", "pe"):
+        offset[CRITERIA.index(criterion)] = _stats(getattr(impacts.embodied, criterion).value)
+    offset[CRITERIA.index("wcf")] = energy * datacenter_wue / datacenter_pue
+
+    # Usage impact per unit of mix factor
+    per_factor = np.zeros((len(CRITERIA), len(STATS)), dtype=np.float64)
+    for criterion in LOCATION_CRITERIA:
+        per_factor[CRITERIA.index(criterion)] = energy
+
+    # Mix factor of each (zone, criterion), zero for energy
+    zone_factors = np.zeros((len(zones), len(CRITERIA)), dtype=np.float64)
+    for criterion, factor in _CRITERION_FACTORS.items():
+        zone_factors[:, CRITERIA.index(criterion)] = mix_factors[:, MIX_FACTORS.index(factor)]
+
+    values = zone_factors[:, :, None] * per_factor + offset
+    return LocationSweep(zones=np.asarray(zones, dtype=object), values=values)
@@ -0,0 +1,122 @@
+"""Precomputed impacts of the default calculator scenarios.
+
+The default calculator offers a small, finite set of (scenario, model) choices.
+`ScenarioMatrix` computes the formatted impacts and equivalents of all of them
+on a background thread at startup, so interactions become cache lookups. Pairs
+not computed yet are computed live, and a pair being computed by the warm-up is
+waited for rather than computed twice.
+"""
+
+import logging
+import threading
+import time
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from src.config.scenarios import Scenario
+from src.core.cache import CacheStats, TTLCache
+from src.core.equivalences import EquivalentType, compute_equivalents
+from src.core.formatting import QImpacts, format_impacts
+from src.core.impact_calculator import compute_scenario_impacts, new_scenario_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    """Formatted impacts and equivalents of a scenario run on one model.
+
+    Results are shared between sessions and must not be mutated.
+    """
+
+    impacts: QImpacts
+    warnings: tuple[str, ...]
+    equivalents: dict[EquivalentType, object]
+
+
+def compute_scenario_result(scenario: Scenario, provider: str, model_name: str) -> ScenarioResult:
+    """Compute and format the impacts of a scenario run on a model."""
+    impacts = compute_scenario_impacts(scenario=scenario, provider=provider, model_name=model_name)
+    impacts_formatted, _, _ = format_impacts(impacts)
+    warnings = tuple(str(getattr(w, "message", w)) for w in impacts.warnings or ())
+    return ScenarioResult(
+        impacts=impacts_formatted,
+        warnings=warnings,
+        equivalents=compute_equivalents(impacts_formatted),
+    )
+
+
+class ScenarioMatrix:
+    """Formatted results keyed by (scenario, provider, model).
+
+    Results are held in a `TTLCache` sized and expired with the scenario cache
+    settings (`ECOLOGITS_CALCULATOR_SCENARIO_CACHE_SIZE` and `_TTL`), so reads may
+    run concurrently with `warm_up`.
+    """
+
+    def __init__(self, cache: TTLCache[ScenarioResult] | None = None):
+        self._cache = cache if cache is not None else new_scenario_cache()
+        self._warmed_up = threading.Event()
+
+    def _key(self, scenario: Scenario, provider: str, model_name: str) -> tuple:
+        return (self._cache.tag, scenario.label, provider, model_name)
+
+    def get(self, scenario: Scenario, provider: str, model_name: str) -> ScenarioResult:
+        """Return the result of a pair, computing and storing it on a miss."""
+        return self._cache.get_or_compute(
+            self._key(scenario, provider, model_name),
+            lambda: compute_scenario_result(scenario, provider, model_name),
+        )
+
+    def warm_up(self, pairs: Iterable[tuple[Scenario, str, str]]) -> int:
+        """Compute every (scenario, provider, model) pair not stored yet.
+
+        Pairs ecologits fails on are logged and skipped; requesting them later
+        raises the error live.
+
+        Returns:
+            Number of pairs computed.
+        """
+        start = time.perf_counter()
+        computed = 0
+        for scenario, provider, model_name in pairs:
+            missed = False
+
+            def compute(scenario=scenario, provider=provider, model_name=model_name):
+                nonlocal missed
+                missed = True
+                return compute_scenario_result(scenario, provider, model_name)
+
+            try:
+                self._cache.get_or_compute(self._key(scenario, provider, model_name), compute)
+            except Exception:
+                logger.warning(
+                    "Could not precompute %s for %s/%s",
+                    scenario.label,
+                    provider,
+                    model_name,
+                    exc_info=True,
+                )
+                continue
+            computed += missed
+        self._warmed_up.set()
+        logger.info(
+            "Precomputed %d scenario impacts in %.2f s",
+            computed,
+            time.perf_counter() - start,
+        )
+        return computed
+
+    @property
+    def warmed_up(self) -> bool:
+        """Whether a warm-up has completed."""
+        return self._warmed_up.is_set()
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters of the underlying cache."""
+        return self._cache.stats()
+
+    def __len__(self) -> int:
+        """Return the number of results currently stored."""
+        return len(self._cache)
@@ -0,0 +1,194 @@
+"""Impacts of an LLM request over a grid of input parameters.
+
+`compute_llm_impacts` evaluates one set of inputs at a time. Apart from the GPU
+count and the generation latency, every node of the ecologits LLM impacts DAG is
+plain arithmetic, so once those two nodes are computed with NumPy the DAG itself
+evaluates whole arrays of inputs at once. A 50 x 50 sensitivity grid is then two
+DAG executions (min and max of the parameter range) instead of 2,500 calls.
+"""
+
+import inspect
+import math
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ecologits.impacts.llm import compute_llm_impacts_dag, dag
+from ecologits.utils.range_value import RangeValue
+
+from src.core.formatting import CRITERIA, SCALE_TABLES, STATS, scale_magnitude
+
+# Inputs of `compute_llm_impacts` a sweep can vary, with their display label
+SWEEP_PARAMETERS = {
+    "output_token_count": "Output tokens",
+    "model_active_parameter_count": "Active parameters (B)",
+    "model_total_parameter_count": "Total parameters (B)",
+    "tps": "Average TPS",
+    "ttft": "Average TTFT (s)",
+    "datacenter_pue": "Data center PUE",
+    "datacenter_wue": "Data center WUE (L / kWh)",
+    "if_electricity_mix_gwp": "Electricity mix GHG emissions (kgCO2eq / kWh)",
+}
+
+# Maximum number of values along a sweep axis
+MAX_SWEEP_POINTS = 200
+
+_DAG_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(compute_llm_impacts_dag).parameters.items()
+    if parameter.default is not inspect.Parameter.empty
+}
+
+
+def _gpu_required_count(model_total_parameter_count, quantization_bits, gpu_memory) -> np.ndarray:
+    """Vectorized ecologits `model_required_memory` and `gpu_required_count` nodes."""
+    required_memory = 1.2 * np.asarray(model_total_parameter_count) * quantization_bits / 8
+    gpu_count = np.ceil(required_memory / gpu_memory)
+    with np.errstate(divide="ignore"):
+        gpu_required_count: np.ndarray = 2 ** np.ceil(np.log2(gpu_count))
+    return gpu_required_count
+
+
+def _generation_latency(inputs: dict) -> np.ndarray:
+    """Vectorized ecologits `generation_latency` node."""
+    tps = inputs.get("tps")
+    if tps is None:
+        latency_per_token = (
+            inputs["latency_alpha"] * np.asarray(inputs["model_active_parameter_count"])
+            + inputs["latency_beta"] * inputs["batch_size"]
+            + inputs["latency_gamma"]
+        )
+    else:
+        latency_per_token = 1 / np.asarray(tps, dtype=np.float64)
+    ttft = inputs.get("ttft")
+    latency = np.asarray(inputs["output_token_count"]) * latency_per_token
+    if ttft is not None:
+        latency = latency + ttft
+    generation_latency: np.ndarray = np.minimum(latency, inputs["request_latency"])
+    return generation_latency
+
+
+def _evaluate(inputs: dict) -> np.ndarray:
+    """Run the ecologits DAG on array inputs for single (non range) parameter counts.
+
+    Returns:
+        Impact magnitudes of shape `S + (len(CRITERIA),)`, `S` being the broadcast
+        shape of the inputs.
+    """
+    inputs = {**inputs}
+    inputs["gpu_required_count"] = _gpu_required_count(
+        inputs["model_total_parameter_count"],
+        inputs["model_quantization_bits"],
+        inputs["gpu_memory"],
+    )
+    inputs["generation_latency"] = _generation_latency(inputs)
+    results = dag.execute(**inputs)
+
+    impacts = (
+        results["request_energy"],
+        results["request_usage_gwp"] + results["request_embodied_gwp"],
+        results["request_usage_adpe"] + results["request_embodied_adpe"],
+        results["request_usage_pe"] + results["request_embodied_pe"],
+        results["request_usage_wcf"],
+    )
+    shape = np.broadcast_shapes(*(np.shape(impact) for impact in impacts))
+    return np.stack([np.broadcast_to(impact, shape) for impact in impacts], axis=-1)
+
+
+def compute_llm_impacts_grid(**inputs) -> np.ndarray:
+    """Compute LLM impacts for arrays of inputs with NumPy broadcasting.
+
+    Takes the arguments of `ecologits.impacts.llm.compute_llm_impacts`. Any of
+    them may be an array; parameter counts may also be scalar `RangeValue`s.
+
+    Returns:
+        Impact magnitudes of shape `S + (len(CRITERIA), len(STATS))`, `S` being
+        the broadcast shape of the inputs, in the default ecologits units.
+    """
+    inputs = {**_DAG_DEFAULTS, **inputs}
+    if inputs.get("request_latency") is None:
+        inputs["request_latency"] = math.inf
+
+    bounds = []
+    for name in ("model_active_parameter_count", "model_total_parameter_count"):
+        value = inputs[name]
+        bounds.append((value.min, value.max) if isinstance(value, RangeValue) else (value, value))
+    (active_min, active_max), (total_min, total_max) = bounds
+
+    low = _evaluate(
+        {
+            **inputs,
+            "model_active_parameter_count": active_min,
+            "model_total_parameter_count": total_min,
+        }
+    )
+    if active_min is active_max and total_min is total_max:
+        high = low
+    else:
+        high = _evaluate(
+            {
+                **inputs,
+                "model_active_parameter_count": active_max,
+                "model_total_parameter_count": total_max,
+            }
+        )
+    return np.stack([(low + high) / 2, low, high], axis=-1)
+
+
+@dataclass(frozen=True)
+class SensitivitySweep:
+    """Impacts of a request over a grid of one or two parameters.
+
+    Attributes:
+        parameters: Names of the swept inputs, the first one along the last axis.
+        axes: Values of each swept input, in the order of `parameters`.
+        values: Raw magnitudes of shape `grid + (len(CRITERIA), len(STATS))`,
+            where `grid` is `(len(axes[0]),)` for one parameter and
+            `(len(axes[1]), len(axes[0]))` for two.
+    """
+
+    parameters: tuple[str, ...]
+    axes: tuple[np.ndarray, ...]
+    values: np.ndarray
+
+    def scaled(self, criterion: str, stat: str = "mean") -> tuple[np.ndarray, str]:
+        """Return one statistic of a criterion over the grid in a shared display unit."""
+        values = self.values[..., CRITERIA.index(criterion), STATS.index(stat)]
+        mean = self.values[..., CRITERIA.index(criterion), STATS.index("mean")]
+        _, unit = scale_magnitude(criterion, float(np.median(mean)) if mean.size else 0.0)
+        table = SCALE_TABLES[criterion]
+        return values * table.factors[table.units.index(unit)], unit
+
+
+def sweep_parameters(base: dict, axes: dict[str, np.ndarray]) -> SensitivitySweep:
+    """Evaluate a request over the grid of one or two varying inputs.
+
+    Args:
+        base: Arguments of `compute_llm_impacts` for the reference request.
+        axes: Values of each varying input, keyed by a name of `SWEEP_PARAMETERS`.
+
+    Raises:
+        ValueError: If `axes` has no or more than two inputs, an unknown input,
+            or more than `MAX_SWEEP_POINTS` values along an axis.
+    """
+    if not 1 <= len(axes) <= 2:
+        raise ValueError(f"Expected one or two parameters to sweep, got {len(axes)}")
+    for name, values in axes.items():
+        if name not in SWEEP_PARAMETERS:
+            raise ValueError(f"Cannot sweep parameter {name!r}")
+        if not 1 <= np.size(values) <= MAX_SWEEP_POINTS:
+            raise ValueError(
+                f"Expected 1 to {MAX_SWEEP_POINTS} values for {name!r}, got {np.size(values)}"
+            )
+
+    parameters = tuple(axes)
+    grid_axes = tuple(np.asarray(values, dtype=np.float64).ravel() for values in axes.values())
+    inputs = {**base, parameters[0]: grid_axes[0]}
+    if len(parameters) == 2:
+        inputs[parameters[1]] = grid_axes[1][:, None]
+    return SensitivitySweep(
+        parameters=parameters,
+        axes=grid_axes,
+        values=compute_llm_impacts_grid(**inputs),
+    )
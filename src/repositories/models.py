@@ -1,5 +1,9 @@
 import re
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
 import pandas as pd
 import streamlit as st
 
@@ -21,6 +25,9 @@ PROVIDERS_FORMAT = {
     "openai": "OpenAI",
 }
 
+DEFAULT_PROVIDER = "Anthropic"
+DEFAULT_MODEL = "Claude sonnet 4 6"
+
 
 def clean_model_name(model_name: str) -> str:
     # Define a mapping of characters to replace
@@ -110,20 +117,83 @@ def load_models(filter_main=True) -> pd.DataFrame:
     return pd.DataFrame(data)
 
 
+@dataclass(frozen=True)
+class ModelCatalog:
+    """Immutable hash indexes over a models DataFrame.
+
+    Attributes:
+        raw_names: (provider_clean, name_clean) -> (provider, name). The first
+            matching row wins, as with a DataFrame lookup.
+        provider_models: provider_clean -> sorted unique name_clean values.
+        providers: Sorted unique provider_clean values.
+        default_provider_index: Index of DEFAULT_PROVIDER in `providers`, or 0.
+        default_model_indices: provider_clean -> index of DEFAULT_MODEL in the
+            provider's models, or 0.
+    """
+
+    raw_names: Mapping[tuple[str, str], tuple[str, str]]
+    provider_models: Mapping[str, tuple[str, ...]]
+    providers: tuple[str, ...]
+    default_provider_index: int
+    default_model_indices: Mapping[str, int]
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "ModelCatalog":
+        raw_names: dict[tuple[str, str], tuple[str, str]] = {}
+        provider_models: dict[str, set[str]] = {}
+        if not df.empty:
+            for provider_clean, name_clean, provider, name in zip(
+                df["provider_clean"], df["name_clean"], df["provider"], df["name"], strict=True
+            ):
+                raw_names.setdefault((provider_clean, name_clean), (provider, name))
+                provider_models.setdefault(provider_clean, set()).add(name_clean)
+
+        sorted_models = {
+            provider: tuple(sorted(names)) for provider, names in provider_models.items()
+        }
+        providers = tuple(sorted(sorted_models))
+        return cls(
+            raw_names=MappingProxyType(raw_names),
+            provider_models=MappingProxyType(sorted_models),
+            providers=providers,
+            default_provider_index=_index_or_zero(providers, DEFAULT_PROVIDER),
+            default_model_indices=MappingProxyType(
+                {
+                    provider: _index_or_zero(models, DEFAULT_MODEL)
+                    for provider, models in sorted_models.items()
+                }
+            ),
+        )
+
+
+def _index_or_zero(values: tuple[str, ...], value: str) -> int:
+    return values.index(value) if value in values else 0
+
+
+@st.cache_resource
+def load_model_catalog(filter_main=True) -> ModelCatalog:
+    """Build the lookup indexes of `load_models` once per process."""
+    return ModelCatalog.from_dataframe(load_models(filter_main=filter_main))
+
+
 def get_raw_model_names(
-    df: pd.DataFrame, provider_clean: str, model_clean: str
+    models: pd.DataFrame | ModelCatalog, provider_clean: str, model_clean: str
 ) -> tuple[str, str] | None:
     """Extract raw provider and model names from filtered models dataframe.
 
     Args:
-        df: DataFrame with model data containing 'provider_clean', 'name_clean',
-            'provider', and 'name' columns.
+        models: Model catalog, or DataFrame with model data containing
+            'provider_clean', 'name_clean', 'provider', and 'name' columns.
         provider_clean: The cleaned provider name to search for.
         model_clean: The cleaned model name to search for.
 
     Returns:
         Tuple of (provider_raw, model_raw) if found, None otherwise.
     """
+    if isinstance(models, ModelCatalog):
+        return models.raw_names.get((provider_clean, model_clean))
+
+    df = models
     df_filtered = df[(df["provider_clean"] == provider_clean) & (df["name_clean"] == model_clean)]
     if df_filtered.empty:
         return None
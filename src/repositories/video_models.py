@@ -3,7 +3,7 @@ import streamlit as st
 
 from ecologits.estimations.video import _video_models_data, duration_to_frames
 
-from src.repositories.models import clean_model_name
+from src.repositories.models import ModelCatalog, clean_model_name
 
 VIDEO_PROVIDERS_FORMAT = {
     "alibaba": "Alibaba",
@@ -66,3 +66,21 @@ def load_video_models(
         )
 
     return pd.DataFrame(data)
+
+
+@st.cache_resource
+def load_video_model_catalog(
+    resolution: str | None = None,
+    duration: float | None = None,
+    with_audio: bool | None = None,
+    extrapolate_resolution: bool = False,
+) -> ModelCatalog:
+    """Build the lookup indexes of `load_video_models` once per filter set."""
+    return ModelCatalog.from_dataframe(
+        load_video_models(
+            resolution=resolution,
+            duration=duration,
+            with_audio=with_audio,
+            extrapolate_resolution=extrapolate_resolution,
+        )
+    )
@@ -0,0 +1,72 @@
+"""Static assets (stylesheet and images) read once per process.
+
+Streamlit reruns the whole script on every widget interaction, so assets are kept
+in memory instead of being re-read from disk. Set `ECOLOGITS_CALCULATOR_DEV=1` to
+reload an asset whenever its file changes.
+"""
+
+import logging
+import os
+import re
+import time
+
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+DEV_MODE_ENV = "ECOLOGITS_CALCULATOR_DEV"
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+STYLESHEET_PATH = ROOT_DIR / "src" / "ui" / "style.css"
+LOGO_PATH = ROOT_DIR / "assets" / "ecologits-logo.png"
+FOOTER_LOGO_PATH = ROOT_DIR / "assets" / "logo.png"
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACE = re.compile(r"\s*([{};,])\s*")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    return _CSS_PUNCTUATION_SPACE.sub(r"\1", css).strip()
+
+
+def _version(path: Path) -> float:
+    """Return the cache version of an asset: its mtime in dev mode, 0 otherwise."""
+    if os.environ.get(DEV_MODE_ENV):
+        return path.stat().st_mtime
+    return 0.0
+
+
+@lru_cache(maxsize=8)
+def _read_css(path: Path, version: float) -> str:
+    return minify_css(path.read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=8)
+def _read_bytes(path: Path, version: float) -> bytes:
+    return path.read_bytes()
+
+
+def load_css(path: Path = STYLESHEET_PATH) -> str:
+    """Return the minified stylesheet, read once per process (or per change in dev)."""
+    return _read_css(path, _version(path))
+
+
+def load_image(path: Path) -> bytes:
+    """Return the image bytes, read once per process (or per change in dev)."""
+    return _read_bytes(path, _version(path))
+
+
+def render_static_assets() -> None:
+    """Render the app stylesheet and logo, logging the time spent on assets."""
+    start = time.perf_counter()
+    st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+    st.logo(load_image(LOGO_PATH), size="small", link="https://ecologits.ai/")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug(f"Static assets handled in {elapsed_ms:.2f} ms")
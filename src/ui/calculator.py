@@ -1,10 +1,11 @@
+import threading
+
 import streamlit as st
 
 from src.config.scenarios import SCENARIOS, Scenario
-from src.core.formatting import format_impacts
-from src.core.impact_calculator import compute_scenario_impacts
-from src.repositories.models import get_raw_model_names, load_models
-from src.repositories.video_models import load_video_models
+from src.core.scenario_matrix import ScenarioMatrix
+from src.repositories.models import ModelCatalog, get_raw_model_names, load_model_catalog
+from src.repositories.video_models import load_video_model_catalog
 from src.ui.components import render_model_selector
 from src.ui.equivalents import (
     display_equivalents,
@@ -22,15 +23,54 @@ def _render_scenario_selector() -> Scenario:
     return next(scenario for scenario in SCENARIOS if scenario.label == scenario_label)
 
 
-def _load_compatible_models(scenario: Scenario):
+def _load_compatible_models(scenario: Scenario) -> ModelCatalog:
     if scenario.modality == "video":
-        return load_video_models(
+        return load_video_model_catalog(
             resolution=scenario.resolution,
             duration=scenario.duration,
             with_audio=scenario.with_audio,
             extrapolate_resolution=scenario.extrapolate_resolution,
         )
-    return load_models(filter_main=True)
+    return load_model_catalog(filter_main=True)
+
+
+def _scenario_pairs() -> list[tuple[Scenario, str, str]]:
+    """List every (scenario, raw provider, raw model) choice of the calculator.
+
+    The model selected by default in each scenario comes first, so the pairs a
+    new session renders first are the first ones precomputed.
+    """
+    defaults: list[tuple[Scenario, str, str]] = []
+    others: list[tuple[Scenario, str, str]] = []
+    for scenario in SCENARIOS:
+        catalog = _load_compatible_models(scenario)
+        default = None
+        if catalog.providers:
+            provider = catalog.providers[catalog.default_provider_index]
+            index = catalog.default_model_indices.get(provider, 0)
+            model = catalog.provider_models[provider][index]
+            default = catalog.raw_names.get((provider, model))
+        for raw_names in dict.fromkeys(catalog.raw_names.values()):
+            (defaults if raw_names == default else others).append((scenario, *raw_names))
+    return defaults + others
+
+
+@st.cache_resource
+def start_scenario_matrix() -> ScenarioMatrix:
+    """Create the process-wide scenario matrix and start warming it up.
+
+    Called once per process at app startup. The pairs are listed here, in the
+    script thread, as the catalog loaders are Streamlit-cached; the warm-up
+    thread itself only runs ecologits and is not tied to any session.
+    """
+    matrix = ScenarioMatrix()
+    threading.Thread(
+        target=matrix.warm_up,
+        args=(_scenario_pairs(),),
+        name="scenario-matrix-warm-up",
+        daemon=True,
+    ).start()
+    return matrix
 
 
 def _scenario_context_text(scenario: Scenario) -> str | None:
@@ -68,41 +108,37 @@ def calculator_mode():
         with col1:
             scenario = _render_scenario_selector()
 
-        df = _load_compatible_models(scenario)
-        if df.empty:
+        catalog = _load_compatible_models(scenario)
+        if not catalog.providers:
             st.error("No compatible model is available for this task.")
             return
 
-        provider, model = render_model_selector(df, col2, col3, key_suffix="calc")
+        provider, model = render_model_selector(catalog, col2, col3, key_suffix="calc")
 
         # Display only electricity, carbon footprint, water, and minerals
         list_impacts = ["Electricity", "Carbon Footprint", "Water", "Metals & Minerals"]
 
         # WARNING DISPLAY
-        raw_names = get_raw_model_names(df, provider, model)
+        raw_names = get_raw_model_names(catalog, provider, model)
         if raw_names is None:
             st.error("Selected model not found. Please select a different model.")
             return
         provider_raw, model_raw = raw_names
 
-        impacts = compute_scenario_impacts(
-            scenario=scenario,
-            provider=provider_raw,
-            model_name=model_raw,
-        )
+        result = start_scenario_matrix().get(scenario, provider_raw, model_raw)
 
         context_parts = []
         scenario_text = _scenario_context_text(scenario)
         if scenario_text:
             icon = "🎬" if scenario.modality == "video" else "✍️"
             context_parts.append(f"{icon} {scenario_text}")
-        warning_text = _combine_warnings(impacts.warnings)
+        warning_text = _combine_warnings(result.warnings)
         if warning_text:
             context_parts.append(f"⚠️ {warning_text}")
         if context_parts:
             st.caption(" · ".join(context_parts))
 
-        impacts_formatted, _, _ = format_impacts(impacts)
+        impacts_formatted = result.impacts
 
         # st.write(impacts)
 
@@ -124,4 +160,9 @@ def calculator_mode():
             key="impacts_at_scale",
             help="The scale we implemented is a daily replication of the given usage by 1% of the world population.",
         )
-        display_equivalents(impacts_formatted, how=equivalents_mode, show_title=False)
+        display_equivalents(
+            impacts_formatted,
+            how=equivalents_mode,
+            show_title=False,
+            equivalents=result.equivalents,
+        )
@@ -3,14 +3,14 @@ import logging
 import streamlit as st
 
 from ecologits.electricity_mix_repository import electricity_mixes
-from ecologits.tracers.utils import llm_impacts
 
 from src.config.constants import COUNTRY_CODES, TIME_HORIZONS
+from src.core.coefficients import get_impact_coefficients
 from src.core.formatting import format_impacts
 from src.repositories.electricity_mix import (
     format_country_name,
 )
-from src.repositories.models import get_raw_model_names, load_models
+from src.repositories.models import get_raw_model_names, load_model_catalog
 from src.ui.components import (
     display_electricity_mix_warnings,
     display_model_warnings,
@@ -22,11 +22,11 @@ from src.ui.impacts import display_impacts
 
 def company_mode():
     with st.container(border=True):
-        df = load_models(filter_main=True)
+        catalog = load_model_catalog(filter_main=True)
 
         col1, col2, col3 = st.columns(3)
 
-        provider, model = render_model_selector(df, col1, col2, key_suffix="comp")
+        provider, model = render_model_selector(catalog, col1, col2, key_suffix="comp")
 
         n_employees = col3.number_input(
             label="Number of employees using AI tools",
@@ -86,19 +86,19 @@ def company_mode():
         electricity_mix = electricity_mixes.find_electricity_mix(dc_location)
 
         # WARNING DISPLAY
-        raw_names = get_raw_model_names(df, provider, model)
+        raw_names = get_raw_model_names(catalog, provider, model)
         if raw_names is None:
             st.error("Selected model not found. Please select a different model.")
             return
         provider_raw, model_raw = raw_names
 
-        impacts = llm_impacts(
-            provider=provider_raw,
-            model_name=model_raw,
-            output_token_count=output_tokens_count * time_horizon,
-            request_latency=float("inf"),
-            electricity_mix_zone=electricity_mix.zone,
-        )
+        # Coefficients are cached per (model, zone): changing the number of employees,
+        # the usage or the time horizon only re-evaluates the affine model.
+        coefficients = get_impact_coefficients(provider_raw, model_raw, electricity_mix.zone)
+        if coefficients is None:
+            st.error("Impacts could not be computed for the selected model and location.")
+            return
+        impacts = coefficients.impacts_at(output_tokens_count * time_horizon)
         if impacts.warnings:
             display_model_warnings(impacts)
 
@@ -1,8 +1,9 @@
 from html import escape
 
-import pandas as pd
 import streamlit as st
 
+from src.repositories.models import ModelCatalog
+
 
 def render_environment_card(
     *,
@@ -52,30 +53,23 @@ def render_environment_card_html(
 
 
 def render_model_selector(
-    df: pd.DataFrame, col_provider, col_model, key_suffix: str = ""
+    catalog: ModelCatalog, col_provider, col_model, key_suffix: str = ""
 ) -> tuple[str, str]:
     with col_provider:
-        providers_clean = sorted(df["provider_clean"].unique())
-        # Default to OpenAI if available
-        default_index = providers_clean.index("Anthropic") if "Anthropic" in providers_clean else 0
-
         provider = st.selectbox(
             label="Provider",
-            options=providers_clean,
-            index=default_index,
+            options=catalog.providers,
+            index=catalog.default_provider_index,
             key=f"provider_select_{key_suffix}",
         )
 
     with col_model:
-        models_clean = sorted(
-            [
-                x
-                for x in df["name_clean"].unique()
-                if x in df[df["provider_clean"] == provider]["name_clean"].unique()
-            ]
+        model = st.selectbox(
+            label="Model",
+            options=catalog.provider_models.get(provider, ()),
+            key=f"model_select_{key_suffix}",
+            index=catalog.default_model_indices.get(provider, 0),
         )
-        default_model_index = models_clean.index("Claude sonnet 4 6") if "Claude sonnet 4 6" in models_clean else 0
-        model = st.selectbox(label="Model", options=models_clean, key=f"model_select_{key_suffix}", index=default_model_index)
 
     return provider, model
 
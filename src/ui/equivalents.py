@@ -5,18 +5,7 @@ from src.core.equivalences import (
     EnergyProduction,
     EquivalentType,
     PhysicalActivity,
-    format_adpe_eq_iphone,
-    format_adpe_eq_nvidia,
-    format_energy_eq_electric_vehicle,
-    format_energy_eq_electricity_consumption_ireland,
-    format_energy_eq_electricity_production,
-    format_energy_eq_physical_activity,
-    format_gwp_eq_airplane_paris_nyc,
-    format_gwp_eq_streaming,
-    format_gwp_eq_vehicle,
-    format_wue_eq_drops,
-    format_wue_eq_pints,
-    format_wue_eq_pools,
+    compute_equivalent,
 )
 from src.ui.components import render_environment_card
 
@@ -62,9 +51,16 @@ def render_equivalent(value, unit="", emoji="", name="", text=""):
     )
 
 
-def display_equivalent_energy(impacts, type=EquivalentType.EV, how="unit"):
+def _equivalent(impacts, equivalent_type, equivalents=None):
+    """Return a precomputed equivalent, or compute it from the impacts."""
+    if equivalents is not None and equivalent_type in equivalents:
+        return equivalents[equivalent_type]
+    return compute_equivalent(impacts, equivalent_type)
+
+
+def display_equivalent_energy(impacts, type=EquivalentType.EV, how="unit", equivalents=None):
     if type == EquivalentType.EV:
-        ev_eq = format_energy_eq_electric_vehicle(impacts.energy)
+        ev_eq = _equivalent(impacts, EquivalentType.EV, equivalents)
         render_equivalent(
             value=f"{ev_eq.magnitude:.1f}",
             unit=f"{ev_eq.units:~}",
@@ -74,7 +70,7 @@ def display_equivalent_energy(impacts, type=EquivalentType.EV, how="unit"):
         )
 
     elif type == EquivalentType.SPORT:
-        physical_activity, distance = format_energy_eq_physical_activity(impacts.energy)
+        physical_activity, distance = _equivalent(impacts, EquivalentType.SPORT, equivalents)
         if physical_activity == PhysicalActivity.WALKING:
             emoji = "🚶"
         elif physical_activity == PhysicalActivity.RUNNING:
@@ -89,7 +85,7 @@ def display_equivalent_energy(impacts, type=EquivalentType.EV, how="unit"):
         )
 
     elif type == EquivalentType.EPROD:
-        electricity_production, count = format_energy_eq_electricity_production(impacts.energy)
+        electricity_production, count = _equivalent(impacts, EquivalentType.EPROD, equivalents)
         if electricity_production == EnergyProduction.NUCLEAR:
             emoji = "☢️"
             name = "Nuclear power plants"
@@ -104,7 +100,7 @@ def display_equivalent_energy(impacts, type=EquivalentType.EV, how="unit"):
         )
 
     elif type == EquivalentType.ECONS:
-        ireland_count = format_energy_eq_electricity_consumption_ireland(impacts.energy)
+        ireland_count = _equivalent(impacts, EquivalentType.ECONS, equivalents)
         render_equivalent(
             value=f"{ireland_count.magnitude:.3f}",
             unit="x Ireland",
@@ -113,9 +109,9 @@ def display_equivalent_energy(impacts, type=EquivalentType.EV, how="unit"):
         )
 
 
-def display_equivalent_ghg(impacts, type=EquivalentType.PLANE):
+def display_equivalent_ghg(impacts, type=EquivalentType.PLANE, equivalents=None):
     if type == EquivalentType.STREAMING:
-        streaming_eq = format_gwp_eq_streaming(impacts.gwp)
+        streaming_eq = _equivalent(impacts, EquivalentType.STREAMING, equivalents)
         render_equivalent(
             value=f"{streaming_eq.magnitude:.2f}",
             unit=f"{streaming_eq.units:~}",
@@ -124,7 +120,7 @@ def display_equivalent_ghg(impacts, type=EquivalentType.PLANE):
             text="based on GHG emissions",
         )
     elif type == EquivalentType.PLANE:
-        paris_nyc_airplane = format_gwp_eq_airplane_paris_nyc(impacts.gwp)
+        paris_nyc_airplane = _equivalent(impacts, EquivalentType.PLANE, equivalents)
         render_equivalent(
             value=f"{int(paris_nyc_airplane.magnitude):,}",
             emoji="✈️",
@@ -132,7 +128,7 @@ def display_equivalent_ghg(impacts, type=EquivalentType.PLANE):
             text="based on GHG emissions",
         )
     elif type == EquivalentType.THERMIC_VEHICLE:
-        thermic_vehicle_eq = format_gwp_eq_vehicle(impacts.gwp)
+        thermic_vehicle_eq = _equivalent(impacts, EquivalentType.THERMIC_VEHICLE, equivalents)
         render_equivalent(
             value=f"{thermic_vehicle_eq.magnitude:.1f}",
             unit=f"{thermic_vehicle_eq.units:~}",
@@ -142,9 +138,9 @@ def display_equivalent_ghg(impacts, type=EquivalentType.PLANE):
         )
 
 
-def display_equivalent_adpe(impacts, type=EquivalentType.NVIDIA):
+def display_equivalent_adpe(impacts, type=EquivalentType.NVIDIA, equivalents=None):
     if type == EquivalentType.NVIDIA:
-        nvdia_eq = format_adpe_eq_nvidia(impacts.adpe)
+        nvdia_eq = _equivalent(impacts, EquivalentType.NVIDIA, equivalents)
         render_equivalent(
             value=f"{int(nvdia_eq.magnitude):,}",
             emoji="🕹️",
@@ -153,7 +149,7 @@ def display_equivalent_adpe(impacts, type=EquivalentType.NVIDIA):
         )
 
     elif type == EquivalentType.IPHONE:
-        iphone_eq = format_adpe_eq_iphone(impacts.adpe)
+        iphone_eq = _equivalent(impacts, EquivalentType.IPHONE, equivalents)
         render_equivalent(
             value=f"{int(iphone_eq.magnitude):,}",
             emoji="📱",
@@ -162,9 +158,9 @@ def display_equivalent_adpe(impacts, type=EquivalentType.NVIDIA):
         )
 
 
-def display_equivalent_wcf(impacts, type=EquivalentType.POOL):
+def display_equivalent_wcf(impacts, type=EquivalentType.POOL, equivalents=None):
     if type == EquivalentType.POOL:
-        pool_eq = format_wue_eq_pools(impacts.wcf)
+        pool_eq = _equivalent(impacts, EquivalentType.POOL, equivalents)
         render_equivalent(
             value=f"{int(pool_eq.magnitude):,}",
             emoji="🏊🏼‍♂️",
@@ -172,7 +168,7 @@ def display_equivalent_wcf(impacts, type=EquivalentType.POOL):
             text="based on water use",
         )
     elif type == EquivalentType.DROP:
-        drop_eq = format_wue_eq_drops(impacts.wcf)
+        drop_eq = _equivalent(impacts, EquivalentType.DROP, equivalents)
         render_equivalent(
             value=f"{int(drop_eq.magnitude):,}",
             emoji="💦",
@@ -180,7 +176,7 @@ def display_equivalent_wcf(impacts, type=EquivalentType.POOL):
             text="based on water use",
         )
     elif type == EquivalentType.PINTS:
-        pint_eq = format_wue_eq_pints(impacts.wcf)
+        pint_eq = _equivalent(impacts, EquivalentType.PINTS, equivalents)
         render_equivalent(
             value=f"{int(pint_eq.magnitude):,}",
             emoji="🍺",
@@ -189,20 +185,20 @@ def display_equivalent_wcf(impacts, type=EquivalentType.POOL):
         )
 
 
-def display_equivalents(impacts, how="at_scale", show_title=True):
+def display_equivalents(impacts, how="at_scale", show_title=True, equivalents=None):
     if show_title:
         render_equivalents_title(how)
 
     if how == "at_scale":
         col_eq_energy, col_eq_ghg, col_eq_water, col_eq_adpe = st.columns(4)
         with col_eq_adpe:
-            display_equivalent_adpe(impacts, type=EQ_KPIS[how]["adpe"])
+            display_equivalent_adpe(impacts, type=EQ_KPIS[how]["adpe"], equivalents=equivalents)
     else:
         col_eq_energy, col_eq_ghg, col_eq_water = st.columns(3)
 
     with col_eq_energy:
-        display_equivalent_energy(impacts, type=EQ_KPIS[how]["energy"])
+        display_equivalent_energy(impacts, type=EQ_KPIS[how]["energy"], equivalents=equivalents)
     with col_eq_ghg:
-        display_equivalent_ghg(impacts, type=EQ_KPIS[how]["ghg"])
+        display_equivalent_ghg(impacts, type=EQ_KPIS[how]["ghg"], equivalents=equivalents)
     with col_eq_water:
-        display_equivalent_wcf(impacts, type=EQ_KPIS[how]["wcf"])
+        display_equivalent_wcf(impacts, type=EQ_KPIS[how]["wcf"], equivalents=equivalents)
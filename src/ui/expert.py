@@ -1,5 +1,6 @@
 import logging
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
@@ -10,16 +11,24 @@ from ecologits.utils.range_value import RangeValue
 
 from src.config.constants import COUNTRY_CODES, PROMPTS
 from src.core.formatting import format_impacts
-from src.repositories.electricity_mix import (
-    format_country_name,
-    format_electricity_mix_criterion,
-)
-from src.repositories.models import get_raw_model_names, load_models
+from src.core.location_sweep import LOCATION_CRITERIA, sweep_locations
+from src.core.sensitivity import SWEEP_PARAMETERS, sweep_parameters
+from src.repositories.electricity_mix import format_country_name
+from src.repositories.models import get_raw_model_names, load_model_catalog, load_models
 from src.ui.components import display_electricity_mix_warnings, render_model_selector
 from src.ui.impacts import display_impacts
 
 logger = logging.getLogger(__name__)
 
+LOCATION_CRITERION_LABELS = {
+    "gwp": "GHG emissions (GWP)",
+    "adpe": "Abiotic resources (ADPe)",
+    "pe": "Primary energy (PE)",
+    "wcf": "Water consumption (WCF)",
+}
+
+SENSITIVITY_CRITERION_LABELS = {"energy": "Energy", **LOCATION_CRITERION_LABELS}
+
 
 def extract_param_value(value: float | dict) -> int:
     """Extract parameter count from scalar or RangeValue dict.
@@ -64,6 +73,112 @@ def impact_param_value(raw_value: float | dict, displayed_value: int):
     return RangeValue(min=raw_value["min"], max=raw_value["max"])
 
 
+def _current_value(value) -> float:
+    return value.mean if isinstance(value, RangeValue) else float(value)
+
+
+def _default_sweep_range(parameter: str, value: float) -> tuple[float, float]:
+    """Return a sweep range around the current value of a parameter."""
+    if parameter == "datacenter_pue":
+        return 1.0, max(2.0, 1.5 * value)
+    if value <= 0:
+        return 0.0, 1.0
+    return 0.5 * value, 2.0 * value
+
+
+def render_sensitivity(impact_inputs: dict):
+    """Chart the impacts of the configured request while varying one or two inputs."""
+    st.markdown(
+        '<h4 align="center">How do the inputs drive the footprint ?</h4>',
+        unsafe_allow_html=True,
+    )
+
+    parameters_col, criterion_col, resolution_col = st.columns([2, 1, 1])
+    with parameters_col:
+        parameters = st.multiselect(
+            label="Parameters to vary (up to two)",
+            options=list(SWEEP_PARAMETERS),
+            format_func=SWEEP_PARAMETERS.__getitem__,
+            default=["datacenter_pue"],
+            max_selections=2,
+        )
+    with criterion_col:
+        criterion = st.selectbox(
+            label="Impact",
+            options=list(SENSITIVITY_CRITERION_LABELS),
+            format_func=SENSITIVITY_CRITERION_LABELS.__getitem__,
+            index=1,
+        )
+    with resolution_col:
+        points = st.select_slider("Grid resolution", options=[10, 25, 50, 100], value=50)
+
+    if not parameters:
+        st.info("Select at least one parameter to vary.")
+        return
+
+    axes = {}
+    for parameter in parameters:
+        low, high = _default_sweep_range(parameter, _current_value(impact_inputs[parameter]))
+        from_col, to_col = st.columns(2)
+        with from_col:
+            low = st.number_input(f"{SWEEP_PARAMETERS[parameter]} from", value=low, min_value=0.0)
+        with to_col:
+            high = st.number_input(f"{SWEEP_PARAMETERS[parameter]} to", value=high, min_value=0.0)
+        axes[parameter] = np.linspace(low, high, points)
+
+    try:
+        sweep = sweep_parameters(impact_inputs, axes)
+        mean, unit = sweep.scaled(criterion)
+        impact_label = f"{SENSITIVITY_CRITERION_LABELS[criterion]} ({unit})"
+        current = [_current_value(impact_inputs[parameter]) for parameter in parameters]
+
+        if len(parameters) == 1:
+            low, _ = sweep.scaled(criterion, "min")
+            high, _ = sweep.scaled(criterion, "max")
+            df_sweep = pd.DataFrame({"value": sweep.axes[0], "mean": mean, "min": low, "max": high})
+            fig = px.line(
+                df_sweep,
+                x="value",
+                y=["mean", "min", "max"] if not np.allclose(low, high) else ["mean"],
+                labels={"value": SWEEP_PARAMETERS[parameters[0]], "variable": ""},
+                color_discrete_sequence=["#00BF63", "#0B3B36", "#0B3B36"],
+            )
+            fig.update_layout(yaxis_title=impact_label, legend_title_text="")
+            fig.add_vline(x=current[0], line_dash="dot")
+        else:
+            fig = px.imshow(
+                mean,
+                x=sweep.axes[0],
+                y=sweep.axes[1],
+                origin="lower",
+                aspect="auto",
+                labels={
+                    "x": SWEEP_PARAMETERS[parameters[0]],
+                    "y": SWEEP_PARAMETERS[parameters[1]],
+                    "color": impact_label,
+                },
+                color_continuous_scale=["#00BF63", "#0B3B36"],
+            )
+            fig.add_scatter(
+                x=[current[0]],
+                y=[current[1]],
+                mode="markers",
+                marker={"symbol": "x", "size": 12, "color": "white"},
+                showlegend=False,
+                hoverinfo="skip",
+            )
+
+        st.plotly_chart(fig)
+        st.caption(
+            "Impacts of the request configured above over the selected range; "
+            "the dotted line or cross marks the current configuration."
+        )
+
+    except ValueError as e:
+        logger.error(f"Invalid sensitivity sweep: {e}")
+        st.warning(f"Unable to display chart: {e}")
+
+
 def expert_mode():
     with st.container(border=True):
         st.markdown('<h3 align="center">Calculator Expert Mode</h3>', unsafe_allow_html=True)
@@ -75,12 +190,13 @@ def expert_mode():
         provider_col, model_col = st.columns(2)
 
         df = load_models(filter_main=False)
+        catalog = load_model_catalog(filter_main=False)
 
         provider_exp, model_exp = render_model_selector(
-            df, provider_col, model_col, key_suffix="exp"
+            catalog, provider_col, model_col, key_suffix="exp"
         )
 
-        raw_names = get_raw_model_names(df, provider_exp, model_exp)
+        raw_names = get_raw_model_names(catalog, provider_exp, model_exp)
         if raw_names is None:
             st.error("Selected model not found. Please select a different model.")
             return
@@ -193,21 +309,22 @@ def expert_mode():
         if electricity_mix and electricity_mix.has_warnings:
             display_electricity_mix_warnings(electricity_mix)
 
-    impacts = compute_llm_impacts(
-        model_active_parameter_count=impact_param_value(active_params_raw, active_params),
-        model_total_parameter_count=impact_param_value(total_params_raw, total_params),
-        output_token_count=output_tokens,
-        tps=tps,
-        ttft=ttft,
-        if_electricity_mix_gwp=em_gwp,
-        if_electricity_mix_adpe=em_adpe,
-        if_electricity_mix_pe=em_pe,
-        if_electricity_mix_wue=em_wue,
-        datacenter_pue=datacenter_pue,
-        datacenter_wue=datacenter_wue,
-    )
-
-    impacts, usage, embodied = format_impacts(impacts)
+    impact_inputs = {
+        "model_active_parameter_count": impact_param_value(active_params_raw, active_params),
+        "model_total_parameter_count": impact_param_value(total_params_raw, total_params),
+        "output_token_count": output_tokens,
+        "tps": tps,
+        "ttft": ttft,
+        "if_electricity_mix_gwp": em_gwp,
+        "if_electricity_mix_adpe": em_adpe,
+        "if_electricity_mix_pe": em_pe,
+        "if_electricity_mix_wue": em_wue,
+        "datacenter_pue": datacenter_pue,
+        "datacenter_wue": datacenter_wue,
+    }
+    request_impacts = compute_llm_impacts(**impact_inputs)
+
+    impacts, usage, embodied = format_impacts(request_impacts)
 
     with st.container(border=True):
         st.markdown(
@@ -282,49 +399,61 @@ def expert_mode():
 
             st.plotly_chart(fig_pe)
 
+    with st.expander("📈 Sensitivity analysis"):
+        render_sensitivity(impact_inputs)
+
     with st.expander("🌍️ Location impact"):
         st.markdown(
             '<h4 align="center">How can location impact the footprint ?</h4>',
             unsafe_allow_html=True,
         )
 
+        impact_type = st.selectbox(
+            label="Select an impact type to compare",
+            options=list(LOCATION_CRITERIA),
+            format_func=LOCATION_CRITERION_LABELS.__getitem__,
+            index=0,
+        )
+
         countries_to_compare = st.multiselect(
-            label="Countries to compare",
+            label="Countries to highlight",
             options=[c[1] for c in COUNTRY_CODES],
             format_func=format_country_name,
             default=["FRA", "USA", "CHN"],
         )
 
-        impact_type = st.selectbox(
-            label="Select an impact type to compare",
-            options=["gwp", "adpe", "pe", "wue"],
-            format_func=format_electricity_mix_criterion,
-            index=0,
-        )
-
         try:
-            df_comp = pd.DataFrame(
-                [
-                    em
-                    for em in electricity_mixes.list_electricity_mixes()
-                    if em.zone in countries_to_compare
-                ]
-            )
+            sweep = sweep_locations(request_impacts, datacenter_pue, datacenter_wue)
+            df_comp = sweep.to_frame(impact_type)
             if df_comp.empty:
-                st.warning("No electricity mix data available for selected countries.")
+                st.warning("No electricity mix data available.")
                 return
 
-            df_comp = df_comp.sort_values(by=impact_type, ascending=True)
+            df_comp["country"] = [format_country_name(zone) or zone for zone in df_comp.zone]
+            df_comp["highlighted"] = df_comp.zone.isin(countries_to_compare)
+            df_comp["error_plus"] = df_comp["max"] - df_comp["mean"]
+            df_comp["error_minus"] = df_comp["mean"] - df_comp["min"]
+            unit = df_comp.unit.iloc[0]
 
             fig_2 = px.bar(
                 df_comp,
-                x=df_comp.zone.apply(format_country_name),
-                y=impact_type,
-                text=impact_type,
-                color=impact_type,
+                x="country",
+                y="mean",
+                error_y="error_plus",
+                error_y_minus="error_minus",
+                color="highlighted",
+                color_discrete_map={True: "#00BF63", False: "#0B3B36"},
+                labels={"country": "", "mean": f"{impact_type.upper()} ({unit})"},
+                hover_data={"highlighted": False, "mean": ":.3g"},
             )
+            fig_2.update_layout(showlegend=False, xaxis_tickangle=-60)
+            fig_2.update_xaxes(categoryorder="array", categoryarray=df_comp.country)
 
             st.plotly_chart(fig_2)
+            st.caption(
+                f"Impacts of this request if it ran in each of the {len(df_comp)} zones, "
+                "with the model and data center configured above."
+            )
 
         except KeyError as e:
             logger.error(f"Missing column in electricity mix data: {e}")
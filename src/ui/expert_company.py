@@ -1,33 +1,45 @@
-import io
+import hashlib
 import json
-import math
-import operator
+import logging
+import zipfile
 
-from collections import defaultdict
-from functools import reduce
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from ecologits.electricity_mix_repository import electricity_mixes
-from ecologits.tracers.utils import llm_impacts
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, JsCode
 
 from src.config.constants import COUNTRY_CODES, PROMPTS, TIME_HORIZONS, USAGE_INTENSITY
-from src.core.formatting import (
-    QImpacts,
-    format_adpe,
-    format_energy,
-    format_gwp,
-    format_impacts,
-    format_pe,
-    format_wcf,
+from src.core.batch import (
+    COL_IMPACTS_AVAILABLE,
+    COL_OUTPUT_TOKENS,
+    COL_ROW,
+    GROUP_COLUMNS,
+    IMPACT_COLUMNS,
+    UsagePlan,
+    evaluate_plan,
+    fetch_coefficients,
+    format_impact_columns,
+    normalize_locations,
+    plan_tokens,
+    plan_usage_impacts,
+    summarize_usage_impacts,
+    validate_usage,
 )
+from src.core.executor import CoefficientsExecutor
+from src.core.export import EXPORT_FORMATS, to_csv, to_parquet, to_xlsx
+from src.core.formatting import CRITERIA, STATS, QImpacts, QImpactsTable
 
 # from src.core.latency_estimator import latency_estimator
-from src.repositories.models import get_raw_model_names, load_models
+from src.repositories.models import ModelCatalog, load_model_catalog
 from src.ui.impacts import display_impacts
 
+logger = logging.getLogger(__name__)
+
 _COL_PROVIDER = "Provider"
 _COL_MODEL = "Model"
 _COL_USAGE_TYPE = "Usage Type"
@@ -39,6 +51,33 @@ _LOCATION_LABELS = [label for label, _ in COUNTRY_CODES]
 _LOCATION_LABEL_TO_CODE = dict(COUNTRY_CODES)
 _DEFAULT_LOCATION = _LOCATION_LABELS[0]  # "🌎 World"
 
+_INPUT_COLUMNS = [
+    _COL_PROVIDER,
+    _COL_MODEL,
+    _COL_USAGE_TYPE,
+    _COL_USAGE_INTENSITY,
+    _COL_NUM_USERS,
+    _COL_LOCATION,
+]
+
+# Session state key of the per-row results cache
+_ROW_RESULTS_KEY = "ec_row_results"
+
+# New rows computed between two progress updates
+_PROGRESS_BATCH_SIZE = 50
+
+# Summary table header of each impact criterion. Row impacts are evaluated on
+# daily output tokens, unlike the batch CLI which evaluates them over the time
+# horizon, so their columns are named as daily values.
+_IMPACT_DISPLAY_NAMES = {
+    "energy": "Daily Energy",
+    "gwp": "Daily GWP",
+    "adpe": "Daily ADPe",
+    "pe": "Daily PE",
+    "wcf": "Daily WCF",
+}
+_DAILY_IMPACT_COLUMNS = {column: f"daily_{column}" for column in IMPACT_COLUMNS}
+
 _EMPTY_ROW = {
     _COL_PROVIDER: None,
     _COL_MODEL: None,
@@ -58,16 +97,13 @@ function(params) {
 """)
 
 
-def _build_provider_models_map(df: pd.DataFrame) -> dict[str, list[str]]:
-    return {
-        provider: sorted(group["name_clean"].unique().tolist())
-        for provider, group in df.groupby("provider_clean")
-    }
+def _build_provider_models_map(catalog: ModelCatalog) -> dict[str, list[str]]:
+    return {provider: list(models) for provider, models in catalog.provider_models.items()}
 
 
-def _build_grid_options(df: pd.DataFrame) -> dict:
-    providers = sorted(df["provider_clean"].unique().tolist())
-    provider_models_map = _build_provider_models_map(df)
+def _build_grid_options(catalog: ModelCatalog) -> dict:
+    providers = sorted(catalog.provider_models)
+    provider_models_map = _build_provider_models_map(catalog)
     prompt_labels = [p.label for p in PROMPTS]
     intensity_keys = list(USAGE_INTENSITY.keys())
 
@@ -131,100 +167,181 @@ function(params) {{
     return gb.build()
 
 
-def _is_empty(value: object) -> bool:
-    """Return True for None, empty string, zero, or NaN."""
-    if value is None or value == "":
-        return True
-    try:
-        return math.isnan(float(value))  # type: ignore[arg-type]
-    except (TypeError, ValueError):
-        return False
-
-
-def _row_is_complete(row: dict) -> bool:
-    return all(
-        not _is_empty(row.get(col))
-        for col in [
-            _COL_PROVIDER,
-            _COL_MODEL,
-            _COL_USAGE_TYPE,
-            _COL_USAGE_INTENSITY,
-            _COL_NUM_USERS,
-        ]
-    )
+def _incomplete_rows(grid_df: pd.DataFrame) -> list[int]:
+    """Return 1-based indices of rows with an empty required cell (None, "" or NaN)."""
+    required = grid_df.reindex(columns=_INPUT_COLUMNS[:-1])
+    empty = required.isna() | required.astype(str).apply(lambda column: column.str.strip() == "")
+    return (np.flatnonzero(empty.any(axis=1).to_numpy()) + 1).tolist()
+
+
+def _invalid_user_rows(grid_df: pd.DataFrame) -> list[int]:
+    """Return 1-based indices of rows whose number of users is not a whole number >= 0."""
+    token_plan = plan_tokens(grid_df.reindex(columns=_INPUT_COLUMNS))
+    return (np.flatnonzero(token_plan.invalid_users) + 1).tolist()
 
 
-def _compute_row_tokens(row: dict) -> dict[str, int]:
-    """Compute daily token counts for a single filled row."""
-    prompt = next(p for p in PROMPTS if p.label == row[_COL_USAGE_TYPE])
-    daily_count = USAGE_INTENSITY[row[_COL_USAGE_INTENSITY]]
+def _read_upload(uploaded_file) -> pd.DataFrame:
+    """Read an uploaded CSV or XLSX file of grid rows.
+
+    Raises:
+        ValueError: If the file cannot be parsed.
+    """
+    if uploaded_file.name.lower().endswith(".csv"):
+        return pd.read_csv(uploaded_file)
 
-    # Validate and convert num_users to int
-    num_users_str = row[_COL_NUM_USERS]
-    if num_users_str is None or num_users_str == "":
-        raise ValueError("Number of users cannot be empty or None")
+    from openpyxl.utils.exceptions import InvalidFileException
 
     try:
-        num_users = int(num_users_str)
-        if num_users < 0:
-            raise ValueError(f"Number of users must be non-negative, got {num_users}")
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Invalid number of users value '{num_users_str}': {e}") from e
+        return pd.read_excel(uploaded_file, engine="openpyxl")
+    # Corrupt archives fail in zipfile, or in openpyxl when XLSX parts are missing
+    except (zipfile.BadZipFile, InvalidFileException, KeyError) as e:
+        raise ValueError(f"not a valid XLSX file ({e})") from e
 
-    multiplier = daily_count * num_users
-    return {
-        "output_tokens": prompt.output_tokens * multiplier,
-        "input_tokens": prompt.input_tokens * multiplier,
-        "cached_tokens": prompt.cached_tokens * multiplier,
-        "total_tokens": (prompt.output_tokens + prompt.input_tokens + prompt.cached_tokens)
-        * multiplier,
-    }
 
+def _render_upload(catalog: ModelCatalog) -> None:
+    """Render the bulk import of grid rows from a CSV/XLSX file.
 
-def _run_impacts(df_models: pd.DataFrame, row: dict, output_token_count: int):
-    """Run ecologits llm_impacts for a single row, returning formatted impacts or None."""
-    raw_names = get_raw_model_names(df_models, row[_COL_PROVIDER], row[_COL_MODEL])
-    if raw_names is None:
-        return None
-    provider_raw, model_raw = raw_names
-    location_code = _LOCATION_LABEL_TO_CODE.get(row.get(_COL_LOCATION, _DEFAULT_LOCATION), "WOR")
-
-    # estimated_latency = latency_estimator.estimate(
-    #     provider=provider_raw,
-    #     model_name=model_raw,
-    #     output_tokens=output_token_count,
-    #
-    result = llm_impacts(
-        provider=provider_raw,
-        model_name=model_raw,
-        output_token_count=output_token_count,
-        request_latency=float("inf"),
-        electricity_mix_zone=location_code,
-    )
-    if result.has_errors:
-        return None
-
-    impacts, _, _ = format_impacts(result)
-    return impacts
-
-
-def _aggregate_impacts(impacts_list: list[QImpacts]) -> QImpacts:
-    """Sum a list of QImpacts using pint's unit-aware arithmetic, then re-normalise scale."""
-    energy = reduce(operator.add, [i.energy for i in impacts_list])
-    gwp = reduce(operator.add, [i.gwp for i in impacts_list])
-    adpe = reduce(operator.add, [i.adpe for i in impacts_list])
-    pe = reduce(operator.add, [i.pe for i in impacts_list])
-    wcf = reduce(operator.add, [i.wcf for i in impacts_list])
-    return QImpacts(
-        energy=format_energy(energy.magnitude, str(energy.units)),
-        gwp=format_gwp(gwp.magnitude, str(gwp.units)),
-        adpe=format_adpe(adpe.magnitude, str(adpe.units)),
-        pe=format_pe(pe.magnitude, str(pe.units)),
-        wcf=format_wcf(wcf.magnitude, str(wcf.units)),
+    Valid files replace the grid rows; otherwise every invalid cell is listed.
+    """
+    with st.expander("📄 Import rows from a CSV or XLSX file"):
+        st.caption(
+            f"Columns: {', '.join(_INPUT_COLUMNS)}. Locations may be labels or alpha-3 "
+            "codes (e.g. FRA) and default to World. Importing replaces the current rows."
+        )
+        uploaded_file = st.file_uploader(
+            "Usage rows", type=["csv", "xlsx"], label_visibility="collapsed"
+        )
+        if uploaded_file is None or uploaded_file.file_id == st.session_state.get(
+            "ec_uploaded_file_id"
+        ):
+            return
+
+        try:
+            usage = _read_upload(uploaded_file)
+            errors = validate_usage(catalog, usage)
+        except ValueError as e:
+            st.error(f"Could not import {uploaded_file.name}: {e}", icon="🚨")
+            return
+        if len(errors):
+            n_rows = errors[COL_ROW].nunique()
+            st.error(
+                f"{len(errors)} invalid cell(s) in {n_rows} of {len(usage)} row(s), "
+                "nothing was imported.",
+                icon="🚨",
+            )
+            st.dataframe(errors, hide_index=True, width="stretch")
+            return
+
+        rows = normalize_locations(usage)[_INPUT_COLUMNS]
+        st.session_state["ec_grid_rows"] = rows.to_dict("records")
+        st.session_state["ec_grid_version"] += 1
+        st.session_state["ec_uploaded_file_id"] = uploaded_file.file_id
+        logger.info("Imported %d rows from %s", len(rows), uploaded_file.name)
+        st.rerun()
+
+
+@st.cache_resource
+def _get_executor() -> CoefficientsExecutor:
+    """Process-wide executor, so coefficient fits are shared across sessions."""
+    return CoefficientsExecutor()
+
+
+@dataclass(frozen=True)
+class _RowResult:
+    """Daily tokens and impacts of one grid row."""
+
+    tokens: dict[str, int]
+    values: np.ndarray  # (len(CRITERIA), len(STATS)), NaN when unavailable
+    ranges: bool
+    available: bool
+
+
+def _row_cache_key(row: dict) -> str:
+    """Hash the input fields of a row."""
+    fields = json.dumps([row.get(col) for col in _INPUT_COLUMNS], default=str)
+    return hashlib.blake2b(fields.encode(), digest_size=16).hexdigest()
+
+
+def _compute_new_rows(
+    catalog: ModelCatalog, rows: list[dict]
+) -> tuple[list[_RowResult], UsagePlan]:
+    """Compute tokens and impacts of rows, fitting each (model, zone) group once.
+
+    Rows with invalid token inputs get zero tokens and no impacts.
+    """
+    usage = pd.DataFrame(rows, columns=_INPUT_COLUMNS)
+    token_plan = plan_tokens(usage)
+
+    # Collapse rows into distinct (model, zone) groups: each group is fitted once
+    # and all its rows evaluated in one pass
+    executor = _get_executor()
+    fitted_before = executor.fitted_items
+    plan = plan_usage_impacts(catalog, usage)
+    row_impacts = evaluate_plan(plan, fetch_coefficients(plan, executor), token_plan.output_tokens)
+    available = row_impacts.available & token_plan.valid
+
+    logger.info(
+        "Computed impacts for %d rows from %d model/zone groups "
+        "(%d ecologits calls avoided, %d groups newly fitted)",
+        plan.n_rows,
+        len(plan.groups),
+        plan.avoided_calls,
+        executor.fitted_items - fitted_before,
     )
+    results = [
+        _RowResult(
+            tokens=token_plan.row_tokens(index),
+            values=row_impacts.values[index],
+            ranges=bool(row_impacts.ranges[index]),
+            available=bool(available[index]),
+        )
+        for index in range(len(rows))
+    ]
+    return results, plan
 
 
-def _render_grid(df_models: pd.DataFrame) -> dict:
+def _compute_rows(
+    catalog: ModelCatalog,
+    rows: list[dict],
+    on_batch: Callable[[list[_RowResult | None]], None] | None = None,
+) -> tuple[list[_RowResult], UsagePlan | None]:
+    """Compute tokens and impacts of every row, reusing results of unchanged rows.
+
+    Results are cached in session state by a hash of each row's inputs, so a run
+    after a few cell edits only computes the new or changed rows. New rows are
+    computed in batches of `_PROGRESS_BATCH_SIZE`; `on_batch` is called after each
+    batch with the results so far, None for rows not computed yet.
+
+    Returns the per-row results and the plan of the computed rows, or None when
+    every row was cached.
+    """
+    cache: dict[str, _RowResult] = st.session_state.setdefault(_ROW_RESULTS_KEY, {})
+    keys = [_row_cache_key(row) for row in rows]
+    new_rows = {key: row for key, row in zip(keys, rows, strict=True) if key not in cache}
+    logger.info("Reusing cached results for %d of %d rows", len(rows) - len(new_rows), len(rows))
+
+    new_keys = list(new_rows)
+    plans = []
+    for start in range(0, len(new_keys), _PROGRESS_BATCH_SIZE):
+        batch_keys = new_keys[start : start + _PROGRESS_BATCH_SIZE]
+        batch_results, batch_plan = _compute_new_rows(catalog, [new_rows[k] for k in batch_keys])
+        # Filled in place, so batches completed before an interrupted run are kept
+        cache.update(zip(batch_keys, batch_results, strict=True))
+        plans.append(batch_plan)
+        if on_batch is not None:
+            on_batch([cache.get(key) for key in keys])
+
+    # Drop results of rows no longer in the grid
+    st.session_state[_ROW_RESULTS_KEY] = {key: cache[key] for key in keys}
+    return [cache[key] for key in keys], (UsagePlan.concat(plans) if plans else None)
+
+
+def _aggregate_impacts(impacts: QImpactsTable, rows: list[int] | None = None) -> QImpacts:
+    """Sum mean, min and max impacts of the selected rows (all rows by default)."""
+    return impacts.total(rows)
+
+
+def _render_grid(catalog: ModelCatalog) -> dict:
     """Render the multi-row grid UI and handle Add/Remove/Run buttons.
 
     Returns a dict with keys:
@@ -233,7 +350,7 @@ def _render_grid(df_models: pd.DataFrame) -> dict:
     - 'run': bool indicating whether Run button was pressed
     """
     grid_df = pd.DataFrame(st.session_state["ec_grid_rows"])
-    grid_options = _build_grid_options(df_models)
+    grid_options = _build_grid_options(catalog)
 
     grid_response = AgGrid(
         grid_df,
@@ -268,7 +385,7 @@ def _render_grid(df_models: pd.DataFrame) -> dict:
             st.rerun()
 
     rows = st.session_state["ec_grid_rows"]
-    incomplete = [i + 1 for i, r in enumerate(rows) if not _row_is_complete(r)]
+    incomplete = _incomplete_rows(updated_df)
 
     if incomplete:
         st.warning(
@@ -277,12 +394,20 @@ def _render_grid(df_models: pd.DataFrame) -> dict:
             icon="⚠️",
         )
 
+    invalid_users = [i for i in _invalid_user_rows(updated_df) if i not in incomplete]
+    if invalid_users:
+        st.warning(
+            f"Some row(s) {invalid_users} have an invalid number of users. "
+            "Use a whole number of at least 0.",
+            icon="⚠️",
+        )
+
     with col_run:
         run = st.button(
             "▶ Run calculations",
             type="primary",
             width="stretch",
-            disabled=bool(incomplete) or not rows,
+            disabled=bool(incomplete) or bool(invalid_users) or not rows,
         )
 
     return {
@@ -292,10 +417,135 @@ def _render_grid(df_models: pd.DataFrame) -> dict:
     }
 
 
-def _aggregate_and_display(df_models: pd.DataFrame, rows: list, time_horizon_label: str) -> None:
-    """Compute impacts for all rows, aggregate by provider/model/location, and display results."""
+def _summarize_rows(
+    rows: list[dict], results: Sequence[_RowResult | None], time_horizon_label: str
+) -> tuple[pd.DataFrame, pd.DataFrame, QImpactsTable]:
+    """Aggregate computed rows by provider/model/location in one columnar pass.
+
+    Rows whose result is None (not computed yet) are skipped.
+
+    Returns the display summary table, the per-row detail table (inputs, horizon
+    output tokens and daily impacts in default units) and the impacts of rows
+    with impacts.
+    """
     time_horizon_days = TIME_HORIZONS.get(time_horizon_label, TIME_HORIZONS["Monthly"])
+    done = [(row, result) for row, result in zip(rows, results, strict=True) if result is not None]
+
+    usage = pd.DataFrame([row for row, _ in done], columns=_INPUT_COLUMNS)
+    usage[_COL_LOCATION] = usage[_COL_LOCATION].fillna(_DEFAULT_LOCATION)
+    usage[_COL_NUM_USERS] = pd.to_numeric(usage[_COL_NUM_USERS], errors="coerce")
+    output_tokens = np.array([result.tokens["output_tokens"] for _, result in done], dtype=np.int64)
+    available = np.array([result.available for _, result in done], dtype=bool)
+    values = np.stack([result.values for _, result in done]).reshape(len(done), -1)
+    values[~available] = np.nan
+
+    per_row = pd.concat(
+        [
+            usage.assign(
+                **{
+                    COL_OUTPUT_TOKENS: output_tokens * time_horizon_days,
+                    COL_IMPACTS_AVAILABLE: available,
+                }
+            ),
+            pd.DataFrame(values, columns=IMPACT_COLUMNS, index=usage.index),
+        ],
+        axis=1,
+    )
+    summary = summarize_usage_impacts(per_row)
+
+    tokens_column = f"{time_horizon_label} Output Tokens"
+    df_display = summary[[*GROUP_COLUMNS, COL_OUTPUT_TOKENS]].rename(
+        columns={COL_OUTPUT_TOKENS: tokens_column}
+    )
+    if available.any():
+        impact_text = format_impact_columns(summary).rename(columns=_IMPACT_DISPLAY_NAMES)
+        df_display = pd.concat([df_display, impact_text], axis=1)
+
+    all_impacts = QImpactsTable.from_arrays(
+        values[available].reshape(-1, len(CRITERIA), len(STATS)),
+        np.array([result.ranges for _, result in done], dtype=bool)[available],
+    )
+    return df_display, per_row.rename(columns=_DAILY_IMPACT_COLUMNS), all_impacts
+
+
+def _strip_location_flags(table: pd.DataFrame) -> pd.DataFrame:
+    """Return `table` with the flag emoji removed from usage location labels."""
+    return table.assign(**{_COL_LOCATION: table[_COL_LOCATION].str.split(" ", n=1).str[1]})
+
+
+@st.fragment
+def _render_export(
+    df_display: pd.DataFrame, per_row: pd.DataFrame, time_horizon_label: str
+) -> None:
+    """Render the export of the results, built only when the user asks for it.
+
+    Runs as a fragment so preparing a file does not rerun the calculations.
+    """
+    summary_name = f"{time_horizon_label} Token Summary"
+    tables = {
+        summary_name: df_display,
+        "Per-row Detail": per_row.rename(
+            columns={COL_OUTPUT_TOKENS: f"{time_horizon_label} Output Tokens"}
+        ),
+    }
+
+    with st.popover("⬇ Export"):
+        export_format = st.radio("Format", list(EXPORT_FORMATS), horizontal=True)
+        if export_format == "Excel":
+            st.caption("One sheet for the summary and one for the per-row detail.")
+            table_name = None
+        else:
+            table_name = st.radio("Table", list(tables), horizontal=True)
+
+        if not st.button("Prepare file", width="stretch"):
+            return
+
+        suffix, mime = EXPORT_FORMATS[export_format]
+        with st.spinner("Preparing file…"):
+            if table_name is None:
+                data = to_xlsx({name: _strip_location_flags(t) for name, t in tables.items()})
+            else:
+                table = _strip_location_flags(tables[table_name])
+                data = to_csv(table) if export_format == "CSV" else to_parquet(table)
+        file_stem = "expert_company_" + (table_name or "results").lower().replace(" ", "_")
+        st.download_button(
+            label=f"⬇ Download {export_format}",
+            data=data,
+            file_name=file_stem.replace("-", "_") + suffix,
+            mime=mime,
+            on_click="ignore",
+            width="stretch",
+        )
 
+
+def _display_totals(all_impacts: QImpactsTable, time_horizon_label: str) -> None:
+    """Display the aggregated impacts of all rows."""
+    aggregated = _aggregate_impacts(all_impacts)
+    with st.container(border=True):
+        st.markdown(
+            f"<h5 align='center'>Aggregated {time_horizon_label.lower()} environmental impacts</h5>",
+            # f"(all rows · {time_horizon_label.lower()})</h5>",
+            unsafe_allow_html=True,
+        )
+        display_impacts(
+            aggregated,
+            impacts_to_display=[
+                "Electricity",
+                "Carbon Footprint",
+                "Water",
+                "Metals & Minerals",
+                "Fossile Fuels",
+            ],
+            mode="company",
+        )
+
+
+def _aggregate_and_display(catalog: ModelCatalog, rows: list, time_horizon_label: str) -> None:
+    """Compute impacts for all rows, aggregate by provider/model/location, and display results.
+
+    Large grids are computed progressively: a progress bar, the partial summary
+    table and partial totals are updated after each batch of rows.
+    """
     # Check for electricity mix warnings in selected locations
     selected_locations = {row.get(_COL_LOCATION, _DEFAULT_LOCATION) for row in rows}
     location_codes = [_LOCATION_LABEL_TO_CODE.get(loc, "WOR") for loc in selected_locations]
@@ -313,125 +563,43 @@ def _aggregate_and_display(df_models: pd.DataFrame, rows: list, time_horizon_lab
             icon="ℹ️",
         )
 
-    summary_records = []
-    all_impacts = []
-
-    for i, row in enumerate(rows):
-        tokens = _compute_row_tokens(row)
-        impacts = _run_impacts(df_models, row, tokens["output_tokens"])
-
-        horizon_key = time_horizon_label.lower()
-        summary_records.append(
-            {
-                "llm_provider": row[_COL_PROVIDER],
-                "model_name": row[_COL_MODEL],
-                "usage_location": row.get(_COL_LOCATION, _DEFAULT_LOCATION),
-                # f"{horizon_key}_input_tokens": tokens["input_tokens"] * time_horizon_days,
-                f"{horizon_key}_output_tokens": tokens["output_tokens"] * time_horizon_days,
-                # f"{horizon_key}_cached_tokens": tokens["cached_tokens"] * time_horizon_days,
-                "impacts_available": impacts is not None,
-            }
-        )
-        if impacts is not None:
-            all_impacts.append((i, row, impacts))
-
-    horizon_key = time_horizon_label.lower()
-    _TOKEN_COLS = [
-        # f"{horizon_key}_input_tokens",
-        f"{horizon_key}_output_tokens",
-        # f"{horizon_key}_cached_tokens",
-    ]
-    _GROUP_COLS = ["llm_provider", "model_name", "usage_location"]
-    _IMPACT_COLS = ["energy", "gwp", "adpe", "pe", "wcf"]
-
-    df_summary = (
-        pd.DataFrame(summary_records).groupby(_GROUP_COLS, as_index=False)[_TOKEN_COLS].sum()
-    )[_GROUP_COLS + _TOKEN_COLS]
-
-    group_impacts: dict[tuple, list[QImpacts]] = defaultdict(list)
-    for _, row, imp in all_impacts:
-        key = (row[_COL_PROVIDER], row[_COL_MODEL], row.get(_COL_LOCATION, _DEFAULT_LOCATION))
-        group_impacts[key].append(imp)
-
-    impact_records = []
-    for (provider, model, location), imps in group_impacts.items():
-        agg = _aggregate_impacts(imps)
-        impact_records.append(
-            {
-                "llm_provider": provider,
-                "model_name": model,
-                "usage_location": location,
-                "energy": f"{agg.energy.magnitude:.3g} {agg.energy.units}",
-                "gwp": f"{agg.gwp.magnitude:.3g} {agg.gwp.units}",
-                "adpe": f"{agg.adpe.magnitude:.3g} {agg.adpe.units}",
-                "pe": f"{agg.pe.magnitude:.3g} {agg.pe.units}",
-                "wcf": f"{agg.wcf.magnitude:.3g} {agg.wcf.units}",
-            }
+    progress_bar = st.empty()
+    partial_results = st.empty()
+
+    def _show_partial(results: list[_RowResult | None]) -> None:
+        completed = sum(result is not None for result in results)
+        if completed == len(results):
+            return
+        progress_bar.progress(
+            completed / len(results), text=f"Computed {completed} of {len(results)} rows…"
         )
+        df_partial, _, partial_impacts = _summarize_rows(rows, results, time_horizon_label)
+        with partial_results.container():
+            st.dataframe(df_partial, width="stretch")
+            if len(partial_impacts):
+                _display_totals(partial_impacts, time_horizon_label)
 
-    if impact_records:
-        df_summary = df_summary.merge(pd.DataFrame(impact_records), on=_GROUP_COLS, how="left")
-
-    col_rename = {
-        "llm_provider": "Provider",
-        "model_name": "Model",
-        "usage_location": _COL_LOCATION,
-        # f"{horizon_key}_input_tokens": f"{time_horizon_label} Input Tokens",
-        f"{horizon_key}_output_tokens": f"{time_horizon_label} Output Tokens",
-        # f"{horizon_key}_cached_tokens": f"{time_horizon_label} Cached Tokens",
-        "energy": "Energy",
-        "gwp": "GWP",
-        "adpe": "ADPe",
-        "pe": "PE",
-        "wcf": "WCF",
-    }
+    results, plan = _compute_rows(catalog, rows, on_batch=_show_partial)
+    progress_bar.empty()
+    partial_results.empty()
+
+    df_display, per_row, all_impacts = _summarize_rows(rows, results, time_horizon_label)
 
     with st.container(border=True):
         col_title, col_download = st.columns([3, 1])
         col_title.markdown(f"#### {time_horizon_label} Token Summary (aggregated by model)")
-
-        display_cols = _GROUP_COLS + _TOKEN_COLS + (_IMPACT_COLS if impact_records else [])
-        df_display = df_summary[display_cols].rename(columns=col_rename)
-
-        df_excel = df_display.copy()
-        df_excel[_COL_LOCATION] = df_excel[_COL_LOCATION].str.split(" ", n=1).str[1]
-        excel_buf = io.BytesIO()
-        with pd.ExcelWriter(excel_buf, engine="openpyxl") as writer:
-            df_excel.to_excel(writer, index=False, sheet_name=f"{time_horizon_label} Token Summary")
-        col_download.download_button(
-            label="⬇ Download Excel",
-            data=excel_buf.getvalue(),
-            file_name="expert_company_token_summary.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            width="stretch",
-        )
+        with col_download:
+            _render_export(df_display, per_row, time_horizon_label)
 
         st.dataframe(df_display, width="stretch")
 
-    if all_impacts:
-        aggregated = _aggregate_impacts([imp for _, _, imp in all_impacts])
-        with st.container(border=True):
-            st.markdown(
-                f"<h5 align='center'>Aggregated {time_horizon_label.lower()} environmental impacts</h5>",
-                # f"(all rows · {time_horizon_label.lower()})</h5>",
-                unsafe_allow_html=True,
-            )
-            display_impacts(
-                aggregated,
-                impacts_to_display=[
-                    "Electricity",
-                    "Carbon Footprint",
-                    "Water",
-                    "Metals & Minerals",
-                    "Fossile Fuels",
-                ],
-                mode="company",
-            )
+    if len(all_impacts):
+        _display_totals(all_impacts, time_horizon_label)
 
     failed = [
-        r["llm_provider"] + "/" + r["model_name"]
-        for r in summary_records
-        if not r["impacts_available"]
+        row[_COL_PROVIDER] + "/" + row[_COL_MODEL]
+        for row, result in zip(rows, results, strict=True)
+        if not result.available
     ]
     if failed:
         st.warning(
@@ -440,6 +608,12 @@ def _aggregate_and_display(df_models: pd.DataFrame, rows: list, time_horizon_lab
             icon="⚠️",
         )
 
+    if plan is not None and plan.avoided_calls > 0:
+        st.caption(
+            f"{plan.n_resolved_rows} rows computed from {len(plan.groups)} model/location "
+            f"groups, avoiding {plan.avoided_calls} ecologits calls."
+        )
+
 
 def expert_company_mode():
     """Expert Company Mode: multi-model, multi-scenario environmental impact calculator."""
@@ -457,17 +631,18 @@ def expert_company_mode():
             selection_mode="single",
         )
 
-    df_models = load_models(filter_main=False)
+    catalog = load_model_catalog(filter_main=False)
 
     if "ec_grid_rows" not in st.session_state:
         st.session_state["ec_grid_rows"] = [dict(_EMPTY_ROW)]
     if "ec_grid_version" not in st.session_state:
         st.session_state["ec_grid_version"] = 0
 
-    grid_state = _render_grid(df_models)
+    _render_upload(catalog)
+    grid_state = _render_grid(catalog)
 
     if not grid_state["run"]:
         return
 
     with st.spinner("Computing impacts…"):
-        _aggregate_and_display(df_models, grid_state["rows"], time_horizon_label)
+        _aggregate_and_display(catalog, grid_state["rows"], time_horizon_label)
@@ -0,0 +1,75 @@
+import time
+
+import streamlit as st
+
+from src.config.scenarios import SCENARIOS, Scenario
+from src.core.leaderboard import LEADERBOARD_CRITERIA, compute_leaderboard
+from src.repositories.models import ModelCatalog, load_model_catalog
+from src.repositories.video_models import load_video_model_catalog
+
+
+def _load_catalog(scenario: Scenario, all_models: bool) -> ModelCatalog:
+    if scenario.modality == "video":
+        return load_video_model_catalog(
+            resolution=scenario.resolution,
+            duration=scenario.duration,
+            with_audio=scenario.with_audio,
+            extrapolate_resolution=scenario.extrapolate_resolution,
+        )
+    return load_model_catalog(filter_main=not all_models)
+
+
+def leaderboard():
+    """Leaderboard: impacts of one task for every compatible model, side by side."""
+    st.markdown(
+        "Compare the environmental impacts of a task across every compatible model. "
+        "Click a column header to sort the table."
+    )
+
+    col_scenario, col_catalog = st.columns([3, 1], vertical_alignment="bottom")
+    with col_scenario:
+        scenario_label = st.selectbox(
+            label="Task",
+            options=[scenario.label for scenario in SCENARIOS],
+            index=0,
+            key="leaderboard_scenario",
+        )
+    scenario = next(scenario for scenario in SCENARIOS if scenario.label == scenario_label)
+    with col_catalog:
+        all_models = st.toggle(
+            "All models",
+            key="leaderboard_all_models",
+            disabled=scenario.modality == "video",
+            help="Include every model of the EcoLogits repository, not only the main ones.",
+        )
+
+    catalog = _load_catalog(scenario, all_models)
+    if not catalog.providers:
+        st.error("No compatible model is available for this task.")
+        return
+
+    start = time.perf_counter()
+    with st.spinner("Computing impacts for every model…"):
+        board = compute_leaderboard(scenario, catalog)
+    elapsed = time.perf_counter() - start
+
+    table = board.to_frame()
+    st.dataframe(
+        table,
+        hide_index=True,
+        width="stretch",
+        column_config={
+            column: st.column_config.NumberColumn(format="%.3g") for column in table.columns[2:]
+        },
+    )
+    st.caption(
+        f"{len(table)} models · {', '.join(LEADERBOARD_CRITERIA)} with min/max ranges · "
+        f"computed in {elapsed:.2f} s"
+    )
+
+    if board.failed:
+        st.warning(
+            "Could not compute impacts for: "
+            + ", ".join(f"{provider}/{model}" for provider, model in board.failed),
+            icon="⚠️",
+        )
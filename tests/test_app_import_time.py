@@ -0,0 +1,67 @@
+"""Import-time budget for app.py."""
+
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# Cold import time `app` may add on top of streamlit, as a fraction of streamlit's own.
+# Both are measured in the same run, so the bound does not depend on the runner's speed.
+APP_IMPORT_OVERHEAD_RATIO = 0.25
+
+# Modules imported on first use of a page. Streamlit itself imports plotly.graph_objects,
+# so only plotly.express is deferred.
+LAZY_MODULES = (
+    "st_aggrid",
+    "plotly.express",
+    "tiktoken",
+    "openpyxl",
+    "src.ui.calculator",
+    "src.ui.company",
+    "src.ui.expert",
+    "src.ui.expert_company",
+    "src.ui.leaderboard",
+    "src.ui.token_estimator",
+)
+
+
+def _import_app(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_time_us(stderr: str, module: str) -> int:
+    """Parse `python -X importtime` output and return the cumulative time of a module."""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+@pytest.mark.slow
+def test_app_cold_import_within_budget():
+    """Cold import of app should cost little more than importing streamlit."""
+    result = _import_app("-X", "importtime", "-c", "import app")
+    app_us = _cumulative_import_time_us(result.stderr, "app")
+    streamlit_us = _cumulative_import_time_us(result.stderr, "streamlit")
+    assert app_us - streamlit_us < APP_IMPORT_OVERHEAD_RATIO * streamlit_us
+
+
+@pytest.mark.slow
+def test_app_import_skips_heavy_page_modules():
+    """Importing app should leave page modules and their heavy dependencies unloaded."""
+    check = f"import sys, app; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    result = _import_app("-c", check)
+    assert result.stdout.strip() == ""
@@ -0,0 +1,59 @@
+"""Tests for src/ui/assets.py."""
+
+import os
+
+from src.ui import assets
+from src.ui.assets import DEV_MODE_ENV, STYLESHEET_PATH, load_css, load_image, minify_css
+
+
+class TestMinifyCss:
+    """Test cases for minify_css function."""
+
+    def test_strips_comments_and_whitespace(self):
+        """Should remove comments and whitespace around punctuation."""
+        css = "/* header */\n.a ,\n.b {\n    color: red ;\n    margin: 0 auto;\n}\n"
+        assert minify_css(css) == ".a,.b{color: red;margin: 0 auto;}"
+
+    def test_keeps_selector_combinators(self):
+        """Should keep spaces that are significant in selectors."""
+        css = '.st-key-app_footer [data-testid="stHorizontalBlock"] { gap: 1rem; }'
+        assert minify_css(css) == '.st-key-app_footer [data-testid="stHorizontalBlock"]{gap: 1rem;}'
+
+    def test_app_stylesheet_is_smaller(self):
+        """Should shrink the app stylesheet."""
+        css = STYLESHEET_PATH.read_text(encoding="utf-8")
+        assert len(minify_css(css)) < len(css)
+
+
+class TestAssetCache:
+    """Test cases for load_css and load_image caching."""
+
+    def test_css_read_once(self, tmp_path, monkeypatch):
+        """Should not re-read the stylesheet outside dev mode."""
+        monkeypatch.delenv(DEV_MODE_ENV, raising=False)
+        path = tmp_path / "style.css"
+        path.write_text(".a { color: red; }")
+        assert load_css(path) == ".a{color: red;}"
+        path.write_text(".a { color: blue; }")
+        assert load_css(path) == ".a{color: red;}"
+
+    def test_css_reloaded_on_change_in_dev_mode(self, tmp_path, monkeypatch):
+        """Should reload the stylesheet when its mtime changes in dev mode."""
+        monkeypatch.setenv(DEV_MODE_ENV, "1")
+        path = tmp_path / "style.css"
+        path.write_text(".a { color: red; }")
+        assert load_css(path) == ".a{color: red;}"
+        path.write_text(".a { color: blue; }")
+        mtime = path.stat().st_mtime + 1
+        os.utime(path, (mtime, mtime))
+        assert load_css(path) == ".a{color: blue;}"
+
+    def test_image_bytes_cached(self, tmp_path, monkeypatch):
+        """Should serve the same image bytes without reading the file again."""
+        monkeypatch.delenv(DEV_MODE_ENV, raising=False)
+        path = tmp_path / "logo.png"
+        path.write_bytes(b"png")
+        assert load_image(path) == b"png"
+        path.unlink()
+        assert load_image(path) == b"png"
+        assert assets._read_bytes.cache_info().hits >= 1
@@ -0,0 +1,320 @@
+"""Tests for src/core/batch.py and the batch CLI."""
+
+import re
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.cli import main, run_batch
+from src.config.constants import PROMPTS, TIME_HORIZONS, USAGE_INTENSITY
+from src.core.batch import (
+    COL_IMPACTS_AVAILABLE,
+    COL_OUTPUT_TOKENS,
+    IMPACT_COLUMNS,
+    UsagePlan,
+    compute_output_tokens,
+    compute_usage_impacts,
+    format_impact_columns,
+    impact_column,
+    location_zones,
+    normalize_locations,
+    plan_tokens,
+    plan_usage_impacts,
+    summarize_usage_impacts,
+    validate_usage,
+)
+from src.core.coefficients import CRITERIA, STATS, ImpactCoefficients
+from src.repositories.models import ModelCatalog
+
+_PROMPT = PROMPTS[0]
+_INTENSITY = next(iter(USAGE_INTENSITY))
+
+_COEFFICIENTS = ImpactCoefficients(
+    slope=np.full((len(CRITERIA), len(STATS)), 2.0),
+    intercept=np.zeros((len(CRITERIA), len(STATS))),
+    ranges=True,
+)
+
+
+def _catalog() -> ModelCatalog:
+    return ModelCatalog.from_dataframe(
+        pd.DataFrame(
+            {
+                "provider": ["openai", "anthropic"],
+                "provider_clean": ["OpenAI", "Anthropic"],
+                "name": ["gpt-4o", "claude-sonnet-4-5"],
+                "name_clean": ["Gpt 4o", "Claude sonnet 4 5"],
+            }
+        )
+    )
+
+
+def _usage(n_rows: int = 4) -> pd.DataFrame:
+    models = [("OpenAI", "Gpt 4o"), ("Anthropic", "Claude sonnet 4 5"), ("OpenAI", "Unknown")]
+    return pd.DataFrame(
+        [
+            {
+                "Provider": models[i % len(models)][0],
+                "Model": models[i % len(models)][1],
+                "Usage Type": _PROMPT.label,
+                "Usage Intensity": _INTENSITY,
+                "Number of Users": i + 1,
+                "Usage Location": "🇫🇷 France" if i % 2 else "WOR",
+            }
+            for i in range(n_rows)
+        ]
+    )
+
+
+class TestComputeOutputTokens:
+    """Test cases for compute_output_tokens."""
+
+    def test_scales_by_users_intensity_and_horizon(self):
+        """Should multiply prompt tokens by intensity, users and days."""
+        tokens = compute_output_tokens(_usage(3), time_horizon_days=22)
+        expected = _PROMPT.output_tokens * USAGE_INTENSITY[_INTENSITY] * np.array([1, 2, 3]) * 22
+        np.testing.assert_array_equal(tokens, expected)
+
+    @pytest.mark.parametrize(
+        ("column", "value", "message"),
+        [
+            ("Usage Type", "Unknown prompt", "Unknown usage type in row(s) 2"),
+            ("Usage Intensity", "Huge", "Unknown usage intensity in row(s) 2"),
+            ("Number of Users", -1, "Invalid number of users in row(s) 2"),
+            ("Number of Users", "abc", "Invalid number of users in row(s) 2"),
+        ],
+    )
+    def test_invalid_rows(self, column, value, message):
+        """Should report invalid rows by 1-based index."""
+        usage = _usage(3).astype({"Number of Users": object})
+        usage.loc[1, column] = value
+        with pytest.raises(ValueError, match=re.escape(message)):
+            compute_output_tokens(usage)
+
+
+class TestValidateUsage:
+    """Test cases for validate_usage."""
+
+    def test_valid_rows(self):
+        """Should report nothing for rows of known models."""
+        usage = _usage(2)
+        assert validate_usage(_catalog(), usage).empty
+
+    def test_reports_every_invalid_cell(self):
+        """Should list each invalid cell with its 1-based row and problem."""
+        usage = _usage(3).astype({"Number of Users": float})
+        usage.loc[0, "Usage Intensity"] = "Huge"
+        usage.loc[0, "Number of Users"] = 1.5
+        usage.loc[1, "Provider"] = "Nobody"
+        usage.loc[2, "Usage Location"] = "Atlantis"
+        usage.loc[2, "Usage Type"] = None
+
+        errors = validate_usage(_catalog(), usage)
+
+        assert errors[["Row", "Column", "Problem"]].values.tolist() == [
+            [1, "Usage Intensity", "Unknown usage intensity"],
+            [1, "Number of Users", "Expected a whole number of at least 0"],
+            [2, "Provider", "Unknown provider"],
+            [3, "Model", "Unknown model for provider"],
+            [3, "Usage Type", "Missing value"],
+            [3, "Usage Location", "Unknown usage location"],
+        ]
+
+    def test_accepts_zero_users(self):
+        """Should accept the numbers of users the token planner accepts."""
+        usage = _usage(2)
+        usage["Number of Users"] = [0, -1]
+
+        errors = validate_usage(_catalog(), usage)
+
+        assert errors["Row"].tolist() == [2]
+        assert plan_tokens(usage).valid.tolist() == [True, False]
+
+    def test_missing_column(self):
+        """Should raise for a missing required column."""
+        with pytest.raises(ValueError, match="Missing column"):
+            validate_usage(_catalog(), _usage(1).drop(columns="Model"))
+
+    def test_normalize_locations(self):
+        """Should map codes to grid labels and default blanks to the world."""
+        usage = _usage(3)
+        usage.loc[2, "Usage Location"] = None
+        assert normalize_locations(usage)["Usage Location"].tolist() == [
+            "🌎 World",
+            "🇫🇷 France",
+            "🌎 World",
+        ]
+
+
+class TestComputeUsageImpacts:
+    """Test cases for compute_usage_impacts."""
+
+    def test_location_zones(self):
+        """Should accept labels and codes, defaulting to the world mix."""
+        usage = pd.DataFrame({"Usage Location": ["🇫🇷 France", "DEU", None, "Atlantis"]})
+        assert location_zones(usage).tolist() == ["FRA", "DEU", "WOR", "WOR"]
+
+    def test_one_evaluation_per_model_and_zone(self):
+        """Should fetch coefficients once per (model, zone) and evaluate every row."""
+        usage = _usage(12)
+        with patch(
+            "src.core.batch.get_impact_coefficients", return_value=_COEFFICIENTS
+        ) as mock_coefficients:
+            impacts = compute_usage_impacts(_catalog(), usage)
+
+        # Unknown models are never looked up
+        assert mock_coefficients.call_count == 4
+        assert len(impacts.plan.groups) == 4
+        assert impacts.plan.n_resolved_rows == 8
+        assert impacts.plan.avoided_calls == 8 - 2 * 4
+        expected_available = usage["Model"] != "Unknown"
+        np.testing.assert_array_equal(impacts.available, expected_available)
+        np.testing.assert_allclose(
+            impacts.values[impacts.available, 0, 0],
+            2.0 * impacts.output_tokens[impacts.available],
+        )
+        assert np.isnan(impacts.values[~impacts.available]).all()
+
+    def test_plan_collapses_rows_differing_in_usage(self):
+        """Should group rows sharing model and zone whatever their usage."""
+        usage = pd.concat([_usage(2)] * 50, ignore_index=True)
+        usage["Number of Users"] = np.arange(1, 101)
+
+        plan = plan_usage_impacts(_catalog(), usage)
+
+        assert plan.n_rows == 100
+        assert len(plan.groups) == 2
+        np.testing.assert_array_equal(
+            plan.groups[("openai", "gpt-4o", "WOR")], np.arange(0, 100, 2)
+        )
+        assert plan.ecologits_calls == 4
+        assert plan.avoided_calls == 96
+
+    def test_plan_concat(self):
+        """Should merge batch plans as if the rows had been planned at once."""
+        usage = _usage(12)
+        whole = plan_usage_impacts(_catalog(), usage)
+        merged = UsagePlan.concat(
+            plan_usage_impacts(_catalog(), usage.iloc[start : start + 5])
+            for start in range(0, 12, 5)
+        )
+
+        assert merged.n_rows == whole.n_rows
+        assert merged.groups.keys() == whole.groups.keys()
+        for item, indices in whole.groups.items():
+            np.testing.assert_array_equal(merged.groups[item], indices)
+
+    def test_summary(self):
+        """Should sum tokens and impacts by provider, model and location."""
+        usage = _usage(12)
+        with patch("src.core.batch.get_impact_coefficients", return_value=_COEFFICIENTS):
+            results = compute_usage_impacts(_catalog(), usage).to_frame(usage)
+
+        summary = summarize_usage_impacts(results)
+
+        assert len(summary) == 6
+        assert summary[COL_OUTPUT_TOKENS].sum() == results[COL_OUTPUT_TOKENS].sum()
+        unknown = summary[summary["Model"] == "Unknown"]
+        assert unknown[IMPACT_COLUMNS].isna().all().all()
+        energy = impact_column("energy")
+        assert np.isclose(summary[energy].sum(), results[energy].sum())
+
+    def test_format_impact_columns(self):
+        """Should scale each total to its display unit and keep missing totals empty."""
+        summary = pd.DataFrame(
+            {impact_column(criterion): [2.5, 0.0004, np.nan] for criterion in CRITERIA}
+        )
+
+        formatted = format_impact_columns(summary)
+
+        assert formatted["energy"].tolist() == ["2.5 kWh", "400 mWh", None]
+        assert formatted["wcf"].tolist() == ["2.5 L", "0.4 mL", None]
+
+
+class TestBatchCli:
+    """Test cases for the batch command."""
+
+    @pytest.mark.parametrize("output_suffix", [".csv", ".xlsx"])
+    def test_chunked_run_matches_single_chunk(self, tmp_path, output_suffix):
+        """Should write per-row and summary results independent of the chunk size."""
+        input_path = tmp_path / "usage.csv"
+        _usage(25).to_csv(input_path, index=False)
+
+        with patch("src.core.executor.get_impact_coefficients", return_value=_COEFFICIENTS):
+            chunked = run_batch(
+                input_path,
+                tmp_path / f"rows{output_suffix}",
+                tmp_path / f"summary{output_suffix}",
+                chunk_size=4,
+                catalog=_catalog(),
+            )
+            single = run_batch(input_path, None, None, chunk_size=100, catalog=_catalog())
+
+        pd.testing.assert_frame_equal(chunked, single)
+        read = pd.read_csv if output_suffix == ".csv" else pd.read_excel
+        rows = read(tmp_path / f"rows{output_suffix}")
+        assert len(rows) == 25
+        assert rows[COL_IMPACTS_AVAILABLE].sum() == 17
+        assert rows[COL_OUTPUT_TOKENS].sum() == chunked[COL_OUTPUT_TOKENS].sum()
+        assert rows[COL_OUTPUT_TOKENS].iloc[0] == (
+            _PROMPT.output_tokens * USAGE_INTENSITY[_INTENSITY] * TIME_HORIZONS["Monthly"]
+        )
+
+    def test_parquet_round_trip(self, tmp_path):
+        """Should stream Parquet input and output."""
+        pytest.importorskip("pyarrow")
+        input_path = tmp_path / "usage.parquet"
+        _usage(10).to_parquet(input_path, index=False)
+
+        with patch("src.core.executor.get_impact_coefficients", return_value=_COEFFICIENTS):
+            run_batch(input_path, tmp_path / "rows.parquet", None, chunk_size=3, catalog=_catalog())
+
+        assert len(pd.read_parquet(tmp_path / "rows.parquet")) == 10
+
+    def test_parquet_extra_columns_change_type(self, tmp_path):
+        """Should write extra columns whose inferred type differs between chunks."""
+        pytest.importorskip("pyarrow")
+        input_path = tmp_path / "usage.csv"
+        usage = _usage(6)
+        usage["Notes"] = [None, None, None, "team A", None, "team B"]
+        usage["Cost Center"] = [1, 2, 3, 4.5, None, 6]
+        usage.to_csv(input_path, index=False)
+
+        with patch("src.core.executor.get_impact_coefficients", return_value=_COEFFICIENTS):
+            run_batch(input_path, tmp_path / "rows.parquet", None, chunk_size=3, catalog=_catalog())
+
+        rows = pd.read_parquet(tmp_path / "rows.parquet")
+        assert len(rows) == 6
+        assert rows["Notes"].tolist()[3] == "team A"
+        assert rows[COL_IMPACTS_AVAILABLE].dtype == bool
+
+    def test_invalid_input_exit_code(self, tmp_path, capsys):
+        """Should exit with an error message on invalid rows."""
+        input_path = tmp_path / "usage.csv"
+        usage = _usage(5)
+        usage.loc[4, "Usage Intensity"] = "Huge"
+        usage.to_csv(input_path, index=False)
+
+        args = ["batch", str(input_path), "-o", str(tmp_path / "rows.csv"), "--chunk-size", "2"]
+        with patch("src.cli.load_models", return_value=pd.DataFrame()):
+            exit_code = main(args)
+
+        assert exit_code == 1
+        assert "row(s) 5" in capsys.readouterr().err
+        # Rows are checked before any chunk is written
+        assert not (tmp_path / "rows.csv").exists()
+
+    def test_summary_merges_location_codes(self, tmp_path):
+        """Should group rows given as a code and as a grid label together."""
+        input_path = tmp_path / "usage.csv"
+        usage = _usage(2).assign(Provider="OpenAI", Model="Gpt 4o")
+        usage["Usage Location"] = ["FRA", "🇫🇷 France"]
+        usage.to_csv(input_path, index=False)
+
+        with patch("src.core.executor.get_impact_coefficients", return_value=_COEFFICIENTS):
+            summary = run_batch(input_path, None, None, catalog=_catalog())
+
+        assert summary["Usage Location"].tolist() == ["🇫🇷 France"]
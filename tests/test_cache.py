@@ -0,0 +1,105 @@
+"""Tests for src/core/cache.py."""
+
+import threading
+
+import pytest
+
+from src.core.cache import TTLCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_hits_and_misses(self):
+        """Should compute each key once and count lookups."""
+        cache = TTLCache(maxsize=4)
+        calls = []
+
+        for _ in range(3):
+            cache.get_or_compute("a", lambda: calls.append("a") or 1)
+
+        stats = cache.stats()
+        assert calls == ["a"]
+        assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_evicts_least_recently_used(self):
+        """Should drop the least recently used entry beyond maxsize."""
+        cache = TTLCache(maxsize=2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("c", lambda: 3)
+
+        assert cache.get_or_compute("a", lambda: -1) == 1
+        assert cache.get_or_compute("b", lambda: -2) == -2
+        assert cache.stats().evictions == 2
+
+    def test_entries_expire(self):
+        """Should recompute entries older than the ttl."""
+        clock = _Clock()
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.get_or_compute("a", lambda: 1)
+
+        clock.now = 9
+        assert cache.get_or_compute("a", lambda: 2) == 1
+        clock.now = 20
+        assert cache.get_or_compute("a", lambda: 2) == 2
+        assert cache.stats().expirations == 1
+
+    def test_concurrent_misses_compute_once(self):
+        """Should make concurrent misses on a key wait for the first computation."""
+        cache = TTLCache(maxsize=2)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def compute():
+            calls.append("a")
+            started.set()
+            release.wait(5)
+            return 1
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(cache.get_or_compute("a", compute)))
+        first.start()
+        started.wait(5)
+        second = threading.Thread(target=lambda: results.append(cache.get_or_compute("a", compute)))
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        assert calls == ["a"]
+        assert results == [1, 1]
+
+    def test_failed_computation_is_retried(self):
+        """Should not store failures, so the next lookup computes again."""
+        cache = TTLCache(maxsize=2)
+
+        with pytest.raises(ZeroDivisionError):
+            cache.get_or_compute("a", lambda: 1 / 0)
+
+        assert cache.get_or_compute("a", lambda: 1) == 1
+        assert cache.stats().misses == 2
+
+    def test_clear_resets_counters(self):
+        """Should drop entries and counters."""
+        cache = TTLCache(maxsize=2, tag="0.11.0")
+        cache.get_or_compute("a", lambda: 1)
+        cache.clear()
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size, stats.tag) == (0, 0, 0, "0.11.0")
+
+    def test_invalid_maxsize(self):
+        """Should reject caches that cannot hold an entry."""
+        with pytest.raises(ValueError, match="maxsize"):
+            TTLCache(maxsize=0)
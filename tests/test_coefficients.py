@@ -0,0 +1,81 @@
+"""Tests for src/core/coefficients.py."""
+
+import numpy as np
+import pytest
+
+from ecologits.tracers.utils import llm_impacts
+from ecologits.utils.range_value import RangeValue
+
+from src.core.coefficients import (
+    CRITERIA,
+    STATS,
+    get_impact_coefficients,
+    impacts_to_array,
+)
+
+
+def _direct_impacts(provider, model_name, zone, tokens):
+    return llm_impacts(
+        provider=provider,
+        model_name=model_name,
+        output_token_count=tokens,
+        request_latency=float("inf"),
+        electricity_mix_zone=zone,
+    )
+
+
+class TestImpactCoefficients:
+    """Test cases for the affine impact model."""
+
+    @pytest.mark.parametrize(
+        ("provider", "model_name", "zone"),
+        [
+            ("openai", "gpt-4o", "WOR"),
+            ("anthropic", "claude-sonnet-4-5", "FRA"),
+            ("mistralai", "mistral-large-latest", "SWE"),
+        ],
+    )
+    @pytest.mark.parametrize("tokens", [1, 250, 123_456, 5_000_000_000])
+    def test_matches_ecologits(self, provider, model_name, zone, tokens):
+        """Should reproduce ecologits impacts for any token count."""
+        coefficients = get_impact_coefficients(provider, model_name, zone)
+        expected = impacts_to_array(_direct_impacts(provider, model_name, zone, tokens))
+
+        np.testing.assert_allclose(coefficients.evaluate(tokens), expected, rtol=1e-9)
+
+    def test_evaluate_array_shape(self):
+        """Should evaluate a whole array of token counts at once."""
+        coefficients = get_impact_coefficients("openai", "gpt-4o", "WOR")
+        tokens = np.array([[10, 20, 30], [40, 50, 60]])
+
+        result = coefficients.evaluate(tokens)
+
+        assert result.shape == (2, 3, len(CRITERIA), len(STATS))
+        np.testing.assert_allclose(result[1, 2], coefficients.evaluate(60))
+
+    def test_impacts_at_keeps_ranges_and_warnings(self):
+        """Should rebuild an ecologits output with ranges and warnings."""
+        coefficients = get_impact_coefficients("anthropic", "claude-sonnet-4-5", "FRA")
+        direct = _direct_impacts("anthropic", "claude-sonnet-4-5", "FRA", 4000)
+
+        impacts = coefficients.impacts_at(4000)
+
+        assert isinstance(impacts.gwp.value, RangeValue)
+        assert impacts.gwp.value.min == pytest.approx(direct.gwp.value.min, rel=1e-9)
+        assert impacts.gwp.value.max == pytest.approx(direct.gwp.value.max, rel=1e-9)
+        assert {w.code for w in impacts.warnings} == {w.code for w in direct.warnings}
+
+    def test_coefficients_are_read_only(self):
+        """Should not allow cached coefficients to be modified in place."""
+        coefficients = get_impact_coefficients("openai", "gpt-4o", "WOR")
+
+        with pytest.raises(ValueError):
+            coefficients.slope[0, 0] = 0.0
+
+    def test_unknown_model_returns_none(self):
+        """Should return None when ecologits reports an error."""
+        assert get_impact_coefficients("openai", "not-a-model", "WOR") is None
+
+    def test_unknown_zone_returns_none(self):
+        """Should return None for an unknown electricity mix zone."""
+        assert get_impact_coefficients("openai", "gpt-4o", "XXX") is None
@@ -0,0 +1,44 @@
+"""Tests for src/core/executor.py."""
+
+from unittest.mock import patch
+
+from src.core.executor import CoefficientsExecutor
+
+_WORK_ITEMS = [
+    (provider, model_name, zone)
+    for provider, model_name in [
+        ("openai", "gpt-4o"),
+        ("anthropic", "claude-sonnet-4-5"),
+        ("mistralai", "mistral-large-latest"),
+    ]
+    for zone in ["WOR", "FRA", "USA", "DEU", "SWE", "CHN"]
+]
+
+
+class TestCoefficientsExecutor:
+    """Test cases for CoefficientsExecutor."""
+
+    def test_fits_each_item_once(self):
+        """Should memoize results across fetches and skip duplicates."""
+        executor = CoefficientsExecutor()
+        with patch(
+            "src.core.executor.get_impact_coefficients", side_effect=lambda *item: item
+        ) as mock_fit:
+            executor.fetch([_WORK_ITEMS[0], _WORK_ITEMS[1], _WORK_ITEMS[0]])
+            results = executor.fetch([_WORK_ITEMS[1], _WORK_ITEMS[2]])
+        assert mock_fit.call_count == 3
+        assert executor.fitted_items == 3
+        assert results == {item: item for item in _WORK_ITEMS[1:3]}
+
+    def test_results_bounded(self):
+        """Should keep only the max_results most recently used results."""
+        executor = CoefficientsExecutor(max_results=2)
+        with patch(
+            "src.core.executor.get_impact_coefficients", side_effect=lambda *item: item
+        ) as mock_fit:
+            executor.fetch(_WORK_ITEMS[:3])
+            executor.fetch(_WORK_ITEMS[1:3])
+            executor.fetch(_WORK_ITEMS[:1])
+        assert len(executor._results) == 2
+        assert mock_fit.call_count == 4
+        assert executor.fitted_items == 4
@@ -0,0 +1,82 @@
+"""Tests for impact aggregation in expert company mode."""
+
+import numpy as np
+
+from src.core.formatting import QImpactsTable
+from src.ui.expert_company import _aggregate_impacts, _RowResult, _summarize_rows
+
+
+class TestAggregateImpacts:
+    """Test the _aggregate_impacts function."""
+
+    def test_keeps_ranges(self):
+        """Should aggregate min and max alongside the mean."""
+        table = QImpactsTable.from_arrays(
+            np.full((4, 5, 3), 1e-3) * [1.0, 0.9, 1.1],
+            ranges=True,
+        )
+
+        aggregated = _aggregate_impacts(table)
+
+        assert aggregated.ranges
+        assert np.isclose(aggregated.gwp.to("kgCO2eq").magnitude, 4e-3)
+        assert np.isclose(aggregated.gwp_min.to("kgCO2eq").magnitude, 3.6e-3)
+        assert np.isclose(aggregated.gwp_max.to("kgCO2eq").magnitude, 4.4e-3)
+
+    def test_rescales_total(self):
+        """Should pick the display unit from the aggregated total."""
+        table = QImpactsTable.from_arrays(np.full((2000, 5, 3), 1e-3), ranges=False)
+
+        aggregated = _aggregate_impacts(table)
+
+        assert str(aggregated.energy.units) == "kWh"
+        assert np.isclose(aggregated.energy.magnitude, 2.0)
+
+    def test_group_subset(self):
+        """Should only sum the rows of the requested group."""
+        values = np.stack([np.full((5, 3), 1.0), np.full((5, 3), 10.0), np.full((5, 3), 100.0)])
+        table = QImpactsTable.from_arrays(values, ranges=True)
+
+        aggregated = _aggregate_impacts(table, [0, 2])
+
+        assert np.isclose(aggregated.pe.to("MJ").magnitude, 101.0)
+
+
+def _row(model: str, location: str = "🌎 World") -> dict:
+    return {"Provider": "OpenAI", "Model": model, "Usage Location": location}
+
+
+def _result(output_tokens: int, value: float, available: bool = True) -> _RowResult:
+    return _RowResult(
+        tokens={"output_tokens": output_tokens},
+        values=np.full((5, 3), value),
+        ranges=True,
+        available=available,
+    )
+
+
+class TestSummarizeRows:
+    """Test the _summarize_rows function."""
+
+    def test_groups_tokens_and_impacts(self):
+        """Should sum tokens and impacts of each provider/model/location group."""
+        rows = [_row("Gpt 4o"), _row("Gpt 4o"), _row("Gpt 4o", "🇫🇷 France"), _row("Unknown")]
+        results = [_result(10, 1.0), _result(5, 2.0), _result(1, 1e-4), _result(7, 0.0, False)]
+
+        df_display, per_row, all_impacts = _summarize_rows(rows, results, "Daily")
+
+        assert df_display["Daily Output Tokens"].tolist() == [15, 1, 7]
+        assert df_display["Daily Energy"].tolist() == ["3 kWh", "100 mWh", None]
+        assert per_row["Impacts Available"].tolist() == [True, True, True, False]
+        assert per_row["daily_energy_kWh"].tolist()[:3] == [1.0, 2.0, 1e-4]
+        assert len(all_impacts) == 3
+
+    def test_skips_pending_rows(self):
+        """Should leave rows without a result out of the summary."""
+        df_display, per_row, all_impacts = _summarize_rows(
+            [_row("Gpt 4o"), _row("Gpt 4o")], [_result(10, 1.0), None], "Daily"
+        )
+
+        assert df_display["Daily Output Tokens"].tolist() == [10]
+        assert len(per_row) == 1
+        assert len(all_impacts) == 1
@@ -1,133 +1,97 @@
 """Tests for token computation in expert company mode."""
 
-import pytest
+import numpy as np
+import pandas as pd
 
 from src.config.constants import PROMPTS, USAGE_INTENSITY
-from src.ui.expert_company import _compute_row_tokens
+from src.core.batch import plan_tokens
 
+_TWEET = "Write a tweet (50 output tokens)"
+_LIGHT = "Light (x1-x3)"
 
-class TestComputeRowTokens:
-    """Test the _compute_row_tokens function."""
 
-    def test_valid_input(self):
-        """Test with valid input values."""
-        row = {
-            "_COL_USAGE_TYPE": "Write a tweet (50 output tokens)",
-            "_COL_USAGE_INTENSITY": "Light (x1-x3)",
-            "_COL_NUM_USERS": "100",
+def _usage(*num_users, usage_type: str = _TWEET, intensity: str = _LIGHT) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Usage Type": usage_type,
+            "Usage Intensity": intensity,
+            "Number of Users": list(num_users),
         }
+    )
 
-        # Mock the column names
-        import src.ui.expert_company as expert_company
 
-        expert_company._COL_USAGE_TYPE = "_COL_USAGE_TYPE"
-        expert_company._COL_USAGE_INTENSITY = "_COL_USAGE_INTENSITY"
-        expert_company._COL_NUM_USERS = "_COL_NUM_USERS"
+class TestPlanTokens:
+    """Test the plan_tokens function."""
 
-        result = _compute_row_tokens(row)
+    def test_valid_input(self):
+        """Test with valid input values."""
+        token_plan = plan_tokens(_usage("100"))
 
-        # Find the prompt
-        prompt = next(p for p in PROMPTS if p.label == "Write a tweet (50 output tokens)")
-        daily_count = USAGE_INTENSITY["Light (x1-x3)"]
-        num_users = 100
+        prompt = next(p for p in PROMPTS if p.label == _TWEET)
+        multiplier = USAGE_INTENSITY[_LIGHT] * 100
 
-        expected = {
-            "output_tokens": prompt.output_tokens * daily_count * num_users,
-            "input_tokens": prompt.input_tokens * daily_count * num_users,
-            "cached_tokens": prompt.cached_tokens * daily_count * num_users,
+        assert token_plan.row_tokens(0) == {
+            "output_tokens": prompt.output_tokens * multiplier,
+            "input_tokens": prompt.input_tokens * multiplier,
+            "cached_tokens": prompt.cached_tokens * multiplier,
             "total_tokens": (prompt.output_tokens + prompt.input_tokens + prompt.cached_tokens)
-            * daily_count
-            * num_users,
+            * multiplier,
         }
-
-        assert result == expected
-
-    def test_empty_num_users(self):
-        """Test with empty number of users."""
-        row = {
-            "_COL_USAGE_TYPE": "Write a tweet (50 output tokens)",
-            "_COL_USAGE_INTENSITY": "Light (x1-x3)",
-            "_COL_NUM_USERS": "",
-        }
-
-        import src.ui.expert_company as expert_company
-
-        expert_company._COL_USAGE_TYPE = "_COL_USAGE_TYPE"
-        expert_company._COL_USAGE_INTENSITY = "_COL_USAGE_INTENSITY"
-        expert_company._COL_NUM_USERS = "_COL_NUM_USERS"
-
-        with pytest.raises(ValueError, match="Number of users cannot be empty or None"):
-            _compute_row_tokens(row)
-
-    def test_none_num_users(self):
-        """Test with None number of users."""
-        row = {
-            "_COL_USAGE_TYPE": "Write a tweet (50 output tokens)",
-            "_COL_USAGE_INTENSITY": "Light (x1-x3)",
-            "_COL_NUM_USERS": None,
-        }
-
-        import src.ui.expert_company as expert_company
-
-        expert_company._COL_USAGE_TYPE = "_COL_USAGE_TYPE"
-        expert_company._COL_USAGE_INTENSITY = "_COL_USAGE_INTENSITY"
-        expert_company._COL_NUM_USERS = "_COL_NUM_USERS"
-
-        with pytest.raises(ValueError, match="Number of users cannot be empty or None"):
-            _compute_row_tokens(row)
-
-    def test_negative_num_users(self):
-        """Test with negative number of users."""
-        row = {
-            "_COL_USAGE_TYPE": "Write a tweet (50 output tokens)",
-            "_COL_USAGE_INTENSITY": "Light (x1-x3)",
-            "_COL_NUM_USERS": "-100",
-        }
-
-        import src.ui.expert_company as expert_company
-
-        expert_company._COL_USAGE_TYPE = "_COL_USAGE_TYPE"
-        expert_company._COL_USAGE_INTENSITY = "_COL_USAGE_INTENSITY"
-        expert_company._COL_NUM_USERS = "_COL_NUM_USERS"
-
-        with pytest.raises(ValueError, match="Number of users must be non-negative"):
-            _compute_row_tokens(row)
-
-    def test_invalid_num_users_string(self):
-        """Test with invalid string for number of users."""
-        row = {
-            "_COL_USAGE_TYPE": "Write a tweet (50 output tokens)",
-            "_COL_USAGE_INTENSITY": "Light (x1-x3)",
-            "_COL_NUM_USERS": "not_a_number",
-        }
-
-        import src.ui.expert_company as expert_company
-
-        expert_company._COL_USAGE_TYPE = "_COL_USAGE_TYPE"
-        expert_company._COL_USAGE_INTENSITY = "_COL_USAGE_INTENSITY"
-        expert_company._COL_NUM_USERS = "_COL_NUM_USERS"
-
-        with pytest.raises(ValueError, match="Invalid number of users value"):
-            _compute_row_tokens(row)
+        assert token_plan.valid.all()
+
+    def test_matches_per_row_lookup(self):
+        """Test every usage type and intensity against a per-row computation."""
+        rows = [
+            (prompt, intensity, users)
+            for prompt in PROMPTS
+            for intensity in USAGE_INTENSITY
+            for users in (1, 37)
+        ]
+        usage = pd.DataFrame(
+            {
+                "Usage Type": [prompt.label for prompt, _, _ in rows],
+                "Usage Intensity": [intensity for _, intensity, _ in rows],
+                "Number of Users": [users for _, _, users in rows],
+            }
+        )
+
+        token_plan = plan_tokens(usage, time_horizon_days=22)
+
+        expected = [
+            prompt.output_tokens * USAGE_INTENSITY[intensity] * users * 22
+            for prompt, intensity, users in rows
+        ]
+        np.testing.assert_array_equal(token_plan.output_tokens, expected)
+
+    def test_invalid_num_users_masked(self):
+        """Test that empty, None, negative and non-numeric user counts are flagged."""
+        token_plan = plan_tokens(_usage("", None, "-100", "not_a_number", "1.5", "10"))
+
+        np.testing.assert_array_equal(
+            token_plan.invalid_users, [True, True, True, True, True, False]
+        )
+        np.testing.assert_array_equal(token_plan.total_tokens[:5], 0)
+        assert token_plan.total_tokens[5] > 0
+
+    def test_unknown_labels_masked(self):
+        """Test that unknown usage types and intensities are flagged."""
+        token_plan = plan_tokens(
+            pd.concat(
+                [_usage(1, usage_type="Unknown prompt"), _usage(1, intensity="Huge"), _usage(1)],
+                ignore_index=True,
+            )
+        )
+
+        np.testing.assert_array_equal(token_plan.unknown_usage_type, [True, False, False])
+        np.testing.assert_array_equal(token_plan.unknown_intensity, [False, True, False])
+        np.testing.assert_array_equal(token_plan.valid, [False, False, True])
 
     def test_zero_num_users(self):
         """Test with zero number of users (should be valid)."""
-        row = {
-            "_COL_USAGE_TYPE": "Write a tweet (50 output tokens)",
-            "_COL_USAGE_INTENSITY": "Light (x1-x3)",
-            "_COL_NUM_USERS": "0",
-        }
-
-        import src.ui.expert_company as expert_company
-
-        expert_company._COL_USAGE_TYPE = "_COL_USAGE_TYPE"
-        expert_company._COL_USAGE_INTENSITY = "_COL_USAGE_INTENSITY"
-        expert_company._COL_NUM_USERS = "_COL_NUM_USERS"
-
-        result = _compute_row_tokens(row)
+        token_plan = plan_tokens(_usage("0"))
 
-        # Should return all zeros
-        assert result == {
+        assert token_plan.valid.all()
+        assert token_plan.row_tokens(0) == {
             "output_tokens": 0,
             "input_tokens": 0,
             "cached_tokens": 0,
@@ -0,0 +1,108 @@
+"""Tests for per-row result caching in expert company mode."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.core.batch import UsagePlan
+from src.ui.expert_company import _compute_rows, _row_cache_key, _RowResult
+
+
+def _row(users: int, model: str = "Gpt 4o") -> dict:
+    return {
+        "Provider": "OpenAI",
+        "Model": model,
+        "Usage Type": "Write a tweet (50 output tokens)",
+        "Usage Intensity": "Light (x1-x3)",
+        "Number of Users": users,
+        "Usage Location": "🌎 World",
+    }
+
+
+def _fake_compute(catalog, rows):
+    results = [
+        _RowResult(
+            tokens={"output_tokens": row["Number of Users"]},
+            values=np.full((5, 3), float(row["Number of Users"])),
+            ranges=False,
+            available=True,
+        )
+        for row in rows
+    ]
+    return results, UsagePlan(groups={}, n_rows=len(rows))
+
+
+class TestRowCache:
+    """Test the _compute_rows cache."""
+
+    def test_cache_key_depends_on_inputs(self):
+        """Should hash input fields only."""
+        assert _row_cache_key(_row(1)) == _row_cache_key({**_row(1), "extra": "ignored"})
+        assert _row_cache_key(_row(1)) != _row_cache_key(_row(2))
+
+    def test_only_changed_rows_recomputed(self):
+        """Should compute new or edited rows only and keep row order."""
+        st_mock = MagicMock()
+        st_mock.session_state = {}
+        with (
+            patch("src.ui.expert_company.st", st_mock),
+            patch(
+                "src.ui.expert_company._compute_new_rows", side_effect=_fake_compute
+            ) as mock_compute,
+        ):
+            _compute_rows(None, [_row(1), _row(2), _row(3)])
+            results, _ = _compute_rows(None, [_row(1), _row(20), _row(3)])
+
+        assert mock_compute.call_count == 2
+        assert [r["Number of Users"] for r in mock_compute.call_args.args[1]] == [20]
+        assert [r.tokens["output_tokens"] for r in results] == [1, 20, 3]
+
+    def test_removed_rows_evicted(self):
+        """Should drop cached results of rows no longer in the grid."""
+        st_mock = MagicMock()
+        st_mock.session_state = {}
+        with (
+            patch("src.ui.expert_company.st", st_mock),
+            patch("src.ui.expert_company._compute_new_rows", side_effect=_fake_compute),
+        ):
+            _compute_rows(None, [_row(1), _row(2)])
+            _compute_rows(None, [_row(2)])
+
+        assert len(st_mock.session_state["ec_row_results"]) == 1
+
+    def test_unchanged_grid_skips_computation(self):
+        """Should not compute anything when every row is cached."""
+        st_mock = MagicMock()
+        st_mock.session_state = {}
+        with (
+            patch("src.ui.expert_company.st", st_mock),
+            patch(
+                "src.ui.expert_company._compute_new_rows", side_effect=_fake_compute
+            ) as mock_compute,
+        ):
+            _compute_rows(None, [_row(1), _row(2)])
+            _, plan = _compute_rows(None, [_row(1), _row(2)])
+
+        assert mock_compute.call_count == 1
+        assert plan is None
+
+    def test_rows_computed_in_batches(self):
+        """Should report partial results after each batch of new rows."""
+        st_mock = MagicMock()
+        st_mock.session_state = {}
+        partial = []
+        with (
+            patch("src.ui.expert_company.st", st_mock),
+            patch("src.ui.expert_company._PROGRESS_BATCH_SIZE", 2),
+            patch(
+                "src.ui.expert_company._compute_new_rows", side_effect=_fake_compute
+            ) as mock_compute,
+        ):
+            results, plan = _compute_rows(
+                None, [_row(n) for n in range(1, 6)], on_batch=partial.append
+            )
+
+        assert mock_compute.call_count == 3
+        assert [sum(r is not None for r in batch) for batch in partial] == [2, 4, 5]
+        assert [r.tokens["output_tokens"] for r in results] == [1, 2, 3, 4, 5]
+        assert plan.n_rows == 5
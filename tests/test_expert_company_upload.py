@@ -0,0 +1,37 @@
+"""Tests for the file import of expert company mode."""
+
+import io
+
+import pandas as pd
+import pytest
+
+from src.ui.expert_company import _read_upload
+
+
+def _upload(name: str, data: bytes) -> io.BytesIO:
+    uploaded_file = io.BytesIO(data)
+    uploaded_file.name = name
+    return uploaded_file
+
+
+class TestReadUpload:
+    """Test the _read_upload function."""
+
+    def test_reads_xlsx(self):
+        """Should read the rows of a valid workbook."""
+        buffer = io.BytesIO()
+        pd.DataFrame({"Provider": ["OpenAI"], "Number of Users": [3]}).to_excel(buffer, index=False)
+
+        usage = _read_upload(_upload("usage.xlsx", buffer.getvalue()))
+
+        assert usage.to_dict("records") == [{"Provider": "OpenAI", "Number of Users": 3}]
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"not a zip archive", b"PK\x05\x06" + b"\x00" * 18],
+        ids=["not-zip", "empty-zip"],
+    )
+    def test_corrupt_xlsx(self, data):
+        """Should report unreadable workbooks as ValueError."""
+        with pytest.raises(ValueError, match="not a valid XLSX file"):
+            _read_upload(_upload("usage.xlsx", data))
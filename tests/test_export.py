@@ -0,0 +1,48 @@
+"""Tests for src/core/export.py."""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+from src.core.export import XlsxStreamWriter, to_csv, to_parquet, to_xlsx
+
+
+def _table(n_rows: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Model": [f"Model {i}" for i in range(n_rows)],
+            "Output Tokens": np.arange(n_rows, dtype=np.int64) * 1000,
+            "Energy": [0.5 if i % 2 else np.nan for i in range(n_rows)],
+        }
+    )
+
+
+class TestExport:
+    """Test cases for table exports."""
+
+    def test_xlsx_sheets_round_trip(self):
+        """Should write one sheet per table, with missing values as empty cells."""
+        data = to_xlsx({"Summary": _table(2), "Per-row Detail": _table(3)})
+
+        sheets = pd.read_excel(io.BytesIO(data), sheet_name=None)
+
+        assert list(sheets) == ["Summary", "Per-row Detail"]
+        pd.testing.assert_frame_equal(sheets["Per-row Detail"], _table(3))
+
+    def test_xlsx_stream_writer_appends_chunks(self, tmp_path):
+        """Should write the header once and append every chunk."""
+        table = _table(5)
+        writer = XlsxStreamWriter()
+        writer.append("Impacts", table.iloc[:2])
+        writer.append("Impacts", table.iloc[2:])
+        writer.save(tmp_path / "impacts.xlsx")
+
+        pd.testing.assert_frame_equal(pd.read_excel(tmp_path / "impacts.xlsx"), table)
+
+    def test_csv_and_parquet_round_trip(self):
+        """Should write the table without its index."""
+        table = _table()
+
+        pd.testing.assert_frame_equal(pd.read_csv(io.BytesIO(to_csv(table))), table)
+        pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(to_parquet(table))), table)
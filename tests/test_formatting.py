@@ -1,17 +1,28 @@
 """Tests for src/core/formatting.py."""
 
+import tracemalloc
+
 from unittest.mock import MagicMock
 
+import numpy as np
+import pytest
+
 from pint import Quantity
 
 from src.core.formatting import (
+    DEFAULT_UNITS,
+    THRESHOLDS,
     QImpacts,
+    QImpactsTable,
+    auto_scale,
     format_adpe,
     format_energy,
     format_gwp,
     format_impacts,
+    format_impacts_batch,
     format_pe,
     format_wcf,
+    scale_magnitude,
 )
 from src.core.units import q
 
@@ -224,3 +235,219 @@ class TestFormatImpacts:
         assert q_impacts.ranges
         assert q_impacts.energy_min is not None
         assert q_impacts.energy_max is not None
+
+
+class TestFormatImpactsBatch:
+    """Test cases for format_impacts_batch function."""
+
+    def _random_magnitudes(self, size=300, seed=0):
+        rng = np.random.default_rng(seed)
+        magnitudes = {}
+        for criterion in ["energy", "gwp", "adpe", "pe", "wcf"]:
+            mean = 10 ** rng.uniform(-12, 3, size)
+            magnitudes[criterion] = mean
+            magnitudes[f"{criterion}_min"] = mean * rng.uniform(0.5, 1.0, size)
+            magnitudes[f"{criterion}_max"] = mean * rng.uniform(1.0, 1.5, size)
+        return magnitudes
+
+    def test_matches_scalar_path(self):
+        """Should pick the same units and magnitudes as the scalar formatting."""
+        formatters = {
+            "energy": format_energy,
+            "gwp": format_gwp,
+            "adpe": format_adpe,
+            "pe": format_pe,
+            "wcf": format_wcf,
+        }
+        magnitudes = self._random_magnitudes()
+
+        result = format_impacts_batch(magnitudes)
+
+        for criterion, formatter in formatters.items():
+            for i, value in enumerate(magnitudes[criterion]):
+                expected = formatter(value)
+                expected_min = formatter(magnitudes[f"{criterion}_min"][i]).to(expected.units)
+                assert result[f"{criterion}_unit"][i] == str(expected.units)
+                assert np.isclose(result[criterion][i], expected.magnitude, rtol=1e-12)
+                assert np.isclose(result[f"{criterion}_min"][i], expected_min.magnitude, rtol=1e-12)
+
+    def test_matches_format_impacts_ranges(self):
+        """Should match format_impacts on range values."""
+        mock_range = MagicMock()
+        mock_range.mean = 0.0005
+        mock_range.min = 0.0004
+        mock_range.max = 0.0006
+        mock_impacts = MagicMock()
+        for criterion in ["energy", "gwp", "adpe", "pe", "wcf"]:
+            getattr(mock_impacts, criterion).value = mock_range
+
+        q_impacts, _, _ = format_impacts(mock_impacts)
+        result = format_impacts_batch(
+            {
+                "energy": np.array([0.0005]),
+                "energy_min": np.array([0.0004]),
+                "energy_max": np.array([0.0006]),
+            }
+        )
+
+        assert result["energy_unit"][0] == str(q_impacts.energy.units)
+        assert np.isclose(result["energy_max"][0], q_impacts.energy_max.magnitude)
+
+    def test_only_requested_criteria(self):
+        """Should only return keys for criteria present in the input."""
+        result = format_impacts_batch({"wcf": np.array([0.5, 2.0])})
+
+        assert set(result) == {"wcf", "wcf_unit"}
+        assert result["wcf_unit"].tolist() == ["mL", "L"]
+        np.testing.assert_allclose(result["wcf"], [500.0, 2.0])
+
+
+class TestScaleMagnitude:
+    """Test cases for the pint-free scale_magnitude function."""
+
+    def test_matches_auto_scale(self):
+        """Should pick the same unit and magnitude as auto_scale."""
+        rng = np.random.default_rng(1)
+        for criterion, thresholds in THRESHOLDS.items():
+            unit = DEFAULT_UNITS[criterion]
+            for value in 10 ** rng.uniform(-12, 3, 100):
+                expected = auto_scale(q(value, unit), thresholds)
+                magnitude, scaled_unit = scale_magnitude(criterion, value)
+                assert scaled_unit == str(expected.units)
+                assert np.isclose(magnitude, expected.magnitude, rtol=1e-12)
+
+    def test_returns_plain_floats(self):
+        """Should not build any pint quantity."""
+        magnitude, unit = scale_magnitude("energy", 0.005)
+
+        assert isinstance(magnitude, float)
+        assert unit == "Wh"
+        assert np.isclose(magnitude, 5.0)
+
+    def test_custom_input_unit(self):
+        """Should convert from a custom input unit before applying thresholds."""
+        magnitude, unit = scale_magnitude("adpe", 0.002, "gSbeq")
+
+        assert unit == "mgSbeq"
+        assert np.isclose(magnitude, 2.0)
+
+    def test_keeps_input_unit_above_thresholds(self):
+        """Should keep the input unit when no threshold is crossed, like auto_scale."""
+        assert scale_magnitude("energy", 5000.0, "Wh") == (5000.0, "Wh")
+
+
+def _range_impacts(mean, spread=0.2):
+    value = MagicMock()
+    value.mean = mean
+    value.min = mean * (1 - spread)
+    value.max = mean * (1 + spread)
+    impacts = MagicMock()
+    for criterion in ["energy", "gwp", "adpe", "pe", "wcf"]:
+        getattr(impacts, criterion).value = value
+    return impacts
+
+
+class TestQImpactsTable:
+    """Test cases for the columnar QImpactsTable."""
+
+    def test_row_view_matches_format_impacts(self):
+        """Should expose the same quantities as format_impacts."""
+        expected, _, _ = format_impacts(_range_impacts(0.0005))
+        table = QImpactsTable()
+        table.append(np.full((5, 3), 0.0005) * [1.0, 0.8, 1.2], ranges=True)
+
+        row = table[0]
+
+        assert row.ranges
+        for field in ["energy", "energy_min", "energy_max", "adpe", "wcf_max"]:
+            assert getattr(row, field).units == getattr(expected, field).units
+            assert np.isclose(getattr(row, field).magnitude, getattr(expected, field).magnitude)
+
+    def test_row_without_ranges_has_no_bounds(self):
+        """Should return None for min/max of rows without ranges."""
+        table = QImpactsTable.from_arrays(np.full((1, 5, 3), 2.0), ranges=False)
+
+        assert not table[0].ranges
+        assert table[0].energy_min is None
+        assert table[0].energy == q("2 kWh")
+
+    def test_from_qimpacts_round_trip(self):
+        """Should store QImpacts in default units and give them back."""
+        impacts, _, _ = format_impacts(_range_impacts(0.003))
+
+        row = QImpactsTable.from_qimpacts([impacts])[0].to_qimpacts()
+
+        assert row.ranges
+        assert np.isclose(row.gwp.to("kgCO2eq").magnitude, 0.003)
+        assert np.isclose(row.gwp_max.to("kgCO2eq").magnitude, 0.0036)
+
+    def test_append_grows_capacity(self):
+        """Should grow past its initial capacity and keep previous rows."""
+        table = QImpactsTable(capacity=1)
+        for i in range(10):
+            table.append(np.full((5, 3), float(i)), ranges=bool(i % 2))
+
+        assert len(table) == 10
+        assert table.values.shape == (10, 5, 3)
+        assert table.ranges.tolist() == [bool(i % 2) for i in range(10)]
+        assert table[-1].energy.to("kWh").magnitude == 9.0
+        with pytest.raises(IndexError):
+            table[10]
+
+    @pytest.mark.slow
+    def test_memory_reduction_on_10k_rows(self):
+        """Should use far less memory than a list of QImpacts for 10k rows."""
+        rows = 10_000
+        means = np.linspace(1e-6, 1.0, rows)
+
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        impacts_list = [
+            QImpacts(
+                energy=q(mean, "Wh"),
+                gwp=q(mean, "gCO2eq"),
+                adpe=q(mean, "mgSbeq"),
+                pe=q(mean, "kJ"),
+                wcf=q(mean, "mL"),
+                ranges=True,
+                energy_min=q(mean, "Wh"),
+                energy_max=q(mean, "Wh"),
+                gwp_min=q(mean, "gCO2eq"),
+                gwp_max=q(mean, "gCO2eq"),
+                adpe_min=q(mean, "mgSbeq"),
+                adpe_max=q(mean, "mgSbeq"),
+                pe_min=q(mean, "kJ"),
+                pe_max=q(mean, "kJ"),
+                wcf_min=q(mean, "mL"),
+                wcf_max=q(mean, "mL"),
+            )
+            for mean in means
+        ]
+        list_bytes = tracemalloc.get_traced_memory()[0] - baseline
+
+        baseline = tracemalloc.get_traced_memory()[0]
+        table = QImpactsTable.from_arrays(np.repeat(means, 15).reshape(rows, 5, 3), ranges=True)
+        table_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        assert len(table) == len(impacts_list)
+        assert table_bytes < list_bytes / 10
+
+    def test_total_sums_mean_min_and_max(self):
+        """Should sum every statistic and return a QImpacts with ranges."""
+        values = np.array([np.full((5, 3), 0.2) * [1.0, 0.5, 1.5], np.full((5, 3), 0.3)])
+        table = QImpactsTable.from_arrays(values, ranges=[True, False])
+
+        total = table.total()
+
+        assert total.ranges
+        assert np.isclose(total.energy.to("kWh").magnitude, 0.5)
+        assert np.isclose(total.energy_min.to("kWh").magnitude, 0.4)
+        assert np.isclose(total.energy_max.to("kWh").magnitude, 0.6)
+        assert total.energy_min.units == total.energy.units
+
+    def test_total_of_selected_rows(self):
+        """Should restrict the sum to the given row indices."""
+        table = QImpactsTable.from_arrays(np.arange(3.0)[:, None, None] * np.ones((3, 5, 3)), True)
+
+        assert np.isclose(table.total([0, 2]).wcf.to("L").magnitude, 2.0)
@@ -0,0 +1,103 @@
+"""Tests for src/core/impact_calculator.py."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.config.scenarios import TEXT_SCENARIOS
+from src.core.impact_calculator import (
+    cached_llm_impacts,
+    clear_llm_impacts_cache,
+    clear_scenario_impacts_cache,
+    compute_scenario_impacts,
+    llm_impacts_cache_info,
+    scenario_impacts_cache_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_llm_impacts_cache()
+    yield
+    clear_llm_impacts_cache()
+
+
+class TestCachedLLMImpacts:
+    """Test cases for the memoized llm_impacts wrapper."""
+
+    @patch("src.core.impact_calculator.llm_impacts")
+    def test_same_inputs_call_ecologits_once(self, mock_llm_impacts):
+        """Should only call ecologits once for repeated identical inputs."""
+        for _ in range(5):
+            cached_llm_impacts("openai", "gpt-4o", "FRA", 1000)
+
+        mock_llm_impacts.assert_called_once_with(
+            provider="openai",
+            model_name="gpt-4o",
+            output_token_count=1000,
+            request_latency=float("inf"),
+            electricity_mix_zone="FRA",
+        )
+        info = llm_impacts_cache_info()
+        assert info.hits == 4
+        assert info.misses == 1
+
+    @patch("src.core.impact_calculator.llm_impacts")
+    def test_key_includes_zone_and_tokens(self, mock_llm_impacts):
+        """Should compute separately for each zone and token count."""
+        cached_llm_impacts("openai", "gpt-4o", "FRA", 1000)
+        cached_llm_impacts("openai", "gpt-4o", "USA", 1000)
+        cached_llm_impacts("openai", "gpt-4o", "FRA", 2000)
+
+        assert mock_llm_impacts.call_count == 3
+        assert llm_impacts_cache_info().hits == 0
+
+    def test_matches_uncached_result(self):
+        """Should return the same impacts as a direct ecologits call."""
+        from ecologits.tracers.utils import llm_impacts
+
+        cached = cached_llm_impacts("openai", "gpt-4o", "WOR", 500)
+        direct = llm_impacts(
+            provider="openai",
+            model_name="gpt-4o",
+            output_token_count=500,
+            request_latency=float("inf"),
+            electricity_mix_zone="WOR",
+        )
+
+        assert cached.energy.value == direct.energy.value
+        assert cached.gwp.value == direct.gwp.value
+
+
+class TestScenarioImpactsCache:
+    """Test cases for the compute_scenario_impacts cache."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_scenario_cache(self):
+        clear_scenario_impacts_cache()
+        yield
+        clear_scenario_impacts_cache()
+
+    @patch("src.core.impact_calculator.llm_impacts")
+    def test_same_scenario_computed_once(self, mock_llm_impacts):
+        """Should only call ecologits once for a repeated scenario and model."""
+        for _ in range(3):
+            compute_scenario_impacts(TEXT_SCENARIOS[0], "openai", "gpt-4o")
+        compute_scenario_impacts(TEXT_SCENARIOS[1], "openai", "gpt-4o")
+
+        assert mock_llm_impacts.call_count == 2
+        stats = scenario_impacts_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+    @patch("src.core.impact_calculator.llm_impacts")
+    def test_settings_from_environment(self, mock_llm_impacts, monkeypatch):
+        """Should bound the cache with the configured size and report evictions."""
+        monkeypatch.setenv("ECOLOGITS_CALCULATOR_SCENARIO_CACHE_SIZE", "1")
+        monkeypatch.setenv("ECOLOGITS_CALCULATOR_SCENARIO_CACHE_TTL", "60")
+        clear_scenario_impacts_cache()
+
+        compute_scenario_impacts(TEXT_SCENARIOS[0], "openai", "gpt-4o")
+        compute_scenario_impacts(TEXT_SCENARIOS[1], "openai", "gpt-4o")
+
+        stats = scenario_impacts_cache_stats()
+        assert (stats.maxsize, stats.ttl, stats.evictions) == (1, 60.0, 1)
@@ -0,0 +1,73 @@
+"""Tests for src/core/leaderboard.py."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from src.config.scenarios import TEXT_SCENARIOS, VIDEO_SCENARIOS
+from src.core.coefficients import CRITERIA, STATS, impacts_to_array
+from src.core.impact_calculator import compute_scenario_impacts
+from src.core.leaderboard import compute_leaderboard
+from src.repositories.models import ModelCatalog
+
+_SCENARIO = TEXT_SCENARIOS[0]
+
+
+def _catalog() -> ModelCatalog:
+    return ModelCatalog.from_dataframe(
+        pd.DataFrame(
+            {
+                "provider": ["openai", "anthropic", "mistralai", "openai"],
+                "provider_clean": ["OpenAI", "Anthropic", "MistralAI", "OpenAI"],
+                "name": ["gpt-4o", "claude-sonnet-4-5", "mistral-large-latest", "unknown"],
+                "name_clean": ["Gpt 4o", "Claude sonnet 4 5", "Mistral large latest", "Unknown"],
+            }
+        )
+    )
+
+
+class TestLeaderboard:
+    """Test cases for compute_leaderboard."""
+
+    def test_text_scenario_matches_calculator(self):
+        """Should give each model the impacts the calculator shows for the scenario."""
+        board = compute_leaderboard(_SCENARIO, _catalog())
+
+        assert board.failed == (("OpenAI", "Unknown"),)
+        assert board.models.tolist() == ["Gpt 4o", "Claude sonnet 4 5", "Mistral large latest"]
+        for values, (provider, model) in zip(
+            board.values,
+            [
+                ("openai", "gpt-4o"),
+                ("anthropic", "claude-sonnet-4-5"),
+                ("mistralai", "mistral-large-latest"),
+            ],
+            strict=True,
+        ):
+            impacts = compute_scenario_impacts(
+                scenario=_SCENARIO, provider=provider, model_name=model
+            )
+            np.testing.assert_allclose(values, impacts_to_array(impacts), rtol=1e-6)
+
+    def test_to_frame_sorted_by_energy(self):
+        """Should list models cheapest first, in one unit per column."""
+        table = compute_leaderboard(_SCENARIO, _catalog()).to_frame()
+
+        energy = table.filter(regex=r"^Energy \(").iloc[:, 0]
+        assert energy.is_monotonic_increasing
+        assert {"GWP min", "WCF max"} <= {column.split(" (")[0] for column in table.columns}
+
+    @patch("src.core.leaderboard.compute_scenario_impacts")
+    def test_video_scenario(self, mock_compute):
+        """Should compute video models through compute_scenario_impacts."""
+        impacts = MagicMock(has_errors=False)
+        for criterion in CRITERIA:
+            getattr(impacts, criterion).value = 0.5
+        mock_compute.return_value = impacts
+
+        board = compute_leaderboard(VIDEO_SCENARIOS[0], _catalog())
+
+        assert mock_compute.call_count == 4
+        assert board.values.shape == (4, len(CRITERIA), len(STATS))
+        assert not board.ranges.any()
@@ -0,0 +1,76 @@
+"""Tests for src/core/location_sweep.py."""
+
+import numpy as np
+import pytest
+
+from ecologits.impacts.llm import compute_llm_impacts
+from ecologits.utils.range_value import RangeValue
+
+from src.core.coefficients import impacts_to_array
+from src.core.location_sweep import MIX_FACTORS, sweep_locations, zone_mix_factors
+
+_PUE = 1.3
+_WUE = 0.8
+
+# gwp, adpe, pe, wue of two made-up zones
+_ZONES = np.array(["AAA", "BBB"], dtype=object)
+_MIX_FACTORS = np.array([[0.05, 1e-8, 10.0, 2.0], [0.6, 4e-8, 12.0, 0.5]])
+
+_ACTIVE = RangeValue(min=20e9, max=60e9)
+
+
+def _impacts(mix: np.ndarray, active=_ACTIVE, total=100e9):
+    gwp, adpe, pe, wue = mix
+    return compute_llm_impacts(
+        model_active_parameter_count=active,
+        model_total_parameter_count=total,
+        output_token_count=500,
+        tps=50,
+        ttft=0.5,
+        if_electricity_mix_gwp=gwp,
+        if_electricity_mix_adpe=adpe,
+        if_electricity_mix_pe=pe,
+        if_electricity_mix_wue=wue,
+        datacenter_pue=_PUE,
+        datacenter_wue=_WUE,
+    )
+
+
+class TestSweepLocations:
+    """Test cases for sweep_locations."""
+
+    @pytest.mark.parametrize("active", [_ACTIVE, 40e9])
+    def test_matches_ecologits_in_each_zone(self, active):
+        """Should equal a full ecologits evaluation with each zone's mix."""
+        reference = _impacts(_MIX_FACTORS[0], active=active)
+
+        sweep = sweep_locations(reference, _PUE, _WUE, zones=_ZONES, mix_factors=_MIX_FACTORS)
+
+        assert sweep.values.shape == (2, 5, 3)
+        for i, mix in enumerate(_MIX_FACTORS):
+            expected = impacts_to_array(_impacts(mix, active=active))
+            np.testing.assert_allclose(sweep.values[i], expected, rtol=1e-9)
+
+    def test_to_frame_sorted_and_scaled(self):
+        """Should list zones by increasing impact in a shared display unit."""
+        sweep = sweep_locations(
+            _impacts(_MIX_FACTORS[0]), _PUE, _WUE, zones=_ZONES[::-1], mix_factors=_MIX_FACTORS
+        )
+
+        frame = sweep.to_frame("gwp")
+
+        assert frame["zone"].tolist() == ["BBB", "AAA"]
+        assert frame["unit"].nunique() == 1
+        assert (frame["min"] <= frame["mean"]).all()
+        assert (frame["mean"] <= frame["max"]).all()
+
+    def test_defaults_to_every_ecologits_zone(self):
+        """Should evaluate every zone of the ecologits repository by default."""
+        zones, factors = zone_mix_factors()
+
+        sweep = sweep_locations(_impacts(_MIX_FACTORS[0]), _PUE, _WUE)
+
+        assert factors.shape == (len(zones), len(MIX_FACTORS))
+        assert len(sweep.zones) == len(zones) > 1
+        # Energy does not depend on the location
+        np.testing.assert_allclose(sweep.values[:, 0], sweep.values[:1, 0].repeat(len(zones), 0))
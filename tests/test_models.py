@@ -1,10 +1,19 @@
 """Tests for src/repositories/models.py."""
 
+import time
+
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pytest
 
-from src.repositories.models import PROVIDERS_FORMAT, clean_model_name, load_models
+from src.repositories.models import (
+    PROVIDERS_FORMAT,
+    ModelCatalog,
+    clean_model_name,
+    get_raw_model_names,
+    load_models,
+)
 
 
 class TestCleanModelName:
@@ -166,6 +175,113 @@ class TestLoadModels:
         assert len(result) >= 0  # Just verify it returns a DataFrame
 
 
+class TestModelCatalog:
+    """Test cases for ModelCatalog and get_raw_model_names."""
+
+    @staticmethod
+    def _models_df() -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "provider": ["openai", "openai", "anthropic", "openai"],
+                "provider_clean": ["OpenAI", "OpenAI", "Anthropic", "OpenAI"],
+                "name": ["gpt-4o", "gpt-4", "claude-3-opus", "gpt-4o-2024-05-13"],
+                "name_clean": ["Gpt 4o", "Gpt 4", "Claude 3 opus", "Gpt 4o"],
+            }
+        )
+
+    def test_provider_models_sorted_and_unique(self):
+        """Should index sorted unique cleaned model names by provider."""
+        catalog = ModelCatalog.from_dataframe(self._models_df())
+        assert catalog.provider_models["OpenAI"] == ("Gpt 4", "Gpt 4o")
+        assert catalog.provider_models["Anthropic"] == ("Claude 3 opus",)
+
+    def test_lookup_matches_dataframe_filtering(self):
+        """Should return the same raw names as the DataFrame lookup, first row winning."""
+        df = self._models_df()
+        catalog = ModelCatalog.from_dataframe(df)
+        for key in [("OpenAI", "Gpt 4o"), ("OpenAI", "Gpt 4"), ("Anthropic", "Claude 3 opus")]:
+            assert get_raw_model_names(catalog, *key) == get_raw_model_names(df, *key)
+        assert get_raw_model_names(catalog, "OpenAI", "Gpt 4o") == ("openai", "gpt-4o")
+
+    def test_lookup_missing_returns_none(self):
+        """Should return None for unknown provider/model pairs."""
+        catalog = ModelCatalog.from_dataframe(self._models_df())
+        assert get_raw_model_names(catalog, "Anthropic", "Gpt 4o") is None
+
+    def test_default_indices(self):
+        """Should point default indices at the default provider and model when present."""
+        df = pd.DataFrame(
+            {
+                "provider": ["anthropic", "anthropic", "openai"],
+                "provider_clean": ["Anthropic", "Anthropic", "OpenAI"],
+                "name": ["claude-3-opus", "claude-sonnet-4-6", "gpt-4o"],
+                "name_clean": ["Claude 3 opus", "Claude sonnet 4 6", "Gpt 4o"],
+            }
+        )
+        catalog = ModelCatalog.from_dataframe(df)
+        assert catalog.providers == ("Anthropic", "OpenAI")
+        assert catalog.default_provider_index == 0
+        assert catalog.default_model_indices == {"Anthropic": 1, "OpenAI": 0}
+
+    def test_default_indices_fall_back_to_zero(self):
+        """Should default to the first entry when the defaults are missing."""
+        catalog = ModelCatalog.from_dataframe(self._models_df().iloc[[0, 1]])
+        assert catalog.providers == ("OpenAI",)
+        assert catalog.default_provider_index == 0
+        assert catalog.default_model_indices == {"OpenAI": 0}
+
+    @pytest.mark.integration
+    def test_selector_indexes_match_dataframe_on_full_repository(self):
+        """Should list the same providers and models as filtering the full DataFrame."""
+        df = load_models(filter_main=False)
+        catalog = ModelCatalog.from_dataframe(df)
+
+        assert list(catalog.providers) == sorted(df["provider_clean"].unique())
+        for provider in catalog.providers:
+            expected = sorted(df[df["provider_clean"] == provider]["name_clean"].unique())
+            assert list(catalog.provider_models[provider]) == expected
+
+    @pytest.mark.slow
+    def test_selector_lookup_faster_than_dataframe_on_full_repository(self):
+        """Benchmark: catalog lookups should beat the per-rerun DataFrame scans."""
+        df = load_models(filter_main=False)
+        catalog = ModelCatalog.from_dataframe(df)
+        pairs = list(catalog.raw_names)
+
+        def dataframe_selector():
+            for provider in sorted(df["provider_clean"].unique()):
+                sorted(
+                    x
+                    for x in df["name_clean"].unique()
+                    if x in df[df["provider_clean"] == provider]["name_clean"].unique()
+                )
+
+        def catalog_selector():
+            for provider in catalog.providers:
+                catalog.provider_models.get(provider, ())
+                catalog.default_model_indices.get(provider, 0)
+
+        def best_of(fn, repeat=3):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        assert best_of(catalog_selector) < best_of(dataframe_selector)
+        assert best_of(lambda: [get_raw_model_names(catalog, *p) for p in pairs]) < best_of(
+            lambda: [get_raw_model_names(df, *p) for p in pairs]
+        )
+
+    def test_empty_dataframe(self):
+        """Should build empty indexes from an empty DataFrame."""
+        catalog = ModelCatalog.from_dataframe(pd.DataFrame())
+        assert dict(catalog.raw_names) == {}
+        assert dict(catalog.provider_models) == {}
+        assert catalog.providers == ()
+
+
 class TestProvidersFormat:
     """Test cases for PROVIDERS_FORMAT constant."""
 
@@ -0,0 +1,104 @@
+"""Tests for src/core/scenario_matrix.py."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config.scenarios import TEXT_SCENARIOS
+from src.core.cache import TTLCache
+from src.core.equivalences import EQ_KPIS, EquivalentType
+from src.core.scenario_matrix import ScenarioMatrix, ScenarioResult, compute_scenario_result
+
+_SCENARIO = TEXT_SCENARIOS[0]
+
+
+def _fake_result(scenario, provider, model_name) -> ScenarioResult:
+    if model_name == "broken":
+        raise ValueError("unknown model")
+    return ScenarioResult(impacts=MagicMock(name=model_name), warnings=(), equivalents={})
+
+
+@pytest.fixture
+def mock_compute():
+    with patch(
+        "src.core.scenario_matrix.compute_scenario_result", side_effect=_fake_result
+    ) as mock:
+        yield mock
+
+
+class TestScenarioMatrix:
+    """Test cases for ScenarioMatrix."""
+
+    def test_warm_up_turns_requests_into_lookups(self, mock_compute):
+        """Should compute each pair once during warm-up and serve it afterwards."""
+        matrix = ScenarioMatrix()
+        pairs = [(scenario, "openai", "gpt-4o") for scenario in TEXT_SCENARIOS]
+
+        assert matrix.warm_up(pairs) == len(TEXT_SCENARIOS)
+        for scenario in TEXT_SCENARIOS:
+            matrix.get(scenario, "openai", "gpt-4o")
+
+        stats = matrix.stats()
+        assert mock_compute.call_count == len(TEXT_SCENARIOS)
+        assert (stats.hits, stats.misses) == (len(TEXT_SCENARIOS), len(TEXT_SCENARIOS))
+        assert matrix.warmed_up
+
+    def test_miss_computes_live(self, mock_compute):
+        """Should compute and store pairs requested before the warm-up reaches them."""
+        matrix = ScenarioMatrix()
+
+        first = matrix.get(_SCENARIO, "openai", "gpt-4o")
+        computed = matrix.warm_up([(_SCENARIO, "openai", "gpt-4o")])
+
+        assert computed == 0
+        assert matrix.get(_SCENARIO, "openai", "gpt-4o") is first
+        assert mock_compute.call_count == 1
+
+    def test_bounded_by_cache_size(self, mock_compute):
+        """Should keep at most the cache size, evicting the least recently used."""
+        matrix = ScenarioMatrix(cache=TTLCache(maxsize=2))
+
+        matrix.warm_up([(scenario, "openai", "gpt-4o") for scenario in TEXT_SCENARIOS[:3]])
+
+        assert len(matrix) == 2
+        assert matrix.stats().evictions == 1
+
+    def test_warm_up_skips_failures(self, mock_compute):
+        """Should skip pairs ecologits fails on and raise them live."""
+        matrix = ScenarioMatrix()
+
+        computed = matrix.warm_up([(_SCENARIO, "openai", "broken"), (_SCENARIO, "openai", "ok")])
+
+        assert computed == 1
+        assert len(matrix) == 1
+        with pytest.raises(ValueError, match="unknown model"):
+            matrix.get(_SCENARIO, "openai", "broken")
+
+
+@patch("src.core.scenario_matrix.compute_equivalents")
+@patch("src.core.scenario_matrix.compute_scenario_impacts")
+@patch("src.core.scenario_matrix.format_impacts")
+def test_compute_scenario_result_formats_warnings(mock_format, mock_compute, mock_equivalents):
+    """Should keep the formatted impacts, the warning messages and the equivalents."""
+    mock_format.return_value = ("formatted", None, None)
+    mock_compute.return_value.warnings = [MagicMock(message="Model is deprecated")]
+
+    result = compute_scenario_result(_SCENARIO, "openai", "gpt-4o")
+
+    assert result.impacts == "formatted"
+    assert result.warnings == ("Model is deprecated",)
+    assert result.equivalents is mock_equivalents.return_value
+    mock_equivalents.assert_called_once_with("formatted")
+
+
+def test_compute_scenario_result_precomputes_displayed_equivalents():
+    """Should precompute every equivalent the calculator displays, at scale or not."""
+    result = compute_scenario_result(_SCENARIO, "openai", "gpt-4o")
+
+    displayed = {
+        value
+        for how in ("at_scale", "unit")
+        for value in EQ_KPIS[how].values()
+        if isinstance(value, EquivalentType)
+    }
+    assert set(result.equivalents) == displayed
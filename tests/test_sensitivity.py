@@ -0,0 +1,100 @@
+"""Tests for src/core/sensitivity.py."""
+
+import numpy as np
+import pytest
+
+from ecologits.impacts.llm import compute_llm_impacts
+from ecologits.utils.range_value import RangeValue
+
+from src.core.coefficients import impacts_to_array
+from src.core.sensitivity import compute_llm_impacts_grid, sweep_parameters
+
+_BASE = {
+    "model_active_parameter_count": RangeValue(min=20, max=60),
+    "model_total_parameter_count": RangeValue(min=100, max=400),
+    "output_token_count": 400,
+    "tps": 60.0,
+    "ttft": 0.6,
+    "if_electricity_mix_gwp": 0.5,
+    "if_electricity_mix_adpe": 7e-8,
+    "if_electricity_mix_pe": 9.9,
+    "if_electricity_mix_wue": 1.9,
+    "datacenter_pue": 1.2,
+    "datacenter_wue": 0.6,
+}
+
+
+def _direct(**overrides) -> np.ndarray:
+    return impacts_to_array(compute_llm_impacts(**{**_BASE, **overrides}))
+
+
+class TestComputeLlmImpactsGrid:
+    """Test cases for compute_llm_impacts_grid."""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"model_active_parameter_count": 8, "model_total_parameter_count": 8},
+            {"tps": None, "ttft": None},
+            {"request_latency": 2.0},
+        ],
+    )
+    def test_scalar_matches_ecologits(self, overrides):
+        """Should reproduce compute_llm_impacts for a single set of inputs."""
+        result = compute_llm_impacts_grid(**{**_BASE, **overrides})
+
+        np.testing.assert_allclose(result, _direct(**overrides), rtol=1e-9)
+
+    def test_broadcasts_arrays(self):
+        """Should evaluate every combination of broadcast inputs at once."""
+        pue = np.array([1.1, 1.5, 2.0])
+        totals = np.array([[10.0], [100.0], [700.0]])
+
+        result = compute_llm_impacts_grid(
+            **{**_BASE, "datacenter_pue": pue, "model_total_parameter_count": totals}
+        )
+
+        assert result.shape == (3, 3, 5, 3)
+        for i, total in enumerate(totals[:, 0]):
+            for j, value in enumerate(pue):
+                expected = _direct(datacenter_pue=value, model_total_parameter_count=total)
+                np.testing.assert_allclose(result[i, j], expected, rtol=1e-9)
+
+
+class TestSweepParameters:
+    """Test cases for sweep_parameters."""
+
+    def test_two_parameter_grid(self):
+        """Should lay the first parameter along columns and the second along rows."""
+        sweep = sweep_parameters(
+            _BASE,
+            {
+                "datacenter_pue": np.linspace(1.0, 2.0, 50),
+                "output_token_count": np.linspace(100, 5000, 40),
+            },
+        )
+
+        assert sweep.values.shape == (40, 50, 5, 3)
+        np.testing.assert_allclose(
+            sweep.values[39, 0],
+            _direct(datacenter_pue=1.0, output_token_count=5000),
+            rtol=1e-9,
+        )
+        values, unit = sweep.scaled("gwp")
+        assert values.shape == (40, 50)
+        assert isinstance(unit, str)
+
+    @pytest.mark.parametrize(
+        "axes",
+        [
+            {},
+            {"datacenter_pue": [1.0], "tps": [1.0], "ttft": [1.0]},
+            {"server_power": [1.0, 2.0]},
+            {"datacenter_pue": np.ones(1000)},
+        ],
+    )
+    def test_rejects_invalid_axes(self, axes):
+        """Should reject sweeps the UI cannot chart."""
+        with pytest.raises(ValueError):
+            sweep_parameters(_BASE, axes)